@@ -0,0 +1,69 @@
+"""Benchmark of the multi-process engine scaling from 1 to N worker processes.
+
+Usage:
+    python -m benchmarks.bench_parallel_engine --size 2048 --generations 20
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.engines.numpy_engine import NumpyEngine
+from gameoflifeapi.logic.engines.parallel_engine import ParallelEngine
+
+
+def _measure(engine: AbstractEngine, states: bytes, generations: int) -> float:
+    """Return number of seconds spent on the generations (after one warm-up step)."""
+    engine.load_state_buffer(states)
+    engine.step()
+    started: float = time.perf_counter()
+    for _ in range(generations):
+        engine.step()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """Run benchmark and print results as table and JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=2048, help='number of rows and columns')
+    parser.add_argument('--generations', type=int, default=20, help='number of measured generations')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help='maximal number of workers')
+    parser.add_argument('--output', help='file for JSON results (printed to stdout when omitted)')
+    args = parser.parse_args()
+
+    rnd: random.Random = random.Random(0)
+    states: bytes = bytes(rnd.getrandbits(1) for _ in range(args.size * args.size))
+    results: list[dict] = []
+
+    single: NumpyEngine = NumpyEngine(args.size, args.size)
+    seconds: float = _measure(single, states, args.generations)
+    results.append({'engine': 'numpy', 'workers': 0, 'seconds': seconds})
+
+    for workers in range(1, args.max_workers + 1):
+        engine: ParallelEngine = ParallelEngine(args.size, args.size, workers)
+        try:
+            seconds = _measure(engine, states, args.generations)
+        finally:
+            engine.close()
+        results.append({'engine': 'parallel', 'workers': workers, 'seconds': seconds})
+
+    base: float = results[1]['seconds']
+    print(f'Board {args.size}x{args.size}, {args.generations} generations')
+    print(f'{"engine":>10} {"workers":>8} {"seconds":>10} {"gens/s":>10} {"speedup":>8}')
+    for result in results:
+        result['generations_per_second'] = args.generations / result['seconds']
+        result['speedup'] = base / result['seconds']
+        print(f'{result["engine"]:>10} {result["workers"]:>8} {result["seconds"]:>10.3f} '
+              f'{result["generations_per_second"]:>10.2f} {result["speedup"]:>8.2f}')
+    report: str = json.dumps({'size': args.size, 'generations': args.generations, 'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
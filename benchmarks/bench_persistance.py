@@ -0,0 +1,70 @@
+"""Benchmark of the binary save format against the pickle one.
+
+Usage:
+    python -m benchmarks.bench_persistance --sizes 100 500 1000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from gameoflifeapi.api.abstract_definitions import AbstractPersistance
+from gameoflifeapi.api.persistance import (GameBinaryPersistance,
+                                           GamePicklePersistance)
+from gameoflifeapi.logic.data.dtos import SaveGameDataDto
+from gameoflifeapi.logic.data.field import Field
+
+PERSISTANCES: dict[str, AbstractPersistance] = {
+    'pickle': GamePicklePersistance(),
+    'binary': GameBinaryPersistance(),
+}
+
+
+def _measure(persistance: AbstractPersistance, field: Field, file_name: str) -> dict:
+    """Return save time, load time and file size for the field."""
+    started: float = time.perf_counter()
+    persistance.save_game(file_name, SaveGameDataDto(1, field))
+    saved: float = time.perf_counter()
+    persistance.load_game(file_name)
+    loaded: float = time.perf_counter()
+    return {'save_seconds': saved - started,
+            'load_seconds': loaded - saved,
+            'file_bytes': os.path.getsize(file_name)}
+
+
+def main() -> None:
+    """Run benchmark and print results as table and JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000],
+                        help='number of rows and columns of the fields')
+    parser.add_argument('--density', type=float, default=0.5, help='part of the ALIVE cells')
+    parser.add_argument('--output', help='file for JSON results (printed to stdout when omitted)')
+    args = parser.parse_args()
+
+    rnd: random.Random = random.Random(0)
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            field: Field = Field(size, size)
+            field.apply_buffers(bytes(rnd.random() < args.density for _ in range(size * size)),
+                                bytes(size * size))
+            for name, persistance in PERSISTANCES.items():
+                result: dict = _measure(persistance, field, os.path.join(directory, f'{name}.save'))
+                results.append({'format': name, 'size': size, **result})
+
+    print(f'{"format":>8} {"size":>6} {"save s":>10} {"load s":>10} {"bytes":>12}')
+    for result in results:
+        print(f'{result["format"]:>8} {result["size"]:>6} {result["save_seconds"]:>10.4f} '
+              f'{result["load_seconds"]:>10.4f} {result["file_bytes"]:>12}')
+    report: str = json.dumps({'density': args.density, 'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+"""Benchmark suite of the game operations.
+
+Measures GameFlowProcess.create_next_generation, switch_cell_state and
+randomize_next_generation for every engine, Field construction, pickle
+save/load and console rendering over board sizes and densities of ALIVE
+cells. Results are saved as JSON, two result files can be compared to
+find regressions (exit code is 1 when any operation became slower than
+the threshold allows).
+
+Usage:
+    python -m benchmarks.suite run --sizes 10 100 1000 --output current.json
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.2
+
+Cases of the dense Field (construction, pickle and rendering) and the
+object engine are skipped for boards larger than --max-object-size,
+because the object engine evaluates cells one by one in Python.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from gameoflifeapi.api.persistance import GamePicklePersistance
+from gameoflifeapi.app import render_game_state
+from gameoflifeapi.logic.data.dtos import SaveGameDataDto
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.sparse_field import (SparseField,
+                                                   live_cells_from_buffer)
+from gameoflifeapi.logic.engines.engine_factory import is_engine_available
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+from gameoflifeapi.logic.random_states import random_states
+
+RESULTS_VERSION: int = 1
+MIN_MEASURE_SECONDS: float = 0.2
+MAX_REPEAT: int = 100
+SWITCHED_CELLS: int = 1000
+GENERATIONS: int = 5
+
+
+def time_operation(operation: Callable[[], None], setup: Callable[[], None] = None) -> tuple[float, int]:
+    """Measure the best time of the operation.
+
+    Operation is repeated until MIN_MEASURE_SECONDS passed or MAX_REPEAT reached,
+    setup is called before every repeat and is not measured.
+
+    Args:
+        operation (Callable[[], None]): measured operation
+        setup (Callable[[], None], optional): preparation of the operation
+
+    Returns:
+        tuple[float, int]: best number of seconds and number of repeats
+    """
+    best: float = float('inf')
+    total: float = 0
+    repeat: int = 0
+    while repeat < MAX_REPEAT and (repeat == 0 or total < MIN_MEASURE_SECONDS):
+        if setup is not None:
+            setup()
+        started: float = time.perf_counter()
+        operation()
+        seconds: float = time.perf_counter() - started
+        best = min(best, seconds)
+        total += seconds
+        repeat += 1
+    return best, repeat
+
+
+def _dense_field(size: int, states: bytes) -> Field:
+    """Return dense Field with the states and their numbers of ALIVE neighbours."""
+    return _create_game(size, states, EngineType.OBJECT).game_field
+
+
+def _create_game(size: int, states: bytes, engine_type: EngineType) -> GameFlowProcess:
+    field: SparseField = SparseField(size, size, live_cells_from_buffer(states, size))
+    return GameFlowProcess(game_field=field, engine_type=engine_type)
+
+
+class _Case:
+    """Measured operation repeated number of times in one sample."""
+
+    def __init__(self, operation: Callable[[], None], operations: int = 1,
+                 setup: Callable[[], None] = None) -> None:
+        self.operation: Callable[[], None] = operation
+        self.operations: int = operations
+        self.setup: Callable[[], None] = setup
+
+
+def _engine_cases(size: int, states: bytes, engine_type: EngineType) -> dict[str, _Case]:
+    """Return operations of GameFlowProcess created on the engine from the same states.
+
+    Every sample starts with a new game, so generations are measured on the
+    random board instead of the settled one.
+    """
+    games: list[GameFlowProcess] = []
+    rnd: random.Random = random.Random(size)
+    cells: list[tuple[int, int]] = [(rnd.randrange(size), rnd.randrange(size)) for _ in range(SWITCHED_CELLS)]
+
+    def new_game() -> None:
+        for game in games:
+            game.close()
+        games[:] = [_create_game(size, states, engine_type)]
+
+    def create_next_generation() -> None:
+        for _ in range(GENERATIONS):
+            games[0].create_next_generation()
+
+    def switch_cell_state() -> None:
+        for row, column in cells:
+            games[0].switch_cell_state(row, column)
+
+    def randomize_next_generation() -> None:
+        games[0].randomize_next_generation()
+
+    return {
+        'create_next_generation': _Case(create_next_generation, GENERATIONS, new_game),
+        'switch_cell_state': _Case(switch_cell_state, SWITCHED_CELLS, new_game),
+        'randomize_next_generation': _Case(randomize_next_generation, 1, new_game),
+    }
+
+
+def _object_cases(size: int, states: bytes, directory: str) -> dict[str, _Case]:
+    """Return operations on the dense Field."""
+    field: Field = _dense_field(size, states)
+    persistance: GamePicklePersistance = GamePicklePersistance()
+    file_name: str = os.path.join(directory, f'{size}.gsave')
+    persistance.save_game(file_name, SaveGameDataDto(0, field))
+
+    def field_construction() -> None:
+        Field(size, size)
+
+    def pickle_save() -> None:
+        persistance.save_game(file_name, SaveGameDataDto(0, field))
+
+    def pickle_load() -> None:
+        persistance.load_game(file_name)
+
+    def console_render() -> None:
+        render_game_state(field)
+
+    return {
+        'field_construction': _Case(field_construction),
+        'pickle_save': _Case(pickle_save),
+        'pickle_load': _Case(pickle_load),
+        'console_render': _Case(console_render),
+    }
+
+
+def run_suite(sizes: list[int], densities: list[float], engines: list[EngineType],
+              max_object_size: int) -> list[dict]:
+    """Run all the cases and return list of results."""
+    results: list[dict] = []
+
+    def measure(name: str, engine: str, size: int, density: float, case: _Case) -> None:
+        seconds, repeat = time_operation(case.operation, case.setup)
+        seconds /= case.operations
+        results.append({'case': name, 'engine': engine, 'size': size, 'density': density,
+                        'seconds': seconds, 'repeat': repeat, 'operations': case.operations})
+        print(f'{name:>26} {engine:>9} {size:>6} {density:>8.2f} {seconds:>12.3e}', file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for density in densities:
+                states: bytes = random_states(size * size, 0, density)
+                if size <= max_object_size:
+                    for name, case in _object_cases(size, states, directory).items():
+                        measure(name, '-', size, density, case)
+                for engine_type in engines:
+                    if engine_type is EngineType.OBJECT and size > max_object_size:
+                        continue
+                    for name, case in _engine_cases(size, states, engine_type).items():
+                        measure(name, engine_type.value, size, density, case)
+    return results
+
+
+def compare_results(baseline: list[dict], current: list[dict], threshold: float) -> list[dict]:
+    """Compare results of two runs.
+
+    Args:
+        baseline (list[dict]): results of the reference run
+        current (list[dict]): results of the checked run
+        threshold (float): allowed slowdown, 0.2 means 20%
+
+    Returns:
+        list[dict]: comparison of the cases measured in both runs
+    """
+    def key(result: dict) -> tuple:
+        return result['case'], result['engine'], result['size'], result['density']
+
+    baseline_by_key: dict[tuple, dict] = {key(result): result for result in baseline}
+    comparison: list[dict] = []
+    for result in current:
+        reference: dict = baseline_by_key.get(key(result))
+        if reference is None:
+            continue
+        ratio: float = result['seconds'] / reference['seconds'] if reference['seconds'] else 1.0
+        comparison.append({'case': result['case'], 'engine': result['engine'], 'size': result['size'],
+                           'density': result['density'], 'baseline_seconds': reference['seconds'],
+                           'current_seconds': result['seconds'], 'ratio': ratio,
+                           'is_regression': ratio > 1 + threshold})
+    return comparison
+
+
+def _load_results(file_name: str) -> list[dict]:
+    with open(file_name, 'r', encoding='utf-8') as file:
+        return json.load(file)['results']
+
+
+def _command_run(args: argparse.Namespace) -> int:
+    engines: list[EngineType] = [EngineType(engine) for engine in args.engines]
+    results: list[dict] = run_suite(args.sizes, args.densities, engines, args.max_object_size)
+    report: str = json.dumps({'version': RESULTS_VERSION,
+                              'python': platform.python_version(),
+                              'machine': platform.machine(),
+                              'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(report)
+    else:
+        print(report)
+    return 0
+
+
+def _command_compare(args: argparse.Namespace) -> int:
+    comparison: list[dict] = compare_results(_load_results(args.baseline), _load_results(args.current),
+                                             args.threshold)
+    print(f'{"case":>26} {"engine":>9} {"size":>6} {"density":>8} {"baseline s":>12} {"current s":>12} '
+          f'{"ratio":>7}')
+    for result in comparison:
+        flag: str = '  REGRESSION' if result['is_regression'] else ''
+        print(f'{result["case"]:>26} {result["engine"]:>9} {result["size"]:>6} {result["density"]:>8.2f} '
+              f'{result["baseline_seconds"]:>12.3e} {result["current_seconds"]:>12.3e} '
+              f'{result["ratio"]:>7.2f}{flag}')
+    regressions: int = sum(result['is_regression'] for result in comparison)
+    print(f'{regressions} regression(s) of {len(comparison)} compared case(s)')
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] = None) -> int:
+    """Run or compare benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000],
+                            help='number of rows and columns of the boards (10 to 4096)')
+    run_parser.add_argument('--densities', type=float, nargs='+', default=[0.1, 0.5],
+                            help='part of the ALIVE cells')
+    run_parser.add_argument('--engines', nargs='+',
+                            default=[engine.value for engine in (EngineType.OBJECT, EngineType.NUMPY)
+                                     if is_engine_available(engine)],
+                            choices=[engine.value for engine in EngineType], help='measured engines')
+    run_parser.add_argument('--max-object-size', type=int, default=1024,
+                            help='maximal board size of the dense Field and object engine cases')
+    run_parser.add_argument('--output', help='file for JSON results (printed to stdout when omitted)')
+    run_parser.set_defaults(handler=_command_run)
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline', help='results of the reference run')
+    compare_parser.add_argument('current', help='results of the checked run')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='allowed slowdown before the case is flagged (default: 0.2)')
+    compare_parser.set_defaults(handler=_command_compare)
+
+    args: argparse.Namespace = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,10 @@
 """Definition of the abstract classes."""
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from gameoflifeapi.logic.data.dtos import (GameStateDto, LoadGameDataDto,
                                            NewGameDataDto, SaveGameDataDto)
+from gameoflifeapi.logic.data.state import CellState
 from gameoflifeapi.logic.game_flow_process import GameFlowProcess
 
 
@@ -54,7 +56,7 @@ class AbstractController(ABC):
             int: value
         """
         if self._game_flow is not None:
-            return self._game_flow.game_field.rows
+            return self._game_flow.rows
         return 0
 
     @property
@@ -65,7 +67,18 @@ class AbstractController(ABC):
             int: value
         """
         if self._game_flow is not None:
-            return self._game_flow.game_field.columns
+            return self._game_flow.columns
+        return 0
+
+    @property
+    def generation(self) -> int:
+        """Return number of the current generation.
+
+        Returns:
+            int: value
+        """
+        if self._game_flow is not None:
+            return self._game_flow.generation
         return 0
 
     @property
@@ -77,9 +90,31 @@ class AbstractController(ABC):
         """
         state: GameStateDto = GameStateDto(
             game_field=self._game_flow.game_field,
-            generation=self._game_flow.generation)
+            generation=self._game_flow.generation,
+            states=self._game_flow.state_snapshot())
         return state
 
+    @property
+    def changed_cells(self) -> frozenset[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last generation.
+
+        Returns:
+            frozenset[tuple[int, int]]: coordinates, or None if changes are unknown
+        """
+        if self._game_flow is not None:
+            return self._game_flow.changed_cells
+        return None
+
+    def state_buffer(self) -> bytes:
+        """Return cell states of the current generation.
+
+        Returns:
+            bytes: row-major cell states, 1 for alive cell and 0 for dead one
+        """
+        if self._game_flow is not None:
+            return self._game_flow.state_buffer()
+        return bytes()
+
     @abstractmethod
     def start_new_game(self, new_game_data: NewGameDataDto) -> None:
         pass
@@ -96,10 +131,26 @@ class AbstractController(ABC):
     def trigger_cell(self, row_number: int, column_numbed: int) -> None:
         pass
 
+    @abstractmethod
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], state: CellState) -> None:
+        pass
+
     @abstractmethod
     def increment_generation(self) -> None:
         pass
 
     @abstractmethod
-    def randomize_cells_state(self) -> None:
+    def advance(self, generations: int) -> None:
+        pass
+
+    @abstractmethod
+    def step_back(self) -> None:
+        pass
+
+    @abstractmethod
+    def goto(self, generation: int) -> None:
+        pass
+
+    @abstractmethod
+    def randomize_cells_state(self, seed: int = None, density: float = None) -> None:
         pass
@@ -1,32 +1,202 @@
 """Definition of the main controller of the game."""
+import functools
 import logging
-from typing import Callable
+import threading
+import time
+from typing import Callable, Iterable
 
 from gameoflifeapi.api.abstract_definitions import (AbstractController,
                                                     AbstractPersistance)
-from gameoflifeapi.logic.data.dtos import (LoadGameDataDto, NewGameDataDto,
+from gameoflifeapi.logic.cycle_detection import Cycle
+from gameoflifeapi.logic.data.dtos import (GameSnapshotDto, GameStateDto,
+                                           LoadGameDataDto, NewGameDataDto,
                                            SaveGameDataDto)
 from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.engines.engine_type import EngineType
 from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+from gameoflifeapi.logic.history import GenerationHistory
+from gameoflifeapi.logic.instrumentation import (PHASE_PERSISTENCE,
+                                                 GenerationStats,
+                                                 Instrumentation)
+from gameoflifeapi.logic.random_states import DEFAULT_DENSITY
+from gameoflifeapi.logic.rules import CONWAY_RULE, parse_rule
+from gameoflifeapi.logic.topology import Topology
 
 log: logging.Logger = logging.getLogger(__name__)
 
 
+def _synchronized(method: Callable) -> Callable:
+    """Run the controller method holding the lock of the controller."""
+    @functools.wraps(method)
+    def wrapper(self: 'GameLifeController', *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class GameLifeController(AbstractController):
-    """Main Controller of the game."""
+    """Main Controller of the game.
+
+    Methods which change the game and snapshot are serialized by the lock
+    of the controller, so generations can be created by a worker thread
+    while other thread edits cells. on_generation_created is called on the
+    thread which changed the game, snapshot passes the generation to other
+    threads.
+    """
 
     def __init__(self, persistance: AbstractPersistance,
-                 on_generation_created: Callable[[], None]) -> None:
+                 on_generation_created: Callable[[], None],
+                 engine_type: EngineType = EngineType.OBJECT,
+                 workers: int = None,
+                 instrumentation: Instrumentation = None,
+                 rule: str = None,
+                 topology: Topology = Topology.BOUNDED,
+                 history_budget: int = 0,
+                 detect_cycles: bool = False) -> None:
         """Initialize Controller.
 
         Args:
             persistance (AbstractPersistance): Persistance used for
                                                 saving/loadind game
+            engine_type (EngineType, optional): Engine used for new and loaded
+                                                games. Defaults to EngineType.OBJECT.
+            workers (int, optional): Number of worker processes of the parallel
+                                     engine. Defaults to number of CPUs.
+            instrumentation (Instrumentation, optional): Collector of the statistics
+                                                         shared by all games.
+                                                         Defaults to disabled one.
+            rule (str, optional): Rulestring of the new games and of the loaded
+                                  games without stored rule. Defaults to B3/S23.
+            topology (Topology, optional): Topology of the new games and of the loaded
+                                           games without stored topology.
+                                           Defaults to Topology.BOUNDED.
+            history_budget (int, optional): Number of bytes used by the history of the
+                                            recent generations of every game, 0 to keep
+                                            no history, for example DEFAULT_MEMORY_BUDGET.
+                                            Defaults to 0.
+            detect_cycles (bool, optional): True to detect still lifes and oscillators
+                                            in every game. Defaults to False.
         """
         AbstractController.__init__(self, persistance)
         self._on_generation_created = on_generation_created
+        self._engine_type: EngineType = engine_type
+        self._workers: int = workers
+        self._instrumentation: Instrumentation = instrumentation or Instrumentation()
+        self._rule: str = rule
+        self._topology: Topology = topology
+        self._history_budget: int = history_budget
+        self._detect_cycles: bool = detect_cycles
+        # seed and density of the random first generation of the current game
+        self._seed: int = None
+        self._density: float = None
+        self._lock: threading.RLock = threading.RLock()
+        self._snapshot_sequence: int = 0
         log.debug('__init__')
 
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Return collector of the generation and persistence statistics.
+
+        Returns:
+            Instrumentation: instrumentation shared by all games of the controller
+        """
+        return self._instrumentation
+
+    @property
+    def rule(self) -> str:
+        """Return rulestring of the current game.
+
+        Returns:
+            str: canonical rulestring, for example 'B3/S23'
+        """
+        if self._game_flow is not None:
+            return self._game_flow.rule.rulestring
+        return parse_rule(self._rule).rulestring if self._rule else CONWAY_RULE.rulestring
+
+    @property
+    def topology(self) -> Topology:
+        """Return topology of the current game.
+
+        Returns:
+            Topology: topology of the field
+        """
+        if self._game_flow is not None:
+            return self._game_flow.topology
+        return self._topology
+
+    @property
+    def seed(self) -> int:
+        """Return seed of the random first generation of the current game.
+
+        Returns:
+            int: seed, None if the game was not randomized
+        """
+        return self._seed
+
+    @property
+    def density(self) -> float:
+        """Return density of the random first generation of the current game.
+
+        Returns:
+            float: probability of the cell to be ALIVE, None if the game was not randomized
+        """
+        return self._density
+
+    @property
+    @_synchronized
+    def game_state(self) -> GameStateDto:
+        """Return state of the current generation created holding the lock.
+
+        Returns:
+            GameStateDto: states of the DTO match its generation
+        """
+        return super().game_state
+
+    @property
+    def snapshot_sequence(self) -> int:
+        """Return sequence number of the last created snapshot.
+
+        Returns:
+            int: number, snapshots with lower numbers are outdated
+        """
+        return self._snapshot_sequence
+
+    @property
+    def can_step_back(self) -> bool:
+        """Return True if the history of the current game has older generation.
+
+        Returns:
+            bool: True if step_back can be called
+        """
+        with self._lock:
+            if self._game_flow is None or self._game_flow.history is None:
+                return False
+            return self._game_flow.history.previous(self._game_flow.generation) is not None
+
+    @property
+    def cycle(self) -> Cycle:
+        """Return still life or oscillator the current game entered.
+
+        Returns:
+            Cycle: detected cycle, None if it is not detected yet or detection is disabled
+        """
+        if self._game_flow is None:
+            return None
+        return self._game_flow.cycle
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        """Return position of the initial field in the grown field of the current game.
+
+        Returns:
+            tuple[int, int]: (row, column), (0, 0) until the infinite field grows
+        """
+        if self._game_flow is not None:
+            return self._game_flow.origin
+        return 0, 0
+
+    @_synchronized
     def start_new_game(self, new_game_data: NewGameDataDto) -> None:
         """Start new game.
 
@@ -34,18 +204,39 @@ class GameLifeController(AbstractController):
             new_game_data (NewGameDataDto): New Game Data
         """
         log.debug('start_new_game')
+        if new_game_data.engine_type is not None:
+            self._engine_type = new_game_data.engine_type
+        if new_game_data.rule is not None:
+            self._rule = new_game_data.rule
+        if new_game_data.topology is not None:
+            self._topology = new_game_data.topology
+        self._close_game_flow()
         self._game_flow = GameFlowProcess(
             rows=new_game_data.number_of_rows,
             columns=new_game_data.number_of_columns,
-            on_generation_created=self._on_generation_created
+            on_generation_created=self._on_generation_created,
+            engine_type=self._engine_type,
+            workers=self._workers,
+            instrumentation=self._instrumentation,
+            rule=self._rule,
+            topology=self._topology,
+            history=self._create_history(),
+            detect_cycles=self._detect_cycles
         )
+        self._seed = None
+        self._density = None
         if new_game_data.is_random_first_generation:
-            self._game_flow.randomize_next_generation()
-        log.debug('start_new_game: Created game, rows=%d, cols=%d, rand=%s',
+            self.randomize_cells_state(new_game_data.seed, new_game_data.density)
+        log.debug('start_new_game: Created game, rows=%d, cols=%d, rand=%s, seed=%s, engine=%s, rule=%s, topology=%s',
                   self.rows,
                   self.columns,
-                  new_game_data.is_random_first_generation)
+                  new_game_data.is_random_first_generation,
+                  self._seed,
+                  self._engine_type,
+                  self.rule,
+                  self._topology)
 
+    @_synchronized
     def load_game(self, save_file_name: str) -> None:
         """Load saved game.
 
@@ -53,24 +244,38 @@ class GameLifeController(AbstractController):
             save_file_name (str): save game file name
         """
         log.debug('load_saved_game')
+        started: float = time.perf_counter()
         game_data: LoadGameDataDto = self._persistance.load_game(
             save_file_name)
+        if self._instrumentation.enabled:
+            self._record_persistence(game_data.generation, started)
         game_field: Field = game_data.game_field
         generation: int = game_data.generation
 
+        self._close_game_flow()
         self._game_flow = GameFlowProcess(
             game_field=game_field,
             generation=generation,
             rows=game_field.rows,
             columns=game_field.columns,
-            on_generation_created=self._on_generation_created
+            on_generation_created=self._on_generation_created,
+            engine_type=self._engine_type,
+            workers=self._workers,
+            instrumentation=self._instrumentation,
+            rule=game_data.rule or self._rule,
+            topology=game_data.topology or self._topology,
+            history=self._create_history(),
+            detect_cycles=self._detect_cycles
         )
+        self._seed = game_data.seed
+        self._density = game_data.density
         self._on_generation_created()
         log.debug('load_saved_game: Loaded game, rows=%d, cols=%d, gen=%d',
                   self.rows,
                   self.columns,
                   self._game_flow.generation)
 
+    @_synchronized
     def save_game(self, save_file_name: str) -> None:
         """Save game.
 
@@ -81,14 +286,22 @@ class GameLifeController(AbstractController):
         log.debug('Save File Name = %s', save_file_name)
         save_game_data: SaveGameDataDto = SaveGameDataDto(
             game_field=self._game_flow.game_field,
-            generation=self._game_flow.generation
+            generation=self._game_flow.generation,
+            rule=self._game_flow.rule.rulestring,
+            topology=self._game_flow.topology,
+            seed=self._seed,
+            density=self._density
         )
+        started: float = time.perf_counter()
         self._persistance.save_game(save_file_name, save_game_data)
+        if self._instrumentation.enabled:
+            self._record_persistence(save_game_data.generation, started)
         log.debug('save_game: Saved game, rows=%d, cols=%d, gen=%d',
                   self.rows,
                   self.columns,
                   self._game_flow.generation)
 
+    @_synchronized
     def trigger_cell(self, row_number: int, column_numbed: int) -> None:
         """Change state of the cells in field.
 
@@ -99,12 +312,100 @@ class GameLifeController(AbstractController):
         log.debug('trigger_cell')
         self._game_flow.switch_cell_state(row_number, column_numbed)
 
+    @_synchronized
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], state: CellState) -> None:
+        """Set state of number of cells at once, used by painting.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): coordinates of cells
+            state (CellState): new state of the cells
+        """
+        log.debug('set_cells')
+        self._game_flow.set_cells(coordinates, state)
+
+    @_synchronized
     def increment_generation(self) -> None:
         """Generate new generation."""
         log.debug('increment_generation')
         self._game_flow.create_next_generation()
 
-    def randomize_cells_state(self) -> None:
-        """Set cells state by random values."""
+    @_synchronized
+    def snapshot(self) -> GameSnapshotDto:
+        """Return immutable copy of the current generation.
+
+        Returns:
+            GameSnapshotDto: snapshot of the current game
+        """
+        self._snapshot_sequence += 1
+        game_flow: GameFlowProcess = self._game_flow
+        return GameSnapshotDto(self._snapshot_sequence,
+                               game_flow.generation,
+                               game_flow.rows,
+                               game_flow.columns,
+                               game_flow.origin,
+                               game_flow.state_buffer(),
+                               game_flow.cycle)
+
+    def _record_persistence(self, generation: int, started: float) -> None:
+        """Record time of the save or load started at passed moment."""
+        seconds: float = time.perf_counter() - started
+        self._instrumentation.record(GenerationStats(generation, {PHASE_PERSISTENCE: seconds}))
+
+    def _create_history(self) -> GenerationHistory:
+        """Create history of the new game, None if history is disabled."""
+        return GenerationHistory(self._history_budget) if self._history_budget else None
+
+    def _close_game_flow(self) -> None:
+        """Release resources of the current game."""
+        if self._game_flow is not None:
+            self._game_flow.close()
+
+    @_synchronized
+    def advance(self, generations: int) -> None:
+        """Jump number of generations ahead by the fastest suitable engine.
+
+        Args:
+            generations (int): number of generations
+        """
+        log.debug('advance: generations=%d', generations)
+        self._game_flow.advance(generations)
+
+    @_synchronized
+    def step_back(self) -> None:
+        """Restore the previous generation from the history.
+
+        Raises:
+            GenerationValueException: On the game without older generations in the history
+        """
+        log.debug('step_back')
+        self._game_flow.step_back()
+
+    @_synchronized
+    def goto(self, generation: int) -> None:
+        """Restore the generation from the history.
+
+        Args:
+            generation (int): Number of generation
+
+        Raises:
+            GenerationValueException: On generation which is not in the history
+        """
+        log.debug('goto: generation=%d', generation)
+        self._game_flow.goto(generation)
+
+    @_synchronized
+    def randomize_cells_state(self, seed: int = None, density: float = None) -> None:
+        """Set cells state by random values.
+
+        Args:
+            seed (int, optional): seed of the random cells, None to create new one
+            density (float, optional): probability of the cell to be ALIVE,
+                                       None to use DEFAULT_DENSITY
+
+        Raises:
+            DensityValueException: On density out of 0..1
+        """
         log.debug('make_random_cell_states')
-        self._game_flow.randomize_next_generation()
+        self._game_flow.randomize_next_generation(seed, DEFAULT_DENSITY if density is None else density)
+        self._seed = self._game_flow.seed
+        self._density = self._game_flow.density
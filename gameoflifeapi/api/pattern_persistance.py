@@ -0,0 +1,308 @@
+"""Module contains persistance of the patterns in RLE and plaintext formats.
+
+Both formats are read and written line by line, so big pattern files are
+never kept in memory as a whole string. Loaded fields keep only ALIVE
+cells and are at least of the minimal field size, the pattern is placed
+to the top left corner.
+"""
+import logging
+import re
+from typing import Iterable, TextIO
+
+from gameoflifeapi.api.abstract_definitions import AbstractPersistance
+from gameoflifeapi.logic.data.dtos import LoadGameDataDto, SaveGameDataDto
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.sparse_field import SparseField
+from gameoflifeapi.logic.exceptions import (RuleStringException,
+                                            SaveFileFormatException)
+from gameoflifeapi.logic.rules import CONWAY_RULE, parse_rule
+from gameoflifeapi.logic.topology import Topology
+
+log: logging.Logger = logging.getLogger(__name__)
+
+MIN_FIELD_SIZE: int = 10
+RLE_LINE_LENGTH: int = 70
+
+_GENERATION_COMMENT: re.Pattern = re.compile(r'^\s*generation\s*[:=]?\s*(\d+)\s*$', re.IGNORECASE)
+_RULE_COMMENT: re.Pattern = re.compile(r'^\s*rule\s*[:=]?\s*(\S+)\s*$', re.IGNORECASE)
+_TOPOLOGY_COMMENT: re.Pattern = re.compile(r'^\s*topology\s*[:=]?\s*(\S+)\s*$', re.IGNORECASE)
+_SEED_COMMENT: re.Pattern = re.compile(r'^\s*seed\s*[:=]?\s*(-?\d+)(?:\s+density\s*[:=]?\s*(\d*\.?\d+))?\s*$',
+                                       re.IGNORECASE)
+_RLE_HEADER: re.Pattern = re.compile(r'^\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)\s*(?:,\s*rule\s*=\s*(\S+))?\s*$')
+_RLE_TOKEN: re.Pattern = re.compile(r'\d+|[^\d\s]')
+_STATES_RUN: re.Pattern = re.compile(rb'\x00+|\x01+')
+
+
+def _parse_generation(comment: str) -> int:
+    """Return generation stored in the comment line or None."""
+    match: re.Match = _GENERATION_COMMENT.match(comment)
+    return int(match.group(1)) if match else None
+
+
+def _parse_rule_comment(comment: str) -> str:
+    """Return canonical rulestring stored in the comment line or None."""
+    match: re.Match = _RULE_COMMENT.match(comment)
+    return _canonical_rule(match.group(1)) if match else None
+
+
+def _parse_topology(comment: str) -> Topology:
+    """Return topology stored in the comment line or None.
+
+    Raises:
+        SaveFileFormatException: On unknown topology
+    """
+    match: re.Match = _TOPOLOGY_COMMENT.match(comment)
+    if match is None:
+        return None
+    try:
+        return Topology(match.group(1).lower())
+    except ValueError as err:
+        raise SaveFileFormatException(f'Unsupported topology: {match.group(1)}') from err
+
+
+def _parse_seed(comment: str) -> tuple[int, float]:
+    """Return seed and density of the random first generation stored in the comment line or None."""
+    match: re.Match = _SEED_COMMENT.match(comment)
+    if match is None:
+        return None
+    return int(match.group(1)), float(match.group(2)) if match.group(2) else None
+
+
+def _seed_comment(save_game_data: SaveGameDataDto) -> str:
+    """Return comment line with seed and density of the saved game, None if the seed is unknown."""
+    if save_game_data.seed is None:
+        return None
+    if save_game_data.density is None:
+        return f'seed {save_game_data.seed}'
+    return f'seed {save_game_data.seed} density {save_game_data.density}'
+
+
+def _topology(save_game_data: SaveGameDataDto) -> Topology:
+    """Return topology of the saved game, BOUNDED if it is unknown."""
+    return save_game_data.topology or Topology.BOUNDED
+
+
+def _canonical_rule(rulestring: str) -> str:
+    """Return canonical form of the rulestring read from the file.
+
+    Raises:
+        SaveFileFormatException: On incorrect rulestring
+    """
+    try:
+        return parse_rule(rulestring).rulestring
+    except RuleStringException as err:
+        raise SaveFileFormatException(f'Unsupported rule: {rulestring}') from err
+
+
+def _rulestring(save_game_data: SaveGameDataDto) -> str:
+    """Return canonical rulestring of the saved game, B3/S23 if it is unknown."""
+    return parse_rule(save_game_data.rule).rulestring if save_game_data.rule else CONWAY_RULE.rulestring
+
+
+def _create_field(rows: int, columns: int, live_cells: set[tuple[int, int]]) -> SparseField:
+    """Create field which fits pattern and minimal field size."""
+    return SparseField(max(rows, MIN_FIELD_SIZE), max(columns, MIN_FIELD_SIZE), live_cells)
+
+
+def _iter_rows(field: Field) -> Iterable[bytes]:
+    """Yield row-major states of the field row by row."""
+    states: bytearray = field.state_buffer()
+    columns: int = field.columns
+    for start in range(0, len(states), columns):
+        yield bytes(states[start:start + columns])
+
+
+class GameRlePersistance(AbstractPersistance):
+    """Represent Run Length Encoded (RLE) pattern format.
+
+    Generation is kept in the '#C generation N' comment line, patterns
+    created by other tools are loaded as generation 0. Topology is kept in
+    the '#C topology torus' comment line, seed and density of the random
+    first generation in the '#C seed 42 density 0.5' comment line. Rule is
+    kept in the header line, any Life-like rule in B/S or S/B notation is
+    accepted.
+    """
+
+    def save_game(self, file_name: str,
+                  save_game_data: SaveGameDataDto) -> None:
+        """Save the game.
+
+        Args:
+            file_name (str): Name of the file where game will be saved
+            save_game_data (SaveGameDataDto): Instance data of the game
+        """
+        log.debug('save_game: Game will be saved, file=%s', file_name)
+        field: Field = save_game_data.game_field
+        with open(f'{file_name}', 'w', encoding='ascii') as file:
+            file.write(f'#C generation {save_game_data.generation}\n')
+            file.write(f'#C topology {_topology(save_game_data).value}\n')
+            seed_comment: str = _seed_comment(save_game_data)
+            if seed_comment is not None:
+                file.write(f'#C {seed_comment}\n')
+            file.write(f'x = {field.columns}, y = {field.rows}, rule = {_rulestring(save_game_data)}\n')
+            self._write_body(file, _iter_rows(field))
+        log.debug('save_game: file dumped to file: %s', file_name)
+
+    def _write_body(self, file: TextIO, rows: Iterable[bytes]) -> None:
+        """Write runs of the rows wrapping lines at RLE_LINE_LENGTH."""
+        line: list[str] = []
+        line_length: int = 0
+        current_row: int = 0
+
+        def write_token(count: int, tag: str) -> None:
+            nonlocal line_length
+            token: str = f'{count}{tag}' if count > 1 else tag
+            if line_length + len(token) > RLE_LINE_LENGTH:
+                file.write(''.join(line) + '\n')
+                line.clear()
+                line_length = 0
+            line.append(token)
+            line_length += len(token)
+
+        for row_index, row in enumerate(rows):
+            runs: list[re.Match] = list(_STATES_RUN.finditer(row.rstrip(b'\x00')))
+            if not runs:
+                continue
+            if row_index > current_row:
+                write_token(row_index - current_row, '$')
+                current_row = row_index
+            for run in runs:
+                write_token(run.end() - run.start(), 'o' if run.group()[0] else 'b')
+        write_token(1, '!')
+        file.write(''.join(line) + '\n')
+
+    def load_game(self, file_name: str) -> LoadGameDataDto:
+        """Load game instance.
+
+        Args:
+            file_name (str): Name of the Saved Game file
+
+        Returns:
+            LoadGameDataDto: Instance data of the game
+
+        Raises:
+            SaveFileFormatException: On incorrect content or unsupported rule
+        """
+        generation: int = 0
+        header: re.Match = None
+        rule: str = None
+        topology: Topology = None
+        seed_density: tuple[int, float] = None
+        live_cells: set[tuple[int, int]] = set()
+        row: int = 0
+        column: int = 0
+        count: str = ''
+        with open(f'{file_name}', 'r', encoding='ascii') as file:
+            for line in file:
+                if header is None:
+                    if line.startswith('#'):
+                        generation = _parse_generation(line[2:]) or generation
+                        topology = _parse_topology(line[2:]) or topology
+                        seed_density = _parse_seed(line[2:]) or seed_density
+                    elif line.strip():
+                        header = self._parse_header(line)
+                        rule = _canonical_rule(header.group(3)) if header.group(3) else None
+                    continue
+                for token in _RLE_TOKEN.findall(line):
+                    if token.isdigit():
+                        count += token
+                        continue
+                    run: int = int(count) if count else 1
+                    count = ''
+                    if token == '!':
+                        break
+                    if token == '$':
+                        row += run
+                        column = 0
+                    elif token in 'b.':
+                        column += run
+                    else:
+                        live_cells.update((row, column + index) for index in range(run))
+                        column += run
+                else:
+                    continue
+                break
+        if header is None:
+            raise SaveFileFormatException('RLE header line is not found')
+        columns, rows = int(header.group(1)), int(header.group(2))
+        if any(cell_row >= rows or cell_column >= columns for cell_row, cell_column in live_cells):
+            raise SaveFileFormatException('RLE pattern exceeds size from the header')
+        log.debug('load_game: file loaded from file: %s', file_name)
+        seed, density = seed_density or (None, None)
+        return LoadGameDataDto(generation, _create_field(rows, columns, live_cells), rule, topology, seed, density)
+
+    def _parse_header(self, line: str) -> re.Match:
+        """Parse and validate 'x = .., y = .., rule = ..' line."""
+        header: re.Match = _RLE_HEADER.match(line)
+        if header is None:
+            raise SaveFileFormatException(f'Incorrect RLE header: {line.strip()}')
+        return header
+
+
+class GamePlaintextPersistance(AbstractPersistance):
+    """Represent plaintext (.cells) pattern format.
+
+    '!' starts comment lines, 'O' is ALIVE cell and '.' is DEAD cell.
+    Generation is kept in the '!generation N' comment line, rule in the
+    '!rule B3/S23' comment line, topology in the '!topology torus'
+    comment line and seed with density of the random first generation in
+    the '!seed 42 density 0.5' comment line.
+    """
+
+    def save_game(self, file_name: str,
+                  save_game_data: SaveGameDataDto) -> None:
+        """Save the game.
+
+        Args:
+            file_name (str): Name of the file where game will be saved
+            save_game_data (SaveGameDataDto): Instance data of the game
+        """
+        log.debug('save_game: Game will be saved, file=%s', file_name)
+        to_text: bytes = bytes.maketrans(b'\x00\x01', b'.O')
+        with open(f'{file_name}', 'w', encoding='ascii') as file:
+            file.write(f'!generation {save_game_data.generation}\n')
+            file.write(f'!rule {_rulestring(save_game_data)}\n')
+            file.write(f'!topology {_topology(save_game_data).value}\n')
+            seed_comment: str = _seed_comment(save_game_data)
+            if seed_comment is not None:
+                file.write(f'!{seed_comment}\n')
+            for row in _iter_rows(save_game_data.game_field):
+                file.write(row.translate(to_text).decode('ascii') + '\n')
+        log.debug('save_game: file dumped to file: %s', file_name)
+
+    def load_game(self, file_name: str) -> LoadGameDataDto:
+        """Load game instance.
+
+        Args:
+            file_name (str): Name of the Saved Game file
+
+        Returns:
+            LoadGameDataDto: Instance data of the game
+
+        Raises:
+            SaveFileFormatException: On unknown cell symbol or unsupported rule
+        """
+        generation: int = 0
+        rule: str = None
+        topology: Topology = None
+        seed_density: tuple[int, float] = None
+        live_cells: set[tuple[int, int]] = set()
+        rows: int = 0
+        columns: int = 0
+        with open(f'{file_name}', 'r', encoding='ascii') as file:
+            for line in file:
+                if line.startswith('!'):
+                    generation = _parse_generation(line[1:]) or generation
+                    rule = _parse_rule_comment(line[1:]) or rule
+                    topology = _parse_topology(line[1:]) or topology
+                    seed_density = _parse_seed(line[1:]) or seed_density
+                    continue
+                line = line.rstrip()
+                if line.strip('.O*'):
+                    raise SaveFileFormatException(f'Incorrect plaintext row: {line}')
+                live_cells.update((rows, column) for column, symbol in enumerate(line) if symbol != '.')
+                columns = max(columns, len(line))
+                rows += 1
+        log.debug('load_game: file loaded from file: %s', file_name)
+        seed, density = seed_density or (None, None)
+        return LoadGameDataDto(generation, _create_field(rows, columns, live_cells), rule, topology, seed, density)
@@ -1,10 +1,18 @@
 """Module contains persistance functionality for the Game."""
 import logging
+import math
+import mmap
+import os
 import pickle
+import struct
 
 from gameoflifeapi.api.abstract_definitions import AbstractPersistance
 from gameoflifeapi.logic.data.dtos import LoadGameDataDto, SaveGameDataDto
 from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.packed_states import pack_states, unpack_states
+from gameoflifeapi.logic.exceptions import SaveFileFormatException
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule, parse_rule
+from gameoflifeapi.logic.topology import Topology
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -51,4 +59,136 @@ class GamePicklePersistance(AbstractPersistance):
 
         generation: int = save_game_data.generation
         field: Field = save_game_data.game_field
-        return LoadGameDataDto(generation, field)
+        return LoadGameDataDto(generation, field, save_game_data.rule, save_game_data.topology,
+                               save_game_data.seed, save_game_data.density)
+
+
+BINARY_MAGIC: bytes = b'GOLB'
+BINARY_VERSION: int = 3
+# magic, version, flags, rows, columns, generation
+_BINARY_HEADER: struct.Struct = struct.Struct('<4sHHIIQ')
+# low bits of the flags: index of the topology, 0 (bounded) in old files
+_BINARY_TOPOLOGIES: tuple[Topology, ...] = (Topology.BOUNDED, Topology.TORUS,
+                                            Topology.KLEIN_BOTTLE, Topology.INFINITE)
+_BINARY_TOPOLOGY_MASK: int = 0x3
+# since version 3: flag of the seed and density of the random first generation
+# stored after the rule
+_BINARY_SEED_FLAG: int = 0x4
+_BINARY_SEED: struct.Struct = struct.Struct('<qd')
+# since version 2: birth and survival neighbour numbers as bit masks
+_BINARY_RULE: struct.Struct = struct.Struct('<HH')
+
+
+def _rule_to_masks(rule: Rule) -> tuple[int, int]:
+    """Return birth and survival neighbour numbers of the rule as bit masks."""
+    return (sum(1 << number for number in rule.birth),
+            sum(1 << number for number in rule.survival))
+
+
+def _masks_to_rule(birth: int, survival: int) -> Rule:
+    """Create rule from bit masks created by _rule_to_masks."""
+    return Rule((number for number in range(9) if birth >> number & 1),
+                (number for number in range(9) if survival >> number & 1))
+
+
+class GameBinaryPersistance(AbstractPersistance):
+    """Represent compact binary format of the saved game.
+
+    File consists of the fixed header (magic, format version, flags with the
+    topology, rows, columns and generation, little-endian), the rule (birth and
+    survival masks, since version 2) and optional seed and density of the
+    random first generation (since version 3) followed by the bit-packed
+    row-major cell states. Loaded field keeps only ALIVE cells, so no Cell
+    objects are created for the whole field. Files of version 1 are loaded
+    without rule.
+    """
+
+    def save_game(self, file_name: str,
+                  save_game_data: SaveGameDataDto) -> None:
+        """Save the game.
+
+        Args:
+            file_name (str): Name of the file where game will be saved
+            save_game_data (SaveGameDataDto): Instance data of the game
+        """
+        log.debug('save_game: Game will be saved, file=%s', file_name)
+        field: Field = save_game_data.game_field
+        rule: Rule = parse_rule(save_game_data.rule) if save_game_data.rule else CONWAY_RULE
+        flags: int = _BINARY_TOPOLOGIES.index(save_game_data.topology or Topology.BOUNDED)
+        if save_game_data.seed is not None:
+            flags |= _BINARY_SEED_FLAG
+        header: bytes = _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags,
+                                            field.rows, field.columns,
+                                            save_game_data.generation)
+        with open(f'{file_name}', 'wb') as file:
+            file.write(header)
+            file.write(_BINARY_RULE.pack(*_rule_to_masks(rule)))
+            if save_game_data.seed is not None:
+                density: float = save_game_data.density
+                file.write(_BINARY_SEED.pack(save_game_data.seed, float('nan') if density is None else density))
+            file.write(pack_states(field.state_buffer()))
+        log.debug('save_game: file dumped to file: %s', file_name)
+
+    def load_game(self, file_name: str) -> LoadGameDataDto:
+        """Load game instance.
+
+        The file is memory-mapped and states are unpacked right from the mapping
+        into the cell array of the field, the game counts the neighbours.
+
+        Args:
+            file_name (str): Name of the Saved Game file
+
+        Returns:
+            LoadGameDataDto: Instance data of the game
+
+        Raises:
+            SaveFileFormatException: On file with other format or version
+        """
+        with open(f'{file_name}', 'rb') as file:
+            if os.fstat(file.fileno()).st_size < _BINARY_HEADER.size:
+                raise SaveFileFormatException('Save file is truncated')
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                version, flags, rows, columns, generation = self._read_header(mapped)
+                topology: Topology = _BINARY_TOPOLOGIES[flags & _BINARY_TOPOLOGY_MASK]
+                offset: int = _BINARY_HEADER.size
+                rule: str = None
+                seed: int = None
+                density: float = None
+                if version >= 2:
+                    if len(mapped) < offset + _BINARY_RULE.size:
+                        raise SaveFileFormatException('Save file is truncated')
+                    rule = _masks_to_rule(*_BINARY_RULE.unpack_from(mapped, offset)).rulestring
+                    offset += _BINARY_RULE.size
+                if version >= 3 and flags & _BINARY_SEED_FLAG:
+                    if len(mapped) < offset + _BINARY_SEED.size:
+                        raise SaveFileFormatException('Save file is truncated')
+                    seed, density = _BINARY_SEED.unpack_from(mapped, offset)
+                    density = None if math.isnan(density) else density
+                    offset += _BINARY_SEED.size
+                count: int = rows * columns
+                if len(mapped) < offset + (count + 7) // 8:
+                    raise SaveFileFormatException('Save file is truncated')
+                field: Field = Field(rows, columns)
+                with memoryview(mapped) as view:
+                    field.cell_arrays()[0][:count] = unpack_states(view[offset:], count)
+        log.debug('load_game: file loaded from file: %s', file_name)
+        return LoadGameDataDto(generation, field, rule, topology, seed, density)
+
+    def _read_header(self, content: bytes) -> tuple[int, int, int, int, int]:
+        """Read and validate header of the file.
+
+        Args:
+            content (bytes): content of the file
+
+        Returns:
+            tuple[int, int, int, int, int]: version, flags, rows, columns and generation
+
+        Raises:
+            SaveFileFormatException: On file with other format or version
+        """
+        magic, version, flags, rows, columns, generation = _BINARY_HEADER.unpack_from(content)
+        if magic != BINARY_MAGIC:
+            raise SaveFileFormatException('File is not a binary save of the game')
+        if not 1 <= version <= BINARY_VERSION:
+            raise SaveFileFormatException(f'Unsupported save file version {version}')
+        return version, flags, rows, columns, generation
@@ -7,32 +7,43 @@ from gameoflifeapi.api.abstract_definitions import (AbstractController,
 from gameoflifeapi.api.game_controller import GameLifeController
 from gameoflifeapi.api.persistance import GamePicklePersistance
 from gameoflifeapi.logic.data.field import Field
-from gameoflifeapi.logic.data.state import CellState
 
 from .logic.data.dtos import NewGameDataDto
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 
 
+_SEPARATOR: str = '_________________________________________________________'
+_CELL_SYMBOLS: bytes = bytes.maketrans(b'\x00\x01', b' *')
+
+
+def render_game_state(game_field: Field) -> str:
+    """Render the Game Field to the text.
+
+    Args:
+        game_field (Field): Game Field
+
+    Returns:
+        str: rows of the field, '*' for ALIVE cell, cells are separated by '|'
+    """
+    states: bytearray = game_field.state_buffer()
+    columns: int = game_field.columns
+    lines: list[str] = [_SEPARATOR]
+    for start in range(0, len(states), columns):
+        symbols: str = states[start:start + columns].translate(_CELL_SYMBOLS).decode('ascii')
+        lines.append('|'.join(symbols) + '|')
+    lines.append(_SEPARATOR)
+    return '\n'.join(lines)
+
+
 def print_game_state(game_field: Field) -> None:
     """Generate view for the Game Field.
 
     Args:
-        game_field (list[list[GameLifeCell]]): Game Field
+        game_field (Field): Game Field
     """
     os.system('clear')
-
-    print('_________________________________________________________')
-    rows = range(0, game_field.rows)
-    cols = range(0, game_field.columns)
-    field = game_field.all_cells
-    for row in rows:
-        for col in cols:
-            cell = field[(row, col)]
-            symb = '*|' if cell.state == CellState.ALIVE else ' |'
-            print(symb, end='')
-        print()
-    print('_________________________________________________________')
+    print(render_game_state(game_field))
 
 
 def main():
@@ -0,0 +1,193 @@
+"""Module represents headless batch runner of the Game.
+
+Loads a saved game or pattern (or creates a random one), runs number of
+generations without rendering and prints statistics as JSON.
+
+Usage:
+    gameoflifebatch --load pattern.rle --generations 1000 --engine numpy
+    gameoflifebatch --rows 512 --columns 512 --seed 42 --generations 100 --rule B36/S23
+    gameoflifebatch --rows 64 --seed 1 --generations 1000 --topology torus
+    gameoflifebatch --rows 256 --seed 5 --density 0.3 --generations 100
+    gameoflifebatch --rows 64 --seed 9 --generations 100000 --stop-on-cycle
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from gameoflifeapi.api.abstract_definitions import AbstractPersistance
+from gameoflifeapi.api.pattern_persistance import (GamePlaintextPersistance,
+                                                   GameRlePersistance)
+from gameoflifeapi.api.persistance import (GameBinaryPersistance,
+                                           GamePicklePersistance)
+from gameoflifeapi.logic.data.dtos import LoadGameDataDto, SaveGameDataDto
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.sparse_field import (SparseField,
+                                                   live_cells_from_buffer)
+from gameoflifeapi.logic.engines.engine_factory import is_engine_available
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+from gameoflifeapi.logic.instrumentation import Instrumentation
+from gameoflifeapi.logic.random_states import (DEFAULT_DENSITY, create_seed,
+                                               random_states)
+from gameoflifeapi.logic.topology import Topology
+
+PERSISTANCES_BY_EXTENSION: dict[str, type[AbstractPersistance]] = {
+    '.rle': GameRlePersistance,
+    '.cells': GamePlaintextPersistance,
+    '.gbin': GameBinaryPersistance,
+}
+
+
+def persistance_for_file(file_name: str) -> AbstractPersistance:
+    """Select persistance by extension of the file, pickle is used for unknown ones.
+
+    Args:
+        file_name (str): name of the file
+
+    Returns:
+        AbstractPersistance: persistance instance
+    """
+    extension: str = os.path.splitext(file_name)[1].lower()
+    return PERSISTANCES_BY_EXTENSION.get(extension, GamePicklePersistance)()
+
+
+def create_random_field(rows: int, columns: int, seed: int = None, density: float = DEFAULT_DENSITY) -> Field:
+    """Create field with random cells, the same seed and density give the same field.
+
+    Args:
+        rows (int): Number of rows
+        columns (int): Number of columns
+        seed (int, optional): seed of the random generator, None to create new one
+        density (float, optional): probability of the cell to be ALIVE.
+                                   Defaults to DEFAULT_DENSITY.
+
+    Returns:
+        Field: field which keeps only ALIVE cells
+    """
+    states: bytes = random_states(rows * columns, create_seed() if seed is None else seed, density)
+    return SparseField(rows, columns, live_cells_from_buffer(states, columns))
+
+
+def run(game: GameFlowProcess, generations: int, stop_on_cycle: bool = False) -> dict:
+    """Create number of generations and collect statistics.
+
+    Args:
+        game (GameFlowProcess): game to run
+        generations (int): maximal number of generations
+        stop_on_cycle (bool, optional): True to stop when the game detects still life
+                                        or oscillator. Defaults to False.
+
+    Returns:
+        dict: statistics of the run, generations is the number of created generations
+    """
+    initial_population: int = game.state_buffer().count(1)
+    started: float = time.perf_counter()
+    created: int = 0
+    while created < generations and not (stop_on_cycle and game.cycle is not None):
+        game.create_next_generation()
+        created += 1
+    seconds: float = time.perf_counter() - started
+    return {
+        'engine': game.engine_type.value,
+        'rule': game.rule.rulestring,
+        'topology': game.topology.value,
+        'rows': game.rows,
+        'columns': game.columns,
+        'generations': created,
+        'final_generation': game.generation,
+        'initial_population': initial_population,
+        'final_population': game.state_buffer().count(1),
+        'seconds': seconds,
+        'generations_per_second': created / seconds if seconds else None,
+        'cycle': game.cycle.as_dict() if game.cycle is not None else None,
+    }
+
+
+def _default_engine() -> EngineType:
+    """Return numpy engine if numpy is installed, object engine otherwise."""
+    return EngineType.NUMPY if is_engine_available(EngineType.NUMPY) else EngineType.OBJECT
+
+
+def _parse_arguments(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='gameoflifebatch', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--load', help='saved game or pattern (.rle, .cells, .gbin, pickle otherwise)')
+    source.add_argument('--rows', type=int, help='number of rows of the random field')
+    parser.add_argument('--columns', type=int, help='number of columns of the random field (default: rows)')
+    parser.add_argument('--seed', type=int, help='seed of the random field (default: new seed, it is reported)')
+    parser.add_argument('--density', type=float, default=DEFAULT_DENSITY,
+                        help=f'probability of the cell of the random field to be alive (default: {DEFAULT_DENSITY})')
+    parser.add_argument('--generations', type=int, required=True, help='number of generations to run')
+    parser.add_argument('--engine', choices=[engine.value for engine in EngineType], default=_default_engine().value,
+                        help='engine used to create generations (default: numpy if it is installed, object otherwise)')
+    parser.add_argument('--rule', help='rulestring, for example B36/S23 (default: rule of the loaded game or B3/S23)')
+    parser.add_argument('--topology', choices=[topology.value for topology in Topology],
+                        help='topology of the field (default: topology of the loaded game or bounded)')
+    parser.add_argument('--workers', type=int, help='number of worker processes of the parallel engine')
+    parser.add_argument('--stop-on-cycle', action='store_true',
+                        help='stop when the field becomes still life or oscillator, the cycle is reported')
+    parser.add_argument('--phases', action='store_true',
+                        help='record time of the generation phases (adds population counting per generation)')
+    parser.add_argument('--save', help='file for the last generation, format is selected by extension')
+    parser.add_argument('--output', help='file for JSON statistics (printed to stdout when omitted)')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> None:
+    """Define entry point for the batch runner."""
+    args: argparse.Namespace = _parse_arguments(sys.argv[1:] if argv is None else argv)
+
+    started: float = time.perf_counter()
+    if args.load:
+        game_data: LoadGameDataDto = persistance_for_file(args.load).load_game(args.load)
+        game_field: Field = game_data.game_field
+        generation: int = game_data.generation
+        rule: str = args.rule or game_data.rule
+        topology: Topology = Topology(args.topology) if args.topology else game_data.topology
+        seed: int = game_data.seed
+        density: float = game_data.density
+    else:
+        seed = create_seed() if args.seed is None else args.seed
+        density = args.density
+        game_field = create_random_field(args.rows, args.columns or args.rows, seed, density)
+        generation = 0
+        rule = args.rule
+        topology = Topology(args.topology) if args.topology else None
+    instrumentation: Instrumentation = Instrumentation(enabled=args.phases)
+    game: GameFlowProcess = GameFlowProcess(game_field=game_field,
+                                            generation=generation,
+                                            engine_type=EngineType(args.engine),
+                                            workers=args.workers,
+                                            instrumentation=instrumentation,
+                                            rule=rule,
+                                            topology=topology or Topology.BOUNDED,
+                                            detect_cycles=args.stop_on_cycle)
+    load_seconds: float = time.perf_counter() - started
+    try:
+        statistics: dict = run(game, args.generations, args.stop_on_cycle)
+        if args.save:
+            persistance_for_file(args.save).save_game(args.save, SaveGameDataDto(game.generation, game.game_field,
+                                                                                 game.rule.rulestring,
+                                                                                 game.topology,
+                                                                                 seed, density))
+    finally:
+        game.close()
+    statistics['seed'] = seed
+    statistics['density'] = density
+    statistics['load_seconds'] = load_seconds
+    if args.phases:
+        statistics['phases'] = instrumentation.totals
+
+    report: str = json.dumps(statistics, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
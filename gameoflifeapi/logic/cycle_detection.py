@@ -0,0 +1,209 @@
+"""Defines detection of the still lifes and oscillators by hashing of the board.
+
+Board hash is the Zobrist hash: XOR of the random 64-bit keys of the ALIVE
+cells. Changing state of the cell XORs its key into the hash, so the hash
+of the next generation is updated from the changed cells only. Key of the
+cell is the product of the random keys of its row and column, so keys
+take memory per row and column instead of per cell.
+
+Hashes of the recent generations are indexed by the hash: when the hash
+of the new generation is already in the index, the board probably returned
+to the state of the indexed generation. Different boards may have the same
+hash, so the states of the board are copied and the cycle is reported only
+when the board has the same states again after the found period.
+"""
+import logging
+import random
+from collections import deque
+from typing import Callable, Iterable
+
+from gameoflifeapi.logic.engines.numpy_engine import np
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PERIOD: int = 4096
+# keys are the same in every game, so the same board has the same hash
+_KEYS_SEED: int = 0x5A0B217
+_KEY_MASK: int = (1 << 64) - 1
+
+
+class Cycle:
+    """Represent repeating states of the board.
+
+    Board has the same state every period generations starting from the
+    start generation, still life is the cycle with period 1 (including the
+    board without ALIVE cells).
+    """
+
+    __slots__ = ('start', 'period')
+
+    def __init__(self, start: int, period: int) -> None:
+        """Initialize Cycle.
+
+        Args:
+            start (int): the first generation of the cycle
+            period (int): number of generations between the same states
+        """
+        self.start: int = start
+        self.period: int = period
+
+    @property
+    def is_still_life(self) -> bool:
+        """Return True if the board doesn't change since the start generation."""
+        return self.period == 1
+
+    def as_dict(self) -> dict:
+        """Return cycle as dictionary ready for JSON serialization."""
+        return {'start': self.start, 'period': self.period}
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if cycles have the same start and period."""
+        if not isinstance(other, Cycle):
+            return NotImplemented
+        return (self.start, self.period) == (other.start, other.period)
+
+    def __repr__(self) -> str:
+        """Return string representation of the cycle."""
+        return f'Cycle(start={self.start}, period={self.period})'
+
+    def __str__(self) -> str:
+        """Return description of the cycle, for example 'period 2 since gen 15'."""
+        if self.is_still_life:
+            return f'still life at gen {self.start}'
+        return f'period {self.period} since gen {self.start}'
+
+
+class CycleDetector:
+    """Incremental board hash with index of the hashes of the recent generations."""
+
+    def __init__(self, rows: int, columns: int, max_period: int = DEFAULT_MAX_PERIOD) -> None:
+        """Initialize Cycle Detector.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            max_period (int, optional): number of the indexed recent generations,
+                                        longer periods are not detected.
+                                        Defaults to DEFAULT_MAX_PERIOD.
+        """
+        generator: random.Random = random.Random(_KEYS_SEED)
+        self._columns: int = columns
+        self._row_keys: list[int] = [generator.getrandbits(64) for _ in range(rows)]
+        # odd column keys keep all bits of the row keys in the products
+        self._column_keys: list[int] = [generator.getrandbits(64) | 1 for _ in range(columns)]
+        if np is not None:
+            self._row_keys_array = np.array(self._row_keys, dtype=np.uint64)
+            self._column_keys_array = np.array(self._column_keys, dtype=np.uint64)
+        self._max_period: int = max_period
+        self._hash: int = None
+        self._index: dict[int, int] = {}
+        self._indexed: deque[tuple[int, int]] = deque()
+        # cycle found by hash, generation to compare the states at and the states
+        self._candidate: tuple[Cycle, int, bytes] = None
+        self._cycle: Cycle = None
+
+    @property
+    def max_period(self) -> int:
+        """Return number of the indexed recent generations."""
+        return self._max_period
+
+    @property
+    def hash(self) -> int:
+        """Return hash of the current board, None if it is not known."""
+        return self._hash
+
+    @property
+    def cycle(self) -> Cycle:
+        """Return detected cycle or None."""
+        return self._cycle
+
+    def clear(self) -> None:
+        """Forget the hash and indexed generations, board was changed not by the rules."""
+        self._hash = None
+        self._index.clear()
+        self._indexed.clear()
+        self._candidate = None
+        self._cycle = None
+
+    def hash_states(self, states: bytes) -> int:
+        """Return hash of the board.
+
+        Args:
+            states (bytes): row-major cell states, 1 - ALIVE, 0 - DEAD
+
+        Returns:
+            int: 64-bit hash
+        """
+        if np is not None:
+            rows, columns = np.divmod(np.flatnonzero(np.frombuffer(states, dtype=np.uint8)), self._columns)
+            keys = self._row_keys_array[rows] * self._column_keys_array[columns]
+            return int(np.bitwise_xor.reduce(keys)) if len(keys) else 0
+        value: int = 0
+        index: int = states.find(1)
+        while index >= 0:
+            value ^= self._key(index)
+            index = states.find(1, index + 1)
+        return value
+
+    def reset(self, states: bytes, generation: int) -> Cycle:
+        """Forget indexed generations and index the generation by hash of all its cells.
+
+        Args:
+            states (bytes): row-major cell states, 1 - ALIVE, 0 - DEAD
+            generation (int): Number of generation
+
+        Returns:
+            Cycle: always None, the only generation is indexed
+        """
+        self.clear()
+        self._hash = self.hash_states(states)
+        return self._index_generation(generation, lambda: states)
+
+    def update(self, changed: Iterable[int], generation: int, read_states: Callable[[], bytes]) -> Cycle:
+        """Update hash by the cells changed since the previous generation and index it.
+
+        Args:
+            changed (Iterable[int]): row-major indices of the changed cells
+            generation (int): Number of the new generation
+            read_states (Callable[[], bytes]): returns row-major cell states of the new
+                                              generation, called only to compare
+                                              the boards with the same hash
+
+        Returns:
+            Cycle: detected cycle or None
+        """
+        if self._cycle is not None:
+            return self._cycle
+        value: int = self._hash
+        for index in changed:
+            value ^= self._key(index)
+        self._hash = value
+        if self._candidate is not None and generation >= self._candidate[1]:
+            cycle, _, states = self._candidate
+            self._candidate = None
+            if read_states() == states:
+                self._cycle = cycle
+                log.debug('update: %s', cycle)
+                return cycle
+            log.debug('update: hash collision, %s is not confirmed', cycle)
+        return self._index_generation(generation, read_states)
+
+    def _key(self, index: int) -> int:
+        """Return key of the cell by its row-major index."""
+        row, column = divmod(index, self._columns)
+        return (self._row_keys[row] * self._column_keys[column]) & _KEY_MASK
+
+    def _index_generation(self, generation: int, read_states: Callable[[], bytes]) -> Cycle:
+        """Index the current hash, remember the cycle to confirm if the hash is already indexed."""
+        start: int = self._index.get(self._hash)
+        if start is not None:
+            if self._candidate is None:
+                period: int = generation - start
+                self._candidate = (Cycle(start, period), generation + period, bytes(read_states()))
+            return None
+        self._index[self._hash] = generation
+        self._indexed.append((generation, self._hash))
+        if len(self._indexed) > self._max_period:
+            _, evicted = self._indexed.popleft()
+            del self._index[evicted]
+        return None
@@ -22,6 +22,8 @@ class Cell:
         NeighboursNumberException: On incorrect values assigned
     """
 
+    __slots__ = ('_row', '_column', '_state', '_neighbours')
+
     def __init__(self, row: int, column: int,
                  state: CellState = CellState.DEAD) -> None:
         """Initialize Cell Object.
@@ -92,7 +94,7 @@ class Cell:
             AttributeError: If state is not supported or
                             value is not correct
         """
-        if value not in [CellState.DEAD, CellState.ALIVE]:
+        if not isinstance(value, CellState):
             raise AttributeError(f'Passed value is not allowed, {value}')
         self._state = value
 
@@ -119,6 +121,17 @@ class Cell:
             raise NeighboursNumberException('Number is not in 0..8')
         self._neighbours = value
 
+    def __setstate__(self, state: object) -> None:
+        """Restore pickled Cell, including cells pickled before __slots__ were used.
+
+        Args:
+            state (object): attributes dictionary or (None, slots dictionary) pair
+        """
+        if isinstance(state, tuple):
+            state = state[1]
+        for (name, value) in state.items():
+            object.__setattr__(self, name, value)
+
     def __repr__(self) -> str:
         """Return new repr value for the class."""
         return f'({self.row},{self.column}):N={self.neighbours}:ST={self.state}'
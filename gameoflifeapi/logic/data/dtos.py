@@ -1,16 +1,29 @@
 """Contains DataDto for game."""
+from gameoflifeapi.logic.cycle_detection import Cycle
 from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.topology import Topology
 
 
 class GameDataDto:
     """Represent main GameDataDto base class."""
 
+    # defaults for the games pickled before the rule, topology and seed were stored
+    _rule: str = None
+    _topology: Topology = None
+    _seed: int = None
+    _density: float = None
+
     def __init__(self,
                  number_of_rows: int,
                  number_of_columns: int,
                  is_random_first_generation: bool,
                  generation: int,
-                 game_field: Field) -> None:
+                 game_field: Field,
+                 rule: str = None,
+                 topology: Topology = None,
+                 seed: int = None,
+                 density: float = None) -> None:
         """__init__ Initialize Data Dto.
 
         Args:
@@ -20,12 +33,20 @@ class GameDataDto:
                                                     should be randomized
             generation (int): Number of generation
             game_field (GameField): Game Field
+            rule (str, optional): Rulestring of the game, None if it is unknown
+            topology (Topology, optional): Topology of the field, None if it is unknown
+            seed (int, optional): Seed of the random first generation, None if it is unknown
+            density (float, optional): Density of the random first generation, None if it is unknown
         """
         self._rows: int = number_of_rows
         self._cols: int = number_of_columns
         self._is_rnd_gen: bool = is_random_first_generation
         self._generation: int = generation
         self._game_field: Field = game_field
+        self._rule: str = rule
+        self._topology: Topology = topology
+        self._seed: int = seed
+        self._density: float = density
 
     @property
     def number_of_rows(self) -> int:
@@ -72,13 +93,55 @@ class GameDataDto:
         """
         return self._game_field
 
+    @property
+    def rule(self) -> str:
+        """Return rule Property.
+
+        Returns:
+            str: Rulestring of the game or None
+        """
+        return self._rule
+
+    @property
+    def topology(self) -> Topology:
+        """Return topology Property.
+
+        Returns:
+            Topology: Topology of the field or None
+        """
+        return self._topology
+
+    @property
+    def seed(self) -> int:
+        """Return seed Property.
+
+        Returns:
+            int: Seed of the random first generation or None
+        """
+        return self._seed
+
+    @property
+    def density(self) -> float:
+        """Return density Property.
+
+        Returns:
+            float: Probability of the cell of the random first generation
+                   to be ALIVE or None
+        """
+        return self._density
+
 
 class NewGameDataDto(GameDataDto):
     """NewGameDataDto representation."""
 
     def __init__(self, number_of_rows: int,
                  number_of_columns: int,
-                 is_random_first_generation: bool) -> None:
+                 is_random_first_generation: bool,
+                 engine_type: EngineType = None,
+                 rule: str = None,
+                 topology: Topology = None,
+                 seed: int = None,
+                 density: float = None) -> None:
         """__init__ Initialize New Game Data Dto.
 
         Args:
@@ -86,13 +149,38 @@ class NewGameDataDto(GameDataDto):
             number_of_columns (int): Number of columns
             is_random_first_generation (bool): flag for random first
                                                 generation
+            engine_type (EngineType, optional): Engine used for the game,
+                                                None to use controller default
+            rule (str, optional): Rulestring of the game,
+                                  None to use controller default
+            topology (Topology, optional): Topology of the field,
+                                           None to use controller default
+            seed (int, optional): Seed of the random first generation,
+                                  None to create new one
+            density (float, optional): Probability of the cell of the random
+                                       first generation to be ALIVE,
+                                       None to use DEFAULT_DENSITY
         """
         GameDataDto.__init__(self,
                              number_of_rows,
                              number_of_columns,
                              is_random_first_generation,
                              0,
-                             None)
+                             None,
+                             rule,
+                             topology,
+                             seed,
+                             density)
+        self._engine_type: EngineType = engine_type
+
+    @property
+    def engine_type(self) -> EngineType:
+        """Return engine_type Property.
+
+        Returns:
+            EngineType: Engine used for the game or None
+        """
+        return self._engine_type
 
 
 class LoadGameDataDto(GameDataDto):
@@ -100,19 +188,31 @@ class LoadGameDataDto(GameDataDto):
 
     def __init__(self,
                  generation: int,
-                 game_field: Field) -> None:
+                 game_field: Field,
+                 rule: str = None,
+                 topology: Topology = None,
+                 seed: int = None,
+                 density: float = None) -> None:
         """__init__ Initialize Load Game Data Dto.
 
         Args:
             generation (int): Number of generation
             game_field (GameField): Game Field
+            rule (str, optional): Rulestring of the game, None if it is unknown
+            topology (Topology, optional): Topology of the field, None if it is unknown
+            seed (int, optional): Seed of the random first generation, None if it is unknown
+            density (float, optional): Density of the random first generation, None if it is unknown
         """
         GameDataDto.__init__(self,
                              game_field.rows,
                              game_field.columns,
                              False,
                              generation,
-                             game_field)
+                             game_field,
+                             rule,
+                             topology,
+                             seed,
+                             density)
 
 
 class SaveGameDataDto(GameDataDto):
@@ -120,33 +220,48 @@ class SaveGameDataDto(GameDataDto):
 
     def __init__(self,
                  generation: int,
-                 game_field: Field) -> None:
+                 game_field: Field,
+                 rule: str = None,
+                 topology: Topology = None,
+                 seed: int = None,
+                 density: float = None) -> None:
         """__init__ Initialize Save Game Data Dto.
 
         Args:
             generation (int): Number of generation
             game_field (GameField): Game Field
+            rule (str, optional): Rulestring of the game, None if it is unknown
+            topology (Topology, optional): Topology of the field, None if it is unknown
+            seed (int, optional): Seed of the random first generation, None if it is unknown
+            density (float, optional): Density of the random first generation, None if it is unknown
         """
         GameDataDto.__init__(self,
                              game_field.rows,
                              game_field.columns,
                              False,
                              generation,
-                             game_field)
+                             game_field,
+                             rule,
+                             topology,
+                             seed,
+                             density)
 
 
 class GameStateDto:
     """Define DTO class to keep information about Game State."""
 
-    def __init__(self, game_field: Field, generation: int) -> None:
+    def __init__(self, game_field: Field, generation: int, states: memoryview = None) -> None:
         """Initialize GameState DTO object.
 
         Args:
             game_field (GameField): Game Field
             generation (int): Current Game Field Generation
+            states (memoryview, optional): read-only row-major cell states of the generation,
+                                           None if not provided. Defaults to None.
         """
         self._game_field: Field = game_field
         self._generation: int = generation
+        self._states: memoryview = states
 
     @property
     def game_field(self) -> Field:
@@ -165,3 +280,82 @@ class GameStateDto:
             int: Number of generation
         """
         return self._generation
+
+    @property
+    def states(self) -> memoryview:
+        """Return read-only states of the generation via its property.
+
+        States are not copied: with object engine they are the view of the
+        front buffer of the field, which is not written after it was handed
+        out, so the states stay the states of the generation.
+
+        Returns:
+            memoryview: row-major cell states, 1 - ALIVE, 0 - DEAD, or None
+        """
+        return self._states
+
+
+class GameSnapshotDto:
+    """Define immutable DTO class with the cells of one generation.
+
+    Snapshot doesn't refer to the field or the engine, so it can be passed
+    to other thread and read while the next generations are created.
+    Sequence grows with every snapshot of the controller, so the newest
+    snapshot can be selected among the delivered ones.
+    """
+
+    def __init__(self, sequence: int, generation: int, rows: int, columns: int,
+                 origin: tuple[int, int], states: bytes, cycle: Cycle = None) -> None:
+        """Initialize GameSnapshot DTO object.
+
+        Args:
+            sequence (int): Number of the snapshot
+            generation (int): Number of generation
+            rows (int): Number of rows of the field
+            columns (int): Number of columns of the field
+            origin (tuple[int, int]): position of the initial field in the grown field
+            states (bytes): row-major cell states, 1 - ALIVE, 0 - DEAD
+            cycle (Cycle, optional): cycle detected by the generation, None if not detected
+        """
+        self._sequence: int = sequence
+        self._generation: int = generation
+        self._rows: int = rows
+        self._columns: int = columns
+        self._origin: tuple[int, int] = origin
+        self._states: bytes = bytes(states)
+        self._cycle: Cycle = cycle
+
+    @property
+    def sequence(self) -> int:
+        """Return number of the snapshot, newer snapshots have greater numbers."""
+        return self._sequence
+
+    @property
+    def generation(self) -> int:
+        """Return number of generation."""
+        return self._generation
+
+    @property
+    def rows(self) -> int:
+        """Return number of rows of the field."""
+        return self._rows
+
+    @property
+    def columns(self) -> int:
+        """Return number of columns of the field."""
+        return self._columns
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        """Return position of the initial field in the grown field."""
+        return self._origin
+
+    @property
+    def states(self) -> bytes:
+        """Return row-major cell states, 1 - ALIVE, 0 - DEAD."""
+        return self._states
+
+    @property
+    def cycle(self) -> Cycle:
+        """Return cycle detected by the generation, None if it is not detected."""
+        return self._cycle
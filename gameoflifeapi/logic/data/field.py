@@ -1,6 +1,140 @@
-"""Defines Game Field class."""
+"""Defines Game Field class.
+
+States and numbers of ALIVE neighbours of the cells are kept in two
+row-major byte arrays, Cell objects are lightweight views over them
+created on access to all_cells.
+"""
+import copy
+from collections.abc import Iterator, Mapping
+
 from gameoflifeapi.logic.data.cell import Cell
-from gameoflifeapi.logic.exceptions import GameFieldSizeException
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.exceptions import (GameFieldSizeException,
+                                            NeighboursNumberException)
+
+# CellState by its value, CellState.DEAD.value == 0, CellState.ALIVE.value == 1
+_STATES: tuple[CellState, CellState] = (CellState.DEAD, CellState.ALIVE)
+
+
+class FieldCell(Cell):
+    """Represent Cell view over the arrays of the Field.
+
+    View keeps only the field and the row-major index of the cell, so it
+    can be moved to another cell by assigning index.
+    """
+
+    __slots__ = ('_field', 'index')
+
+    def __init__(self, field: 'Field', index: int) -> None:
+        """Initialize Cell view.
+
+        Args:
+            field (Field): field that owns the cell
+            index (int): row-major index of the cell
+        """
+        self._field: Field = field
+        self.index: int = index
+
+    @property
+    def row(self) -> int:
+        """ROW property.
+
+        Returns:
+            int: row value of the cell
+        """
+        return self.index // self._field.columns
+
+    @property
+    def column(self) -> int:
+        """COLUMN property.
+
+        Returns:
+            int: column value of the cell
+        """
+        return self.index % self._field.columns
+
+    @property
+    def state(self) -> CellState:
+        """STATE property.
+
+        Returns:
+            CellState: state value of the cell
+        """
+        return _STATES[self._field._states[self.index]]
+
+    @state.setter
+    def state(self, value: CellState) -> None:
+        """Setter for property STATE.
+
+        Args:
+            value (CellState): Value of the state
+
+        Raises:
+            AttributeError: If state is not supported or
+                            value is not correct
+        """
+        if not isinstance(value, CellState):
+            raise AttributeError(f'Passed value is not allowed, {value}')
+        self._field._states[self.index] = value.value
+
+    @property
+    def neighbours(self) -> int:
+        """NEIGHBOUR property.
+
+        Returns:
+            int: Number of neighbours
+        """
+        return self._field._neighbours[self.index]
+
+    @neighbours.setter
+    def neighbours(self, value: int) -> None:
+        """Setter for NEIGHBOUR property.
+
+        Args:
+            value (int): number of ALIVE neighbours
+
+        Raises:
+            NeighboursNumberException: On incorrect number of neighbours
+        """
+        if value is None or not 0 <= value <= 8:
+            raise NeighboursNumberException('Number is not in 0..8')
+        self._field._neighbours[self.index] = value
+
+
+class CellsView(Mapping):
+    """Read-only mapping { (row, column) -> Cell } which creates Cell views on access."""
+
+    def __init__(self, field: 'Field') -> None:
+        """Initialize Cells view.
+
+        Args:
+            field (Field): field that owns the cells
+        """
+        self._field: Field = field
+
+    def __getitem__(self, coordinates: tuple[int, int]) -> Cell:
+        """Return Cell view of the cell.
+
+        Args:
+            coordinates (tuple[int, int]): (row, column) of the cell
+
+        Raises:
+            KeyError: If coordinates are outside of the field
+        """
+        row, col = coordinates
+        if not (0 <= row < self._field.rows and 0 <= col < self._field.columns):
+            raise KeyError(coordinates)
+        return self._field._cell_at(row, col)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Yield coordinates of all cells row by row."""
+        for row in range(self._field.rows):
+            for col in range(self._field.columns):
+                yield (row, col)
+
+    def __len__(self) -> int:
+        """Return number of cells of the field."""
+        return self._field.rows * self._field.columns
 
 
 class Field:
@@ -34,14 +168,28 @@ class Field:
             raise GameFieldSizeException('Minimal field size should be 10x10')
 
     def _init_cells(self) -> None:
-        self._cells: dict[tuple[int, int], Cell] = {}
-        rows: range = range(self._rows)
-        cols: range = range(self._columns)
-        for row in rows:
-            for col in cols:
-                cell = Cell(row, col)
-                coordinates = (row, col)
-                self._cells[coordinates] = cell
+        # the extra last cell is always DEAD, see cell_arrays
+        self._states: bytearray = bytearray(self._rows * self._columns + 1)
+        self._neighbours: bytearray = bytearray(self._rows * self._columns + 1)
+
+    def _cell_at(self, row: int, column: int) -> Cell:
+        """Return Cell view of the cell by coordinates, which are already validated."""
+        return FieldCell(self, row * self._columns + column)
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore pickled field, fields pickled with Cell objects are converted to arrays.
+
+        Args:
+            state (dict): attributes of the pickled field
+        """
+        cells: dict[tuple[int, int], Cell] = state.pop('_cells', None)
+        self.__dict__.update(state)
+        if cells is not None:
+            self._init_cells()
+            for ((row, col), cell) in cells.items():
+                index: int = row * self._columns + col
+                self._states[index] = cell.state.value
+                self._neighbours[index] = cell.neighbours
 
     @property
     def rows(self) -> int:
@@ -62,11 +210,72 @@ class Field:
         return self._columns
 
     @property
-    def all_cells(self) -> dict[tuple[int, int], Cell]:
+    def all_cells(self) -> Mapping[tuple[int, int], Cell]:
         """CELLS property.
 
         Returns:
-            dict[tuple[int, int], FieldCell]: Dictionary with
+            Mapping[tuple[int, int], Cell]: Mapping with
                     all cells and coordinates { (x,y) -> Cell }
         """
-        return self._cells
+        return CellsView(self)
+
+    def cell_arrays(self) -> tuple[bytearray, bytearray]:
+        """Return arrays which keep the cells, changes of the arrays change the field.
+
+        Arrays are row-major and have rows * columns + 1 items: the extra
+        last cell is always DEAD and has no neighbours, it is the sentinel
+        for the neighbours beyond the edges.
+
+        Returns:
+            tuple[bytearray, bytearray]: states (1 - ALIVE, 0 - DEAD) and
+                                         numbers of the ALIVE neighbours
+        """
+        return self._states, self._neighbours
+
+    def with_states(self, states: bytearray) -> 'Field':
+        """Return field over passed states array sharing the neighbours array of this field.
+
+        Args:
+            states (bytearray): array with rows * columns + 1 items, see cell_arrays
+
+        Returns:
+            Field: field of the same size
+        """
+        field: Field = copy.copy(self)
+        field._states = states
+        return field
+
+    def swap_states(self, states: bytearray) -> bytearray:
+        """Replace states array by the array of the same size.
+
+        Cell views read the new array at once, so all states are replaced
+        by one assignment.
+
+        Args:
+            states (bytearray): array with rows * columns + 1 items, see cell_arrays
+
+        Returns:
+            bytearray: the previous states array
+        """
+        previous: bytearray = self._states
+        self._states = states
+        return previous
+
+    def state_buffer(self) -> bytearray:
+        """Return states of all cells as row-major buffer.
+
+        Returns:
+            bytearray: buffer with rows * columns items, 1 - ALIVE, 0 - DEAD
+        """
+        return self._states[:-1]
+
+    def apply_buffers(self, states: bytes, neighbours: bytes) -> None:
+        """Update all cells by row-major buffers.
+
+        Args:
+            states (bytes): states of the cells, 1 - ALIVE, 0 - DEAD
+            neighbours (bytes): number of the alive neighbours of the cells
+        """
+        size: int = self._rows * self._columns
+        self._states[:size] = states
+        self._neighbours[:size] = neighbours
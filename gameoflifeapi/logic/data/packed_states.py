@@ -0,0 +1,46 @@
+"""Defines packing of the row-major cell states into bits.
+
+Packed states take one bit per cell, the first cell is the highest bit of
+the first byte. numpy is used when it is installed, otherwise states are
+packed through the binary digits of the big integer.
+"""
+from gameoflifeapi.logic.engines.numpy_engine import np
+
+_STATES_TO_DIGITS: bytes = bytes.maketrans(b'\x00\x01', b'01')
+_DIGITS_TO_STATES: bytes = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack_states(states: bytes) -> bytes:
+    """Pack row-major cell states into bits, the first cell is the highest bit.
+
+    Args:
+        states (bytes): states of the cells, 1 - ALIVE, 0 - DEAD
+
+    Returns:
+        bytes: ceil(len(states) / 8) bytes
+    """
+    if np is not None:
+        return np.packbits(np.frombuffer(states, dtype=np.uint8)).tobytes()
+    size: int = (len(states) + 7) // 8
+    digits: bytes = bytes(states).translate(_STATES_TO_DIGITS).ljust(size * 8, b'0')
+    return int(digits, 2).to_bytes(size, 'big') if size else b''
+
+
+def unpack_states(payload: bytes, count: int) -> bytes:
+    """Unpack bits created by pack_states.
+
+    Args:
+        payload (bytes): packed states, any buffer (mmap, memoryview) is accepted
+        count (int): number of cells
+
+    Returns:
+        bytes: states of the cells, 1 - ALIVE, 0 - DEAD
+    """
+    size: int = (count + 7) // 8
+    if np is not None:
+        bits = np.frombuffer(payload, dtype=np.uint8, count=size)
+        return np.unpackbits(bits, count=count).tobytes()
+    if not size:
+        return b''
+    value: int = int.from_bytes(payload[:size], 'big')
+    return f'{value:0{size * 8}b}'.encode()[:count].translate(_DIGITS_TO_STATES)
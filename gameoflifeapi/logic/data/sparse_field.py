@@ -0,0 +1,228 @@
+"""Defines Sparse Game Field class which keeps only ALIVE cells."""
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING
+
+from gameoflifeapi.logic.data.cell import Cell
+from gameoflifeapi.logic.data.field import CellsView, Field
+from gameoflifeapi.logic.data.state import CellState
+
+if TYPE_CHECKING:
+    # topology module imports NEIGHBOUR_OFFSETS from this module
+    from gameoflifeapi.logic.topology import Wraparound
+
+NEIGHBOUR_OFFSETS: tuple[tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1)
+)
+
+
+class SparseCell(Cell):
+    """Represent Cell view over the Sparse Field.
+
+    State is read from and written to the set of the ALIVE cells of the
+    field, the number of neighbours is calculated on demand.
+    """
+
+    def __init__(self, field: 'SparseField', row: int, column: int) -> None:
+        """Initialize Cell view.
+
+        Args:
+            field (SparseField): field that owns the cell
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        self._field: SparseField = field
+        self._row: int = row
+        self._column: int = column
+
+    @property
+    def state(self) -> CellState:
+        """STATE property.
+
+        Returns:
+            CellState: state value of the cell
+        """
+        if (self._row, self._column) in self._field.live_cells:
+            return CellState.ALIVE
+        return CellState.DEAD
+
+    @state.setter
+    def state(self, value: CellState) -> None:
+        """Setter for property STATE.
+
+        Args:
+            value (CellState): Value of the state
+
+        Raises:
+            AttributeError: If state is not supported or
+                            value is not correct
+        """
+        if value is CellState.ALIVE:
+            self._field.live_cells.add((self._row, self._column))
+        elif value is CellState.DEAD:
+            self._field.live_cells.discard((self._row, self._column))
+        else:
+            raise AttributeError(f'Passed value is not allowed, {value}')
+
+    @property
+    def neighbours(self) -> int:
+        """NEIGHBOUR property, calculated from the ALIVE cells of the field.
+
+        Returns:
+            int: Number of neighbours
+        """
+        return self._field.count_neighbours(self._row, self._column)
+
+    @neighbours.setter
+    def neighbours(self, value: int) -> None:
+        """Ignore assignment, number of neighbours is always calculated.
+
+        Args:
+            value (int): number of ALIVE neighbours
+        """
+
+
+class SparseField(Field):
+    """Defines Game Field that keeps only coordinates of the ALIVE cells.
+
+    Memory used by the field is proportional to the population instead of
+    the area, Cell objects are created on access to all_cells.
+    """
+
+    def __init__(self, rows: int = 10, columns: int = 10,
+                 live_cells: set[tuple[int, int]] = None,
+                 wraparound: 'Wraparound' = None) -> None:
+        """Initialize Sparse Game Field Object.
+
+        Args:
+            rows (int, optional): Number of rows. Defaults to 10.
+            columns (int, optional): Number of columns. Defaults to 10.
+            live_cells (set[tuple[int, int]], optional): coordinates of ALIVE cells.
+            wraparound (Wraparound, optional): resolves neighbours beyond the edges by
+                                               the topology of the game, cells beyond
+                                               the edges are DEAD if not passed.
+        Raises:
+            GameFieldSizeException: On incorrect size passed
+        """
+        Field.__init__(self, rows, columns)
+        self._wraparound: 'Wraparound' = wraparound
+        if live_cells:
+            self._live_cells.update(live_cells)
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore pickled field, fields pickled without wraparound have bounded edges.
+
+        Args:
+            state (dict): attributes of the pickled field
+        """
+        state.setdefault('_wraparound', None)
+        Field.__setstate__(self, state)
+
+    def _init_cells(self) -> None:
+        self._live_cells: set[tuple[int, int]] = set()
+
+    def _cell_at(self, row: int, column: int) -> Cell:
+        """Return Cell view of the cell by coordinates, which are already validated."""
+        return SparseCell(self, row, column)
+
+    @property
+    def all_cells(self) -> Mapping[tuple[int, int], Cell]:
+        """CELLS property.
+
+        Returns:
+            Mapping[tuple[int, int], Cell]: Mapping with
+                    all cells and coordinates { (x,y) -> Cell }
+        """
+        return CellsView(self)
+
+    def cell_arrays(self) -> tuple[bytearray, bytearray]:
+        """Return new arrays with states and numbers of the ALIVE neighbours of the cells.
+
+        Field keeps only coordinates of the ALIVE cells, so the arrays are
+        created from them and changes of the arrays don't change the field.
+
+        Returns:
+            tuple[bytearray, bytearray]: states (1 - ALIVE, 0 - DEAD) and numbers
+                                         of the ALIVE neighbours, see Field.cell_arrays
+        """
+        columns: int = self._columns
+        states: bytearray = bytearray(self._rows * columns + 1)
+        neighbours: bytearray = bytearray(self._rows * columns + 1)
+        for (row, column) in self._live_cells:
+            states[row * columns + column] = 1
+            for (neighbour_row, neighbour_column) in self._neighbour_coordinates(row, column):
+                neighbours[neighbour_row * columns + neighbour_column] += 1
+        return states, neighbours
+
+    @property
+    def live_cells(self) -> set[tuple[int, int]]:
+        """LIVE CELLS property.
+
+        Returns:
+            set[tuple[int, int]]: coordinates of the ALIVE cells
+        """
+        return self._live_cells
+
+    def count_neighbours(self, row: int, column: int) -> int:
+        """Count ALIVE neighbours of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+
+        Returns:
+            int: number of ALIVE neighbours
+        """
+        live: set[tuple[int, int]] = self._live_cells
+        return sum(1 for coordinates in self._neighbour_coordinates(row, column) if coordinates in live)
+
+    def _neighbour_coordinates(self, row: int, column: int) -> Iterator[tuple[int, int]]:
+        """Yield coordinates of the neighbour cells on the board, resolved by the wraparound."""
+        for (row_diff, col_diff) in NEIGHBOUR_OFFSETS:
+            if self._wraparound is not None:
+                coordinates: tuple[int, int] = self._wraparound.resolve(row + row_diff, column + col_diff)
+                if coordinates is not None:
+                    yield coordinates
+            elif 0 <= row + row_diff < self._rows and 0 <= column + col_diff < self._columns:
+                yield row + row_diff, column + col_diff
+
+    def state_buffer(self) -> bytearray:
+        """Return states of all cells as row-major buffer.
+
+        Returns:
+            bytearray: buffer with rows * columns items, 1 - ALIVE, 0 - DEAD
+        """
+        buffer: bytearray = bytearray(self._rows * self._columns)
+        for (row, col) in self._live_cells:
+            buffer[row * self._columns + col] = 1
+        return buffer
+
+    def apply_buffers(self, states: bytes, neighbours: bytes) -> None:
+        """Update all cells by row-major buffers.
+
+        Args:
+            states (bytes): states of the cells, 1 - ALIVE, 0 - DEAD
+            neighbours (bytes): ignored, neighbours are calculated on demand
+        """
+        self._live_cells.clear()
+        self._live_cells.update(live_cells_from_buffer(states, self._columns))
+
+
+def live_cells_from_buffer(states: bytes, columns: int) -> set[tuple[int, int]]:
+    """Collect coordinates of the ALIVE cells from row-major buffer.
+
+    Args:
+        states (bytes): states of the cells, 1 - ALIVE, 0 - DEAD
+        columns (int): Number of columns
+
+    Returns:
+        set[tuple[int, int]]: coordinates of the ALIVE cells
+    """
+    live_cells: set[tuple[int, int]] = set()
+    states = bytes(states)
+    index: int = states.find(1)
+    while index >= 0:
+        live_cells.add(divmod(index, columns))
+        index = states.find(1, index + 1)
+    return live_cells
@@ -0,0 +1,180 @@
+"""Definition of the abstract Game Engine."""
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology
+
+
+class AbstractEngine(ABC):
+    """Abstract Engine that keeps own board representation and steps it.
+
+    Buffers exchanged with the engine are row-major sequences of bytes
+    with length rows * columns, for states 1 means ALIVE and 0 means DEAD.
+    """
+
+    def __init__(self, rows: int, columns: int, rule: Rule = CONWAY_RULE,
+                 topology: Topology = Topology.BOUNDED) -> None:
+        """Initialize Engine.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+            topology (Topology, optional): Topology of the board.
+                                           Defaults to Topology.BOUNDED.
+        """
+        self._rows: int = rows
+        self._columns: int = columns
+        self._rule: Rule = rule
+        self._topology: Topology = topology
+
+    @property
+    def rows(self) -> int:
+        """Return Number of rows.
+
+        Returns:
+            int: value
+        """
+        return self._rows
+
+    @property
+    def columns(self) -> int:
+        """Return Number of columns.
+
+        Returns:
+            int: value
+        """
+        return self._columns
+
+    @property
+    def rule(self) -> Rule:
+        """Return Rule used to create generations.
+
+        Returns:
+            Rule: value
+        """
+        return self._rule
+
+    @property
+    def topology(self) -> Topology:
+        """Return Topology of the board.
+
+        Returns:
+            Topology: value
+        """
+        return self._topology
+
+    @abstractmethod
+    def load_state_buffer(self, states: bytes) -> None:
+        """Replace the whole board by the passed states.
+
+        Args:
+            states (bytes): row-major states buffer
+        """
+        pass
+
+    @abstractmethod
+    def state_buffer(self) -> bytes:
+        """Return row-major states buffer of the board.
+
+        Returns:
+            bytes: states buffer
+        """
+        pass
+
+    @abstractmethod
+    def neighbours_buffer(self) -> bytes:
+        """Return row-major buffer with number of alive neighbours.
+
+        Returns:
+            bytes: neighbours buffer
+        """
+        pass
+
+    @abstractmethod
+    def is_alive(self, row: int, column: int) -> bool:
+        """Return True if the cell is ALIVE.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        pass
+
+    @abstractmethod
+    def set_alive(self, row: int, column: int, alive: bool) -> None:
+        """Change state of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+            alive (bool): True to make cell ALIVE, False to make it DEAD
+        """
+        pass
+
+    @abstractmethod
+    def step(self) -> None:
+        """Create next generation of the board."""
+        pass
+
+    @abstractmethod
+    def changed_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last step.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        pass
+
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], alive: bool) -> None:
+        """Change state of number of cells at once.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): (row, column) of the cells
+            alive (bool): True to make cells ALIVE, False to make them DEAD
+        """
+        for (row, column) in coordinates:
+            self.set_alive(row, column, alive)
+
+    def advance(self, generations: int) -> None:
+        """Advance board by number of generations.
+
+        Args:
+            generations (int): number of generations
+        """
+        for _ in range(generations):
+            self.step()
+
+    def close(self) -> None:
+        """Release resources of the engine (processes, shared memory)."""
+
+    def create_field(self, field: Field = None) -> Field:
+        """Return field exposed by the game for the board of the engine.
+
+        Args:
+            field (Field, optional): field already loaded into the engine
+
+        Returns:
+            Field: passed field or new Field with the size of the board
+        """
+        if field is not None:
+            return field
+        return Field(self._rows, self._columns)
+
+    def load_field(self, field: Field) -> None:
+        """Load states of all cells from the field.
+
+        Args:
+            field (Field): Game Field
+        """
+        self.load_state_buffer(field.state_buffer())
+
+    def export_to_field(self, field: Field) -> None:
+        """Write states and neighbour numbers of the board to the field.
+
+        Args:
+            field (Field): Game Field
+        """
+        field.apply_buffers(self.state_buffer(), self.neighbours_buffer())
@@ -0,0 +1,277 @@
+"""Definition of the Bit-Board Game Engine.
+
+Whole board is kept in one Python int, one bit per cell. Rows are laid out
+with stride columns + 2: every row has dead ghost cell on the left and on the
+right, and there are dead ghost rows above and below the board, so shifting
+the int by 1 and by the stride never mixes cells of different rows. For
+wrapped topologies ghost cells are filled from the opposite edges by a few
+whole-board mask and shift operations before neighbours are counted.
+"""
+import logging
+from typing import Iterable
+
+from gameoflifeapi.logic.data.sparse_field import live_cells_from_buffer
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology
+
+log: logging.Logger = logging.getLogger(__name__)
+
+_STATE_TO_ASCII: bytes = bytes.maketrans(bytes(range(256)), b'0' + b'1' * 255)
+_ASCII_TO_STATE: bytes = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def _full_adder(first: int, second: int, third: int) -> tuple[int, int]:
+    """Add three bit planes.
+
+    Returns:
+        tuple[int, int]: (sum plane, carry plane)
+    """
+    partial: int = first ^ second
+    return partial ^ third, (first & second) | (partial & third)
+
+
+class BitBoardEngine(AbstractEngine):
+    """Engine that keeps the board bit-packed and steps it by bit-parallel operations.
+
+    Neighbour numbers of all cells are calculated at once by carry-save
+    adder network over 8 shifted copies of the board, which gives 4 bit
+    planes of the count (1, 2, 4 and 8). The rule is applied by masks of
+    cells with exact neighbour numbers decoded from the planes.
+    """
+
+    def __init__(self, rows: int, columns: int, rule: Rule = CONWAY_RULE,
+                 topology: Topology = Topology.BOUNDED) -> None:
+        """Initialize Engine.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+            topology (Topology, optional): Topology of the board.
+                                           Defaults to Topology.BOUNDED.
+        """
+        AbstractEngine.__init__(self, rows, columns, rule, topology)
+        self._stride: int = columns + 2
+        self._size: int = (rows + 2) * self._stride
+        self._board: int = 0
+        self._previous_board: int = 0
+        self._interior: int = self._buffer_to_bits(b'\x01' * (rows * columns))
+        self._row_mask: int = (1 << self._stride) - 1
+        self._first_column: int = 0
+        self._last_column: int = 0
+        if topology.is_wrapped:
+            self._first_column = self._buffer_to_bits((b'\x01' + bytes(columns - 1)) * rows)
+            self._last_column = self._buffer_to_bits((bytes(columns - 1) + b'\x01') * rows)
+        log.debug('BitBoardEngine.__init__: rows=%d, cols=%d', rows, columns)
+
+    @property
+    def board(self) -> int:
+        """Return bit-packed board.
+
+        Returns:
+            int: board, bit (row + 1) * (columns + 2) + column + 1 is the cell state
+        """
+        return self._board
+
+    @property
+    def population(self) -> int:
+        """Return number of the ALIVE cells.
+
+        Returns:
+            int: value
+        """
+        return self._board.bit_count()
+
+    def load_state_buffer(self, states: bytes) -> None:
+        """Replace the whole board by the passed states.
+
+        Args:
+            states (bytes): row-major states buffer
+        """
+        self._board = self._buffer_to_bits(bytes(states))
+        self._previous_board = self._board
+
+    def state_buffer(self) -> bytes:
+        """Return row-major states buffer of the board.
+
+        Returns:
+            bytes: states buffer
+        """
+        return self._bits_to_buffer(self._board)
+
+    def neighbours_buffer(self) -> bytes:
+        """Return row-major buffer with number of alive neighbours.
+
+        Bit planes of the count are combined as base 256 numbers,
+        each byte is lower than 16 so there are no carries between cells.
+
+        Returns:
+            bytes: neighbours buffer
+        """
+        length: int = self._rows * self._columns
+        count: int = 0
+        for (weight, plane) in enumerate(self._count_neighbours()):
+            buffer: bytes = self._bits_to_buffer(plane & self._interior)
+            count += int.from_bytes(buffer, 'little') << weight
+        return count.to_bytes(length, 'little')
+
+    def is_alive(self, row: int, column: int) -> bool:
+        """Return True if the cell is ALIVE.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        return bool(self._board >> self._bit_index(row, column) & 1)
+
+    def set_alive(self, row: int, column: int, alive: bool) -> None:
+        """Change state of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+            alive (bool): True to make cell ALIVE, False to make it DEAD
+        """
+        bit: int = 1 << self._bit_index(row, column)
+        if alive:
+            self._board |= bit
+        else:
+            self._board &= ~bit
+
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], alive: bool) -> None:
+        """Change state of number of cells at once by one mask operation.
+
+        The mask is built from the row-major buffer, so the whole-board int
+        is not shifted and reallocated per cell.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): (row, column) of the cells
+            alive (bool): True to make cells ALIVE, False to make them DEAD
+        """
+        mask_states: bytearray = bytearray(self._rows * self._columns)
+        for (row, column) in coordinates:
+            mask_states[row * self._columns + column] = 1
+        mask: int = self._buffer_to_bits(bytes(mask_states))
+        if alive:
+            self._board |= mask
+        else:
+            self._board &= ~mask
+
+    def step(self) -> None:
+        """Create next generation of the board."""
+        planes: tuple[int, int, int, int] = self._count_neighbours()
+        inverted: tuple[int, ...] = tuple(~plane for plane in planes)
+        counts: dict[int, int] = {}
+
+        def count_mask(number: int) -> int:
+            # cells with exactly number ALIVE neighbours
+            if number not in counts:
+                mask: int = -1
+                for (weight, plane) in enumerate(planes):
+                    mask &= plane if number >> weight & 1 else inverted[weight]
+                counts[number] = mask
+            return counts[number]
+
+        born: int = 0
+        for number in self._rule.birth:
+            born |= count_mask(number)
+        survived: int = 0
+        for number in self._rule.survival:
+            survived |= count_mask(number)
+        self._previous_board = self._board
+        self._board = ((born & ~self._board) | (survived & self._board)) & self._interior
+
+    def changed_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last step.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        return live_cells_from_buffer(self._bits_to_buffer(self._previous_board ^ self._board),
+                                      self._columns)
+
+    def _count_neighbours(self) -> tuple[int, int, int, int]:
+        """Count number of the alive neighbours for all cells at once.
+
+        Returns:
+            tuple[int, int, int, int]: bit planes of the count with weights 1, 2, 4, 8
+        """
+        board: int = self._wrap_ghost_cells(self._board)
+        stride: int = self._stride
+        above: int = board << stride
+        below: int = board >> stride
+        ones_a, twos_a = _full_adder(above << 1, above, above >> 1)
+        ones_b, twos_b = _full_adder(below << 1, below, below >> 1)
+        ones_c: int = (board << 1) ^ (board >> 1)
+        twos_c: int = (board << 1) & (board >> 1)
+        ones, twos_d = _full_adder(ones_a, ones_b, ones_c)
+        twos_partial, fours_a = _full_adder(twos_a, twos_b, twos_c)
+        twos: int = twos_partial ^ twos_d
+        fours_b: int = twos_partial & twos_d
+        return ones, twos, fours_a ^ fours_b, fours_a & fours_b
+
+    def _wrap_ghost_cells(self, board: int) -> int:
+        """Copy edge cells of the wrapped topologies to the ghost cells.
+
+        Ghost columns are filled first, so the ghost rows copied after them
+        get the corner cells too. Klein bottle ghost rows are mirrored.
+
+        Args:
+            board (int): bit-board with DEAD ghost cells
+
+        Returns:
+            int: bit-board with filled ghost cells
+        """
+        if not self._topology.is_wrapped:
+            return board
+        columns: int = self._columns
+        stride: int = self._stride
+        board |= (board & self._last_column) >> columns | (board & self._first_column) << columns
+        top: int = board >> (self._rows * stride) & self._row_mask
+        bottom: int = board >> stride & self._row_mask
+        if self._topology is Topology.KLEIN_BOTTLE:
+            top = int(format(top, f'0{stride}b')[::-1], 2)
+            bottom = int(format(bottom, f'0{stride}b')[::-1], 2)
+        return board | top | bottom << ((self._rows + 1) * stride)
+
+    def _bit_index(self, row: int, column: int) -> int:
+        """Return index of the bit of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        return (row + 1) * self._stride + column + 1
+
+    def _buffer_to_bits(self, states: bytes) -> int:
+        """Pack row-major states buffer into the bit-board.
+
+        Args:
+            states (bytes): row-major states buffer
+
+        Returns:
+            int: bit-board
+        """
+        columns: int = self._columns
+        digits: str = states.translate(_STATE_TO_ASCII).decode('ascii')
+        ghost_row: str = '0' * self._stride
+        padded: str = ''.join(['0' + digits[start:start + columns] + '0'
+                               for start in range(0, len(digits), columns)])
+        return int((ghost_row + padded + ghost_row)[::-1], 2)
+
+    def _bits_to_buffer(self, bits: int) -> bytes:
+        """Unpack bit-board into the row-major states buffer.
+
+        Args:
+            bits (int): bit-board
+
+        Returns:
+            bytes: row-major states buffer
+        """
+        columns: int = self._columns
+        stride: int = self._stride
+        digits: str = format(bits, 'b')[::-1].ljust(self._size, '0')
+        rows: str = ''.join([digits[start:start + columns]
+                             for start in range(stride + 1, stride * (self._rows + 1), stride)])
+        return rows.encode('ascii').translate(_ASCII_TO_STATE)
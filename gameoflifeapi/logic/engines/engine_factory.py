@@ -0,0 +1,94 @@
+"""Defines creation of the Game Engines by their type."""
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.engines.bitboard_engine import BitBoardEngine
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.engines.hashlife_engine import HashLifeEngine
+from gameoflifeapi.logic.engines.numpy_engine import NumpyEngine, np
+from gameoflifeapi.logic.engines.parallel_engine import ParallelEngine
+from gameoflifeapi.logic.engines.sparse_engine import SparseEngine
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology
+
+# shorter jumps of the INFINITE games are faster without HashLife
+HASHLIFE_JUMP_GENERATIONS: int = 2048
+
+
+def create_engine(engine_type: EngineType, rows: int, columns: int,
+                  workers: int = None, rule: Rule = CONWAY_RULE,
+                  topology: Topology = Topology.BOUNDED) -> AbstractEngine:
+    """Create engine of the requested type.
+
+    Args:
+        engine_type (EngineType): Type of the engine
+        rows (int): Number of rows
+        columns (int): Number of columns
+        workers (int, optional): Number of worker processes of the parallel engine.
+                                 Defaults to number of CPUs.
+        rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+        topology (Topology, optional): Topology of the board. Defaults to Topology.BOUNDED.
+
+    Returns:
+        AbstractEngine: engine instance, or None for EngineType.OBJECT, which is
+                        the reference implementation built into GameFlowProcess
+    """
+    if engine_type is EngineType.NUMPY:
+        return NumpyEngine(rows, columns, rule, topology)
+    if engine_type is EngineType.SPARSE:
+        return SparseEngine(rows, columns, rule, topology)
+    if engine_type is EngineType.HASHLIFE:
+        return HashLifeEngine(rows, columns, rule=rule, topology=topology)
+    if engine_type is EngineType.BITBOARD:
+        return BitBoardEngine(rows, columns, rule, topology)
+    if engine_type is EngineType.PARALLEL:
+        return ParallelEngine(rows, columns, workers, rule, topology)
+    return None
+
+
+def is_engine_available(engine_type: EngineType) -> bool:
+    """Check that optional dependencies of the engine are installed.
+
+    Args:
+        engine_type (EngineType): Type of the engine
+
+    Returns:
+        bool: True if engine can be created
+    """
+    if engine_type in (EngineType.NUMPY, EngineType.PARALLEL):
+        return np is not None
+    return True
+
+
+def select_jump_engine_type(engine_type: EngineType, generations: int,
+                            rule: Rule = CONWAY_RULE,
+                            topology: Topology = Topology.BOUNDED) -> EngineType:
+    """Select the fastest engine with the same semantic for the jump.
+
+    HashLife universe is unbounded, so besides the HashLife games it is
+    used only for jumps of at least HASHLIFE_JUMP_GENERATIONS generations of
+    the INFINITE games: bounded and wrapped boards have edges it can't
+    follow, so their long jumps stay per-generation loops of the vectorized
+    engine. The reference object engine hands other jumps over to the
+    vectorized engine (or sparse engine when numpy is not installed,
+    bit-board engine for B0 rules which the sparse engine does not support).
+
+    Args:
+        engine_type (EngineType): Type of the engine of the game
+        generations (int): number of generations of the jump
+        rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+        topology (Topology, optional): Topology of the game. Defaults to Topology.BOUNDED.
+
+    Returns:
+        EngineType: type of the engine which should calculate the jump
+    """
+    if engine_type is EngineType.HASHLIFE or generations <= 1:
+        return engine_type
+    if (topology is Topology.INFINITE and generations >= HASHLIFE_JUMP_GENERATIONS
+            and not rule.is_birth_on_empty):
+        return EngineType.HASHLIFE
+    if engine_type is not EngineType.OBJECT:
+        return engine_type
+    if np is not None:
+        return EngineType.NUMPY
+    if rule.is_birth_on_empty:
+        return EngineType.BITBOARD
+    return EngineType.SPARSE
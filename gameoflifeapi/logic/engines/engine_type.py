@@ -0,0 +1,13 @@
+"""Definition of the available Game Engine Types."""
+import enum
+
+
+class EngineType(enum.Enum):
+    """Represent type of the engine used for creation of generations."""
+
+    OBJECT: str = 'object'
+    NUMPY: str = 'numpy'
+    SPARSE: str = 'sparse'
+    HASHLIFE: str = 'hashlife'
+    BITBOARD: str = 'bitboard'
+    PARALLEL: str = 'parallel'
@@ -0,0 +1,505 @@
+"""Definition of the HashLife Game Engine.
+
+Board is kept as quadtree of canonical (hash-consed) nodes, the result of
+advancing of each node is memoized, so repeated patterns in space and time
+are calculated only once and the engine can jump by 2^k generations at once.
+"""
+import logging
+
+from gameoflifeapi.logic.data.sparse_field import (NEIGHBOUR_OFFSETS,
+                                                   live_cells_from_buffer)
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.exceptions import EngineNotAvailableException
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_NODES: int = 2_000_000
+_MIN_ROOT_LEVEL: int = 3
+
+
+class _Node:
+    """Quadtree node of the level k which represents square 2^k x 2^k.
+
+    Nodes of the level 0 are single cells, other nodes have four children
+    of the level k - 1: nw (top left), ne (top right), sw, se.
+    """
+
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population')
+
+    def __init__(self, level: int, nw: '_Node', ne: '_Node', sw: '_Node', se: '_Node',
+                 population: int) -> None:
+        self.level: int = level
+        self.nw: _Node = nw
+        self.ne: _Node = ne
+        self.sw: _Node = sw
+        self.se: _Node = se
+        self.population: int = population
+
+
+_DEAD_LEAF: _Node = _Node(0, None, None, None, None, 0)
+_ALIVE_LEAF: _Node = _Node(0, None, None, None, None, 1)
+
+
+class HashLifeEngine(AbstractEngine):
+    """Engine that advances unbounded universe by HashLife algorithm.
+
+    Unlike other engines the universe has no edges: the field is a window
+    with top left corner at (0, 0), cells outside the window keep living.
+    Node cache is bounded by max_nodes, when it is exceeded all caches are
+    dropped and the current board is rebuilt from its ALIVE cells.
+    Rules with B0 fill the infinite empty universe and are not supported,
+    as well as wrapped topologies. Topology of the engine is always INFINITE,
+    BOUNDED board is accepted and reported as INFINITE, because cells don't
+    die at the edges of the window.
+    """
+
+    def __init__(self, rows: int, columns: int, max_nodes: int = DEFAULT_MAX_NODES,
+                 rule: Rule = CONWAY_RULE, topology: Topology = Topology.INFINITE) -> None:
+        """Initialize Engine.
+
+        Args:
+            rows (int): Number of rows of the window
+            columns (int): Number of columns of the window
+            max_nodes (int, optional): Maximal number of cached nodes.
+                                       Defaults to DEFAULT_MAX_NODES.
+            rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+            topology (Topology, optional): Topology of the board, BOUNDED is replaced
+                                           by INFINITE. Defaults to Topology.INFINITE.
+
+        Raises:
+            EngineNotAvailableException: If the rule has B0 or the topology is wrapped
+        """
+        if rule.is_birth_on_empty:
+            raise EngineNotAvailableException(f'HashLife engine does not support rule {rule} (B0)')
+        if topology.is_wrapped:
+            raise EngineNotAvailableException(f'HashLife engine does not support {topology.value} topology')
+        AbstractEngine.__init__(self, rows, columns, rule, Topology.INFINITE)
+        self._max_nodes: int = max_nodes
+        self._nodes: dict[tuple[int, int, int, int], _Node] = {}
+        self._results: dict[tuple[int, int], _Node] = {}
+        self._empty_nodes: dict[int, _Node] = {}
+        self._root: _Node = self._empty(_MIN_ROOT_LEVEL)
+        self._origin: tuple[int, int] = (0, 0)
+        self._previous_state: tuple[_Node, tuple[int, int]] = (self._root, self._origin)
+        log.debug('HashLifeEngine.__init__: rows=%d, cols=%d, max_nodes=%d',
+                  rows, columns, max_nodes)
+
+    @property
+    def node_count(self) -> int:
+        """Return number of the cached canonical nodes.
+
+        Returns:
+            int: value
+        """
+        return len(self._nodes)
+
+    @property
+    def population(self) -> int:
+        """Return number of the ALIVE cells in the whole universe.
+
+        Returns:
+            int: value
+        """
+        return self._root.population
+
+    def live_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of the ALIVE cells in the whole universe.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        cells: set[tuple[int, int]] = set()
+        self._collect_cells(self._root, self._origin[0], self._origin[1], None, cells)
+        return cells
+
+    def load_state_buffer(self, states: bytes) -> None:
+        """Replace the whole universe by the passed states of the window.
+
+        Args:
+            states (bytes): row-major states buffer
+        """
+        self.load_live_cells(live_cells_from_buffer(states, self._columns))
+
+    def load_live_cells(self, cells: set[tuple[int, int]]) -> None:
+        """Replace the whole universe by the passed ALIVE cells.
+
+        Args:
+            cells (set[tuple[int, int]]): coordinates of the ALIVE cells
+        """
+        if not cells:
+            self._root = self._empty(_MIN_ROOT_LEVEL)
+            self._origin = (0, 0)
+            self._previous_state = (self._root, self._origin)
+            return
+        min_row: int = min(row for (row, _col) in cells)
+        min_col: int = min(col for (_row, col) in cells)
+        extent: int = max(max(row for (row, _col) in cells) - min_row,
+                          max(col for (_row, col) in cells) - min_col) + 1
+        level: int = max(_MIN_ROOT_LEVEL, (extent - 1).bit_length())
+        nodes: dict[tuple[int, int], _Node] = {
+            (row - min_row, col - min_col): _ALIVE_LEAF for (row, col) in cells
+        }
+        for child_level in range(level):
+            empty: _Node = self._empty(child_level)
+            parents: dict[tuple[int, int], _Node] = {}
+            for (row, col) in {(row >> 1, col >> 1) for (row, col) in nodes}:
+                parents[(row, col)] = self._join(
+                    nodes.get((row << 1, col << 1), empty),
+                    nodes.get((row << 1, (col << 1) + 1), empty),
+                    nodes.get(((row << 1) + 1, col << 1), empty),
+                    nodes.get(((row << 1) + 1, (col << 1) + 1), empty))
+            nodes = parents
+        self._root = nodes[(0, 0)]
+        self._origin = (min_row, min_col)
+        self._previous_state = (self._root, self._origin)
+
+    def state_buffer(self) -> bytes:
+        """Return row-major states buffer of the window.
+
+        Returns:
+            bytes: states buffer
+        """
+        buffer: bytearray = bytearray(self._rows * self._columns)
+        for (row, col) in self._window_cells(0):
+            buffer[row * self._columns + col] = 1
+        return bytes(buffer)
+
+    def neighbours_buffer(self) -> bytes:
+        """Return row-major buffer with number of alive neighbours in the window.
+
+        Returns:
+            bytes: neighbours buffer
+        """
+        buffer: bytearray = bytearray(self._rows * self._columns)
+        for (row, col) in self._window_cells(1):
+            for (row_diff, col_diff) in NEIGHBOUR_OFFSETS:
+                neighbour_row: int = row + row_diff
+                neighbour_col: int = col + col_diff
+                if 0 <= neighbour_row < self._rows and 0 <= neighbour_col < self._columns:
+                    buffer[neighbour_row * self._columns + neighbour_col] += 1
+        return bytes(buffer)
+
+    def is_alive(self, row: int, column: int) -> bool:
+        """Return True if the cell is ALIVE.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        node: _Node = self._root
+        row -= self._origin[0]
+        column -= self._origin[1]
+        size: int = 1 << node.level
+        if not (0 <= row < size and 0 <= column < size):
+            return False
+        while node.level > 0 and node.population:
+            half: int = 1 << (node.level - 1)
+            if row < half:
+                node = node.nw if column < half else node.ne
+            else:
+                node = node.sw if column < half else node.se
+            row &= half - 1
+            column &= half - 1
+        return node.population == 1 and node.level == 0
+
+    def set_alive(self, row: int, column: int, alive: bool) -> None:
+        """Change state of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+            alive (bool): True to make cell ALIVE, False to make it DEAD
+        """
+        while True:
+            size: int = 1 << self._root.level
+            local_row: int = row - self._origin[0]
+            local_col: int = column - self._origin[1]
+            if 0 <= local_row < size and 0 <= local_col < size:
+                break
+            self._centre_root()
+        self._root = self._set_cell(self._root, local_row, local_col, alive)
+
+    def step(self) -> None:
+        """Create next generation of the universe."""
+        self.advance(1)
+
+    def changed_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of cells of the window which changed state in the last step.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        previous_root, previous_origin = self._previous_state
+        window: tuple[int, int, int, int] = (0, 0, self._rows, self._columns)
+        previous_cells: set[tuple[int, int]] = set()
+        self._collect_cells(previous_root, previous_origin[0], previous_origin[1],
+                            window, previous_cells)
+        return previous_cells ^ self._window_cells(0)
+
+    def advance(self, generations: int) -> None:
+        """Advance universe by number of generations.
+
+        The jump is split into powers of two, each of them is calculated
+        by single memoized RESULT computation of the padded root node.
+
+        Args:
+            generations (int): number of generations
+        """
+        self._previous_state = (self._root, self._origin)
+        power: int = generations.bit_length() - 1
+        while power >= 0:
+            if generations >> power & 1:
+                self._advance_power_of_two(power)
+                self._collect_garbage()
+            power -= 1
+
+    def _advance_power_of_two(self, power: int) -> None:
+        """Advance universe by 2^power generations.
+
+        Root is padded until ALIVE cells lie in its central quarter, so they can't
+        leave the central half (the RESULT) during 2^power generations.
+
+        Args:
+            power (int): power of two
+        """
+        while self._root.level < power + 3 or not self._is_padded(self._root):
+            self._centre_root()
+        quarter: int = 1 << (self._root.level - 2)
+        self._root = self._successor(self._root, power)
+        self._origin = (self._origin[0] + quarter, self._origin[1] + quarter)
+
+    def _successor(self, node: _Node, power: int) -> _Node:
+        """Calculate RESULT of the node: its centre advanced by 2^power generations.
+
+        Args:
+            node (_Node): node of the level k >= 2
+            power (int): power of two, should be <= k - 2
+
+        Returns:
+            _Node: node of the level k - 1
+        """
+        if node.population == 0:
+            return node.nw
+        key: tuple[int, int] = (id(node), power)
+        result: _Node = self._results.get(key)
+        if result is not None:
+            return result
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            join = self._join
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            n00 = nw
+            n01 = join(nw.ne, ne.nw, nw.se, ne.sw)
+            n02 = ne
+            n10 = join(nw.sw, nw.se, sw.nw, sw.ne)
+            n11 = join(nw.se, ne.sw, sw.ne, se.nw)
+            n12 = join(ne.sw, ne.se, se.nw, se.ne)
+            n20 = sw
+            n21 = join(sw.ne, se.nw, sw.se, se.sw)
+            n22 = se
+            if power == node.level - 2:
+                step: int = power - 1
+                c00, c01, c02 = (self._successor(n00, step), self._successor(n01, step),
+                                 self._successor(n02, step))
+                c10, c11, c12 = (self._successor(n10, step), self._successor(n11, step),
+                                 self._successor(n12, step))
+                c20, c21, c22 = (self._successor(n20, step), self._successor(n21, step),
+                                 self._successor(n22, step))
+                result = join(self._successor(join(c00, c01, c10, c11), step),
+                              self._successor(join(c01, c02, c11, c12), step),
+                              self._successor(join(c10, c11, c20, c21), step),
+                              self._successor(join(c11, c12, c21, c22), step))
+            else:
+                c00, c01, c02 = (self._successor(n00, power), self._successor(n01, power),
+                                 self._successor(n02, power))
+                c10, c11, c12 = (self._successor(n10, power), self._successor(n11, power),
+                                 self._successor(n12, power))
+                c20, c21, c22 = (self._successor(n20, power), self._successor(n21, power),
+                                 self._successor(n22, power))
+                result = join(self._centre_of(join(c00, c01, c10, c11)),
+                              self._centre_of(join(c01, c02, c11, c12)),
+                              self._centre_of(join(c10, c11, c20, c21)),
+                              self._centre_of(join(c11, c12, c21, c22)))
+        self._results[key] = result
+        return result
+
+    def _life_4x4(self, node: _Node) -> _Node:
+        """Calculate next generation of the central 2x2 cells of the 4x4 node.
+
+        Args:
+            node (_Node): node of the level 2
+
+        Returns:
+            _Node: node of the level 1
+        """
+        grid: tuple[tuple[int, ...], ...] = (
+            (node.nw.nw.population, node.nw.ne.population, node.ne.nw.population, node.ne.ne.population),
+            (node.nw.sw.population, node.nw.se.population, node.ne.sw.population, node.ne.se.population),
+            (node.sw.nw.population, node.sw.ne.population, node.se.nw.population, node.se.ne.population),
+            (node.sw.sw.population, node.sw.se.population, node.se.sw.population, node.se.se.population),
+        )
+        lookup: bytes = self._rule.lookup
+        leaves: list[_Node] = []
+        for (row, col) in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            count: int = sum(grid[row + row_diff][col + col_diff]
+                             for (row_diff, col_diff) in NEIGHBOUR_OFFSETS)
+            alive: int = lookup[grid[row][col] * 9 + count]
+            leaves.append(_ALIVE_LEAF if alive else _DEAD_LEAF)
+        return self._join(*leaves)
+
+    def _join(self, nw: _Node, ne: _Node, sw: _Node, se: _Node) -> _Node:
+        """Return canonical node with passed children.
+
+        Args:
+            nw (_Node): top left child
+            ne (_Node): top right child
+            sw (_Node): bottom left child
+            se (_Node): bottom right child
+
+        Returns:
+            _Node: node of the next level
+        """
+        key: tuple[int, int, int, int] = (id(nw), id(ne), id(sw), id(se))
+        node: _Node = self._nodes.get(key)
+        if node is None:
+            node = _Node(nw.level + 1, nw, ne, sw, se,
+                         nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _empty(self, level: int) -> _Node:
+        """Return canonical node of the level without ALIVE cells.
+
+        Args:
+            level (int): level of the node
+
+        Returns:
+            _Node: empty node
+        """
+        node: _Node = self._empty_nodes.get(level)
+        if node is None:
+            if level == 0:
+                node = _DEAD_LEAF
+            else:
+                child: _Node = self._empty(level - 1)
+                node = self._join(child, child, child, child)
+            self._empty_nodes[level] = node
+        return node
+
+    def _centre_of(self, node: _Node) -> _Node:
+        """Return central part of the node.
+
+        Args:
+            node (_Node): node of the level k >= 2
+
+        Returns:
+            _Node: node of the level k - 1
+        """
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _centre_root(self) -> None:
+        """Put root into the centre of the empty node of the next level."""
+        root: _Node = self._root
+        empty: _Node = self._empty(root.level - 1)
+        self._root = self._join(self._join(empty, empty, empty, root.nw),
+                                self._join(empty, empty, root.ne, empty),
+                                self._join(empty, root.sw, empty, empty),
+                                self._join(root.se, empty, empty, empty))
+        half: int = 1 << (root.level - 1)
+        self._origin = (self._origin[0] - half, self._origin[1] - half)
+
+    def _is_padded(self, node: _Node) -> bool:
+        """Return True if all ALIVE cells are in the central quarter of the node.
+
+        Args:
+            node (_Node): node of the level k >= 3
+        """
+        return node.population == (node.nw.se.se.population + node.ne.sw.sw.population
+                                   + node.sw.ne.ne.population + node.se.nw.nw.population)
+
+    def _set_cell(self, node: _Node, row: int, column: int, alive: bool) -> _Node:
+        """Return copy of the node with changed cell.
+
+        Args:
+            node (_Node): node
+            row (int): ROW coordinate inside node
+            column (int): COLUMN coordinate inside node
+            alive (bool): new state of the cell
+
+        Returns:
+            _Node: canonical node
+        """
+        if node.level == 0:
+            return _ALIVE_LEAF if alive else _DEAD_LEAF
+        half: int = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if row < half:
+            if column < half:
+                nw = self._set_cell(nw, row, column, alive)
+            else:
+                ne = self._set_cell(ne, row, column - half, alive)
+        elif column < half:
+            sw = self._set_cell(sw, row - half, column, alive)
+        else:
+            se = self._set_cell(se, row - half, column - half, alive)
+        return self._join(nw, ne, sw, se)
+
+    def _window_cells(self, margin: int) -> set[tuple[int, int]]:
+        """Return ALIVE cells of the window expanded by margin.
+
+        Args:
+            margin (int): number of cells around the window
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        window: tuple[int, int, int, int] = (-margin, -margin,
+                                             self._rows + margin, self._columns + margin)
+        cells: set[tuple[int, int]] = set()
+        self._collect_cells(self._root, self._origin[0], self._origin[1], window, cells)
+        return cells
+
+    def _collect_cells(self, node: _Node, row: int, column: int,
+                       window: tuple[int, int, int, int],
+                       cells: set[tuple[int, int]]) -> None:
+        """Collect ALIVE cells of the node.
+
+        Args:
+            node (_Node): node
+            row (int): ROW coordinate of the top left corner of the node
+            column (int): COLUMN coordinate of the top left corner of the node
+            window (tuple[int, int, int, int]): (top, left, bottom, right) bounds,
+                                                None to collect all cells
+            cells (set[tuple[int, int]]): result
+        """
+        if node.population == 0:
+            return
+        size: int = 1 << node.level
+        if window is not None:
+            top, left, bottom, right = window
+            if row >= bottom or column >= right or row + size <= top or column + size <= left:
+                return
+        if node.level == 0:
+            cells.add((row, column))
+            return
+        half: int = size >> 1
+        self._collect_cells(node.nw, row, column, window, cells)
+        self._collect_cells(node.ne, row, column + half, window, cells)
+        self._collect_cells(node.sw, row + half, column, window, cells)
+        self._collect_cells(node.se, row + half, column + half, window, cells)
+
+    def _collect_garbage(self) -> None:
+        """Drop all caches if number of nodes exceeds the limit."""
+        if len(self._nodes) <= self._max_nodes:
+            return
+        log.debug('HashLifeEngine._collect_garbage: nodes=%d', len(self._nodes))
+        cells: set[tuple[int, int]] = self.live_cells()
+        previous_state: tuple[_Node, tuple[int, int]] = self._previous_state
+        self._nodes.clear()
+        self._results.clear()
+        self._empty_nodes.clear()
+        self.load_live_cells(cells)
+        self._previous_state = previous_state
@@ -0,0 +1,211 @@
+"""Definition of the vectorized NumPy Game Engine."""
+import logging
+from typing import Iterable
+
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.exceptions import EngineNotAvailableException
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology, Wraparound
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+def count_padded_neighbours(padded):
+    """Count number of the alive neighbours for every cell of the padded board.
+
+    Args:
+        padded (numpy.ndarray): board with one ghost cell on every side
+
+    Returns:
+        numpy.ndarray: neighbours numbers of the inner cells (uint8)
+    """
+    vertical = padded[:-2] + padded[1:-1] + padded[2:]
+    box = vertical[:, :-2] + vertical[:, 1:-1] + vertical[:, 2:]
+    return box - padded[1:-1, 1:-1]
+
+
+def rule_lookup(rule: Rule):
+    """Convert flat lookup table of the rule to array.
+
+    Args:
+        rule (Rule): rule of the game
+
+    Returns:
+        numpy.ndarray: lookup[state * 9 + neighbours] -> next state (uint8)
+    """
+    return np.frombuffer(rule.lookup, dtype=np.uint8)
+
+
+def next_states(cells, counts, lookup):
+    """Apply rules to the cells by one lookup of the whole board.
+
+    Args:
+        cells (numpy.ndarray): states of the cells
+        counts (numpy.ndarray): neighbours numbers of the cells
+        lookup (numpy.ndarray): table created by rule_lookup
+
+    Returns:
+        numpy.ndarray: states of the next generation (uint8)
+    """
+    index = cells * np.uint8(9)
+    index += counts
+    return lookup[index]
+
+
+def ghost_index_arrays(wraparound: Wraparound) -> tuple:
+    """Convert ghost cell indices of the padded board to arrays.
+
+    Args:
+        wraparound (Wraparound): wraparound indices of the board
+
+    Returns:
+        tuple: flat indices of the ghost cells and of their sources (intp),
+               None for the bounded topologies
+    """
+    targets, sources = wraparound.padded_ghost_indices()
+    if not targets:
+        return None, None
+    return np.array(targets, dtype=np.intp), np.array(sources, dtype=np.intp)
+
+
+def fill_ghost_cells(padded, targets, sources) -> None:
+    """Copy edge cells of the padded board to the ghost cells.
+
+    Args:
+        padded (numpy.ndarray): board with one ghost cell on every side
+        targets (numpy.ndarray): flat indices of the ghost cells or None
+        sources (numpy.ndarray): flat indices of the source cells or None
+    """
+    if targets is not None:
+        flat = padded.reshape(-1)
+        flat[targets] = flat[sources]
+
+
+class NumpyEngine(AbstractEngine):
+    """Engine that keeps the board in uint8 array and steps it by whole-array operations.
+
+    Neighbour numbers are calculated as the 3x3 box sum of the padded board
+    (separable: 3 vertical and 3 horizontal slices) minus the cell itself.
+    Ghost cells of the padded board are zero or, for wrapped topologies,
+    copied from the opposite edges by precomputed indices.
+    """
+
+    def __init__(self, rows: int, columns: int, rule: Rule = CONWAY_RULE,
+                 topology: Topology = Topology.BOUNDED) -> None:
+        """Initialize Engine.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+            topology (Topology, optional): Topology of the board.
+                                           Defaults to Topology.BOUNDED.
+
+        Raises:
+            EngineNotAvailableException: If numpy is not installed
+        """
+        if np is None:
+            raise EngineNotAvailableException('NumPy engine requires numpy package to be installed')
+        AbstractEngine.__init__(self, rows, columns, rule, topology)
+        self._lookup = rule_lookup(rule)
+        self._ghost_targets, self._ghost_sources = ghost_index_arrays(Wraparound(topology, rows, columns))
+        self._cells = np.zeros((rows, columns), dtype=np.uint8)
+        self._previous_cells = self._cells
+        self._padded = np.zeros((rows + 2, columns + 2), dtype=np.uint8)
+        log.debug('NumpyEngine.__init__: rows=%d, cols=%d', rows, columns)
+
+    @property
+    def cells(self):
+        """Return board array (rows x columns, uint8).
+
+        Returns:
+            numpy.ndarray: board
+        """
+        return self._cells
+
+    def load_state_buffer(self, states: bytes) -> None:
+        """Replace the whole board by the passed states.
+
+        Args:
+            states (bytes): row-major states buffer
+        """
+        board = np.frombuffer(states, dtype=np.uint8).reshape(self._rows, self._columns)
+        self._cells = (board != 0).astype(np.uint8)
+        self._previous_cells = self._cells
+
+    def state_buffer(self) -> bytes:
+        """Return row-major states buffer of the board.
+
+        Returns:
+            bytes: states buffer
+        """
+        return self._cells.tobytes()
+
+    def neighbours_buffer(self) -> bytes:
+        """Return row-major buffer with number of alive neighbours.
+
+        Returns:
+            bytes: neighbours buffer
+        """
+        return self._count_neighbours().tobytes()
+
+    def is_alive(self, row: int, column: int) -> bool:
+        """Return True if the cell is ALIVE.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        return bool(self._cells[row, column])
+
+    def set_alive(self, row: int, column: int, alive: bool) -> None:
+        """Change state of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+            alive (bool): True to make cell ALIVE, False to make it DEAD
+        """
+        self._cells[row, column] = 1 if alive else 0
+
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], alive: bool) -> None:
+        """Change state of number of cells at once by one fancy-indexed assignment.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): (row, column) of the cells
+            alive (bool): True to make cells ALIVE, False to make them DEAD
+        """
+        cells: list[tuple[int, int]] = list(coordinates)
+        if cells:
+            rows, columns = zip(*cells)
+            self._cells[list(rows), list(columns)] = 1 if alive else 0
+
+    def step(self) -> None:
+        """Create next generation of the board."""
+        counts = self._count_neighbours()
+        self._previous_cells = self._cells
+        self._cells = next_states(self._cells, counts, self._lookup)
+
+    def changed_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last step.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        rows, columns = np.nonzero(self._previous_cells != self._cells)
+        return set(zip(rows.tolist(), columns.tolist()))
+
+    def _count_neighbours(self):
+        """Count number of the alive neighbours for every cell.
+
+        Returns:
+            numpy.ndarray: neighbours numbers (rows x columns, uint8)
+        """
+        self._padded[1:-1, 1:-1] = self._cells
+        fill_ghost_cells(self._padded, self._ghost_targets, self._ghost_sources)
+        return count_padded_neighbours(self._padded)
@@ -0,0 +1,222 @@
+"""Definition of the multi-process Game Engine.
+
+Board is kept in two padded buffers placed in shared memory: the current
+generation and the next one. The board is split into horizontal stripes,
+every worker process reads its stripe together with one halo row above
+and below it from the current buffer and writes the stripe to the next
+buffer. When all stripes are done the buffers are swapped, so the halo
+rows written by the neighbour stripes are exchanged through the shared
+memory without copying. For wrapped topologies ghost cells of the current
+buffer are filled from the opposite edges before the workers start.
+"""
+import logging
+import multiprocessing
+import os
+import weakref
+from multiprocessing import shared_memory
+from typing import Iterable
+
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.engines.numpy_engine import (count_padded_neighbours,
+                                                      fill_ghost_cells,
+                                                      ghost_index_arrays,
+                                                      next_states, np)
+from gameoflifeapi.logic.exceptions import EngineNotAvailableException
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology, Wraparound
+
+log: logging.Logger = logging.getLogger(__name__)
+
+_worker_boards: list = []
+_worker_memory: list[shared_memory.SharedMemory] = []
+_worker_lookup: list = []
+
+
+def _attach_worker(names: tuple[str, str], shape: tuple[int, int], lookup: bytes) -> None:
+    """Attach worker process to the shared buffers.
+
+    Args:
+        names (tuple[str, str]): names of the shared memory blocks
+        shape (tuple[int, int]): shape of the padded board
+        lookup (bytes): flat lookup table of the rule
+    """
+    _worker_lookup.append(np.frombuffer(lookup, dtype=np.uint8))
+    for name in names:
+        memory: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+        _worker_memory.append(memory)
+        _worker_boards.append(np.ndarray(shape, dtype=np.uint8, buffer=memory.buf))
+
+
+def _step_stripe(task: tuple[int, int, int]) -> None:
+    """Calculate next generation of the stripe of rows.
+
+    Args:
+        task (tuple[int, int, int]): index of the current buffer,
+                                     first row and end row of the stripe
+    """
+    current, start, end = task
+    source = _worker_boards[current]
+    target = _worker_boards[1 - current]
+    block = source[start:end + 2]
+    target[start + 1:end + 1, 1:-1] = next_states(block[1:-1, 1:-1], count_padded_neighbours(block),
+                                                  _worker_lookup[0])
+
+
+def _release(pool, memory_blocks: list[shared_memory.SharedMemory]) -> None:
+    """Stop workers and free shared memory.
+
+    Args:
+        pool (multiprocessing.pool.Pool): workers
+        memory_blocks (list[shared_memory.SharedMemory]): shared memory blocks
+    """
+    pool.terminate()
+    pool.join()
+    for memory in memory_blocks:
+        memory.close()
+        memory.unlink()
+
+
+class ParallelEngine(AbstractEngine):
+    """Engine that steps horizontal stripes of the board in worker processes.
+
+    Engine owns a process pool and shared memory, call close() when the
+    engine is not needed anymore (it is also done on garbage collection).
+    """
+
+    def __init__(self, rows: int, columns: int, workers: int = None, rule: Rule = CONWAY_RULE,
+                 topology: Topology = Topology.BOUNDED) -> None:
+        """Initialize Engine.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            workers (int, optional): Number of worker processes.
+                                     Defaults to number of CPUs.
+            rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+            topology (Topology, optional): Topology of the board.
+                                           Defaults to Topology.BOUNDED.
+
+        Raises:
+            EngineNotAvailableException: If numpy is not installed
+        """
+        if np is None:
+            raise EngineNotAvailableException('Parallel engine requires numpy package to be installed')
+        AbstractEngine.__init__(self, rows, columns, rule, topology)
+        self._ghost_targets, self._ghost_sources = ghost_index_arrays(Wraparound(topology, rows, columns))
+        self._workers: int = max(1, min(workers or os.cpu_count() or 1, rows))
+        shape: tuple[int, int] = (rows + 2, columns + 2)
+        self._memory: list[shared_memory.SharedMemory] = [
+            shared_memory.SharedMemory(create=True, size=shape[0] * shape[1]) for _ in range(2)
+        ]
+        self._boards: list = [np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+                              for memory in self._memory]
+        for board in self._boards:
+            board.fill(0)
+        self._current: int = 0
+        self._pool = multiprocessing.Pool(self._workers, _attach_worker,
+                                          (tuple(memory.name for memory in self._memory), shape, rule.lookup))
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._memory)
+        stripe: int = -(-rows // self._workers)
+        self._stripes: list[tuple[int, int]] = [(start, min(start + stripe, rows))
+                                                for start in range(0, rows, stripe)]
+        log.debug('ParallelEngine.__init__: rows=%d, cols=%d, workers=%d',
+                  rows, columns, self._workers)
+
+    @property
+    def workers(self) -> int:
+        """Return number of worker processes.
+
+        Returns:
+            int: value
+        """
+        return self._workers
+
+    @property
+    def cells(self):
+        """Return view of the current board (rows x columns, uint8).
+
+        Returns:
+            numpy.ndarray: board
+        """
+        return self._boards[self._current][1:-1, 1:-1]
+
+    def close(self) -> None:
+        """Stop worker processes and free shared memory."""
+        self._finalizer()
+
+    def load_state_buffer(self, states: bytes) -> None:
+        """Replace the whole board by the passed states.
+
+        Args:
+            states (bytes): row-major states buffer
+        """
+        board = np.frombuffer(states, dtype=np.uint8).reshape(self._rows, self._columns)
+        for padded in self._boards:
+            padded[1:-1, 1:-1] = board != 0
+
+    def state_buffer(self) -> bytes:
+        """Return row-major states buffer of the board.
+
+        Returns:
+            bytes: states buffer
+        """
+        return self.cells.tobytes()
+
+    def neighbours_buffer(self) -> bytes:
+        """Return row-major buffer with number of alive neighbours.
+
+        Returns:
+            bytes: neighbours buffer
+        """
+        board = self._boards[self._current]
+        fill_ghost_cells(board, self._ghost_targets, self._ghost_sources)
+        return count_padded_neighbours(board).tobytes()
+
+    def is_alive(self, row: int, column: int) -> bool:
+        """Return True if the cell is ALIVE.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        return bool(self._boards[self._current][row + 1, column + 1])
+
+    def set_alive(self, row: int, column: int, alive: bool) -> None:
+        """Change state of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+            alive (bool): True to make cell ALIVE, False to make it DEAD
+        """
+        self._boards[self._current][row + 1, column + 1] = 1 if alive else 0
+
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], alive: bool) -> None:
+        """Change state of number of cells at once by one fancy-indexed assignment.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): (row, column) of the cells
+            alive (bool): True to make cells ALIVE, False to make them DEAD
+        """
+        cells: list[tuple[int, int]] = list(coordinates)
+        if cells:
+            rows, columns = zip(*cells)
+            self._boards[self._current][[row + 1 for row in rows], [column + 1 for column in columns]] = \
+                1 if alive else 0
+
+    def step(self) -> None:
+        """Create next generation of the board, stripes are calculated in parallel."""
+        current: int = self._current
+        fill_ghost_cells(self._boards[current], self._ghost_targets, self._ghost_sources)
+        self._pool.map(_step_stripe, [(current, start, end) for (start, end) in self._stripes])
+        self._current = 1 - current
+
+    def changed_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last step.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        previous = self._boards[1 - self._current][1:-1, 1:-1]
+        rows, columns = np.nonzero(previous != self.cells)
+        return set(zip(rows.tolist(), columns.tolist()))
@@ -0,0 +1,212 @@
+"""Definition of the Sparse Game Engine which processes only ALIVE cells."""
+import logging
+from collections import Counter
+from typing import Iterable
+
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.sparse_field import (NEIGHBOUR_OFFSETS,
+                                                   SparseField,
+                                                   live_cells_from_buffer)
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.exceptions import EngineNotAvailableException
+from gameoflifeapi.logic.rules import CONWAY_RULE, Rule
+from gameoflifeapi.logic.topology import Topology, Wraparound
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class SparseEngine(AbstractEngine):
+    """Engine that keeps only coordinates of the ALIVE cells.
+
+    Neighbour numbers are counted per step only around ALIVE cells,
+    so the step cost is proportional to the population instead of the area.
+    Rules with B0 make the whole empty area ALIVE and are not supported.
+    """
+
+    def __init__(self, rows: int, columns: int, rule: Rule = CONWAY_RULE,
+                 topology: Topology = Topology.BOUNDED) -> None:
+        """Initialize Engine.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            rule (Rule, optional): Rule of the game. Defaults to CONWAY_RULE.
+            topology (Topology, optional): Topology of the board.
+                                           Defaults to Topology.BOUNDED.
+
+        Raises:
+            EngineNotAvailableException: If the rule has B0
+        """
+        if rule.is_birth_on_empty:
+            raise EngineNotAvailableException(f'Sparse engine does not support rule {rule} (B0)')
+        AbstractEngine.__init__(self, rows, columns, rule, topology)
+        self._wraparound: Wraparound = Wraparound(topology, rows, columns)
+        self._field: SparseField = SparseField(rows, columns, wraparound=self._wraparound)
+        self._previous_live_cells: set[tuple[int, int]] = set()
+        log.debug('SparseEngine.__init__: rows=%d, cols=%d', rows, columns)
+
+    @property
+    def live_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of the ALIVE cells.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        return self._field.live_cells
+
+    def create_field(self, field: Field = None) -> Field:
+        """Return Sparse Field which shares ALIVE cells with the engine.
+
+        Args:
+            field (Field, optional): ignored, the engine always exposes own field
+
+        Returns:
+            Field: Sparse Field of the engine
+        """
+        return self._field
+
+    def load_field(self, field: Field) -> None:
+        """Load states of all cells from the field.
+
+        Args:
+            field (Field): Game Field
+        """
+        if isinstance(field, SparseField):
+            self._replace_live_cells(set(field.live_cells))
+        else:
+            AbstractEngine.load_field(self, field)
+
+    def export_to_field(self, field: Field) -> None:
+        """Write states of the board to the field.
+
+        Args:
+            field (Field): Game Field
+        """
+        if field is not self._field:
+            AbstractEngine.export_to_field(self, field)
+
+    def load_state_buffer(self, states: bytes) -> None:
+        """Replace the whole board by the passed states.
+
+        Args:
+            states (bytes): row-major states buffer
+        """
+        self._replace_live_cells(live_cells_from_buffer(states, self._columns))
+
+    def state_buffer(self) -> bytes:
+        """Return row-major states buffer of the board.
+
+        Returns:
+            bytes: states buffer
+        """
+        return bytes(self._field.state_buffer())
+
+    def neighbours_buffer(self) -> bytes:
+        """Return row-major buffer with number of alive neighbours.
+
+        Returns:
+            bytes: neighbours buffer
+        """
+        buffer: bytearray = bytearray(self._rows * self._columns)
+        for ((row, col), count) in self._count_neighbours().items():
+            buffer[row * self._columns + col] = count
+        return bytes(buffer)
+
+    def is_alive(self, row: int, column: int) -> bool:
+        """Return True if the cell is ALIVE.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+        """
+        return (row, column) in self._field.live_cells
+
+    def set_alive(self, row: int, column: int, alive: bool) -> None:
+        """Change state of the cell.
+
+        Args:
+            row (int): ROW coordinate
+            column (int): COLUMN coordinate
+            alive (bool): True to make cell ALIVE, False to make it DEAD
+        """
+        if alive:
+            self._field.live_cells.add((row, column))
+        else:
+            self._field.live_cells.discard((row, column))
+
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], alive: bool) -> None:
+        """Change state of number of cells at once.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): (row, column) of the cells
+            alive (bool): True to make cells ALIVE, False to make them DEAD
+        """
+        if alive:
+            self._field.live_cells.update(coordinates)
+        else:
+            self._field.live_cells.difference_update(coordinates)
+
+    def step(self) -> None:
+        """Create next generation of the board."""
+        live: set[tuple[int, int]] = self._field.live_cells
+        birth: frozenset[int] = self._rule.birth
+        survival: frozenset[int] = self._rule.survival
+        counts: dict[tuple[int, int], int] = self._count_neighbours()
+        next_live: set[tuple[int, int]] = {
+            coordinates for (coordinates, count) in counts.items()
+            if count in (survival if coordinates in live else birth)
+        }
+        if 0 in survival:
+            next_live.update(coordinates for coordinates in live if coordinates not in counts)
+        self._previous_live_cells = set(live)
+        live.clear()
+        live.update(next_live)
+
+    def changed_cells(self) -> set[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last step.
+
+        Returns:
+            set[tuple[int, int]]: coordinates
+        """
+        return self._previous_live_cells ^ self._field.live_cells
+
+    def _count_neighbours(self) -> dict[tuple[int, int], int]:
+        """Count ALIVE neighbours for cells around ALIVE cells.
+
+        Neighbours beyond the edges are counted only for wrapped topologies,
+        they are moved to the board cells by the wraparound indices.
+
+        Returns:
+            dict[tuple[int, int], int]: number of neighbours, cells without
+                                        ALIVE neighbours are absent
+        """
+        rows: int = self._rows
+        columns: int = self._columns
+        counts: Counter = Counter(
+            (row + row_diff, col + col_diff)
+            for (row, col) in self._field.live_cells
+            for (row_diff, col_diff) in NEIGHBOUR_OFFSETS
+        )
+        inside: dict[tuple[int, int], int] = {
+            (row, col): count for ((row, col), count) in counts.items()
+            if 0 <= row < rows and 0 <= col < columns
+        }
+        if self._topology.is_wrapped and len(inside) < len(counts):
+            resolve = self._wraparound.resolve
+            for ((row, col), count) in counts.items():
+                if not (0 <= row < rows and 0 <= col < columns):
+                    coordinates: tuple[int, int] = resolve(row, col)
+                    inside[coordinates] = inside.get(coordinates, 0) + count
+        return inside
+
+    def _replace_live_cells(self, live_cells: set[tuple[int, int]]) -> None:
+        """Replace ALIVE cells keeping the set shared with the field.
+
+        Replaced board is treated as unchanged by the last step.
+
+        Args:
+            live_cells (set[tuple[int, int]]): coordinates of ALIVE cells
+        """
+        self._field.live_cells.clear()
+        self._field.live_cells.update(live_cells)
+        self._previous_live_cells = set(live_cells)
@@ -67,3 +67,55 @@ class GameIsNotStartedException(Exception):
         """
         Exception.__init__(self, message)
         log.debug('GameIsNotStartedException.__init__')
+
+
+class EngineNotAvailableException(Exception):
+    """Defines exception raised when engine can't be used in the environment."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize exception.
+
+        Args:
+            message (str): Error message
+        """
+        Exception.__init__(self, message)
+        log.debug('EngineNotAvailableException.__init__')
+
+
+class SaveFileFormatException(Exception):
+    """Defines exception raised on incorrect content of the save file."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize exception.
+
+        Args:
+            message (str): Error message
+        """
+        Exception.__init__(self, message)
+        log.debug('SaveFileFormatException.__init__')
+
+
+class RuleStringException(Exception):
+    """Defines exception raised on incorrect rulestring."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize exception.
+
+        Args:
+            message (str): Error message
+        """
+        Exception.__init__(self, message)
+        log.debug('RuleStringException.__init__')
+
+
+class DensityValueException(Exception):
+    """Defines exception raised on incorrect density of the random field."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize exception.
+
+        Args:
+            message (str): Error message
+        """
+        Exception.__init__(self, message)
+        log.debug('DensityValueException.__init__')
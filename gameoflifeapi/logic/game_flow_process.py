@@ -1,16 +1,51 @@
-"""Defines Game Flow Process API."""
+"""Defines Game Flow Process API.
+
+Object engine double buffers the cell states: the current generation is
+the front buffer of the field, the next generation is written to the back
+buffer, which becomes the front by one swap of the arrays. Readers of the
+front buffer never see a generation being created; the previous front is
+brought up to date by the cells changed since it was the front and
+reused as the back buffer.
+
+Once a read-only view of the front buffer was handed out by
+state_snapshot, the buffer is never written again: edits of the cells are
+applied to its copy which replaces it, and the next swap allocates a new
+back buffer instead of reusing it.
+"""
 import logging
-import random
-from typing import Callable
+import time
+from array import array
+from typing import Callable, Iterable
 
+from gameoflifeapi.logic.cycle_detection import Cycle, CycleDetector
 from gameoflifeapi.logic.data.cell import Cell
-from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.field import Field, FieldCell
+from gameoflifeapi.logic.data.sparse_field import (SparseField,
+                                                   live_cells_from_buffer)
 from gameoflifeapi.logic.data.state import CellState
-from gameoflifeapi.logic.exceptions import GenerationValueException
-from gameoflifeapi.logic.rules import apply_rules_and_change_state
+from gameoflifeapi.logic.engines.abstract_engine import AbstractEngine
+from gameoflifeapi.logic.engines.engine_factory import (
+    create_engine, select_jump_engine_type)
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.exceptions import (GenerationValueException,
+                                            RuleStringException)
+from gameoflifeapi.logic.history import GenerationHistory, HistoryFrame
+from gameoflifeapi.logic.instrumentation import (PHASE_CALLBACK,
+                                                 PHASE_NEIGHBOURS, PHASE_RULES,
+                                                 GenerationStats,
+                                                 Instrumentation)
+from gameoflifeapi.logic.random_states import (DEFAULT_DENSITY, create_seed,
+                                               random_states)
+from gameoflifeapi.logic.rules import (CONWAY_RULE, Rule, RuleTable,
+                                       apply_rules_and_change_state,
+                                       parse_rule)
+from gameoflifeapi.logic.topology import (NEIGHBOURS_PER_CELL, Topology,
+                                          Wraparound)
 
 log: logging.Logger = logging.getLogger(__name__)
 
+GROWTH_STEP: int = 16
+
 
 class GameFlowProcess:
     """Game Flow Process implementation."""
@@ -19,7 +54,14 @@ class GameFlowProcess:
                  columns: int = 10,
                  generation: int = 0,
                  game_field: Field = None,
-                 on_generation_created: Callable[[], None] = None) -> None:
+                 on_generation_created: Callable[[], None] = None,
+                 engine_type: EngineType = EngineType.OBJECT,
+                 workers: int = None,
+                 instrumentation: Instrumentation = None,
+                 rule: str = None,
+                 topology: Topology = Topology.BOUNDED,
+                 history: GenerationHistory = None,
+                 detect_cycles: bool = False) -> None:
         """Initialize GameController.
 
         Args:
@@ -27,14 +69,35 @@ class GameFlowProcess:
             columns (int, optional): Number of columns. Defaults to 10.
             generation (int, optional): Number of current generation.
                                                             Defaults to 10.
+            engine_type (EngineType, optional): Engine used to create generations.
+                                                Defaults to EngineType.OBJECT.
+            workers (int, optional): Number of worker processes of the parallel
+                                     engine. Defaults to number of CPUs.
+            instrumentation (Instrumentation, optional): Collector of the generation
+                                                         statistics. Defaults to
+                                                         disabled one.
+            rule (str, optional): Rulestring of the game, for example 'B36/S23'.
+                                  Defaults to B3/S23.
+            topology (Topology, optional): Topology of the field, HashLife engine
+                                           runs BOUNDED field as INFINITE.
+                                           Defaults to Topology.BOUNDED.
+            history (GenerationHistory, optional): History which records every
+                                                   generation of the game, it allows
+                                                   to step back. Defaults to no history.
+            detect_cycles (bool, optional): True to hash every generation and detect
+                                            still lifes and oscillators, see cycle.
+                                            Defaults to False.
+
+        Raises:
+            GenerationValueException: On negative generation
+            RuleStringException: On incorrect rulestring or B0 rule on
+                                 the infinite field
         """
         if generation < 0:
             raise GenerationValueException("Generation can't be lower 0")
 
-        self._game_field: Field = game_field
-
-        if not game_field:
-            self._game_field = Field(rows, columns)
+        if game_field:
+            rows, columns = game_field.rows, game_field.columns
 
         self._generation: int = generation
         if on_generation_created:
@@ -45,6 +108,55 @@ class GameFlowProcess:
 
             self._on_generation_created = default_handler
 
+        self._rule: Rule = parse_rule(rule) if rule else CONWAY_RULE
+        if topology is Topology.INFINITE and self._rule.is_birth_on_empty:
+            raise RuleStringException(f'Rule {self._rule} fills the infinite field')
+        self._engine: AbstractEngine = create_engine(engine_type, rows, columns, workers,
+                                                     self._rule, topology)
+        # engine may run the board in other topology, for example HashLife universe is always infinite
+        self._topology: Topology = self._engine.topology if self._engine is not None else topology
+        self._wraparound: Wraparound = Wraparound(self._topology, rows, columns)
+        self._origin: tuple[int, int] = (0, 0)
+        self._workers: int = workers
+        self._engine_type: EngineType = engine_type
+        self._instrumentation: Instrumentation = instrumentation or Instrumentation()
+        self._is_field_outdated: bool = False
+        self._is_engine_step: bool = False
+        self._changed_cells: frozenset[tuple[int, int]] = None
+        # object engine: cell arrays of the field, changed and active row-major indices
+        self._states: bytearray = None
+        self._neighbours: bytearray = None
+        self._neighbour_table: array = None
+        self._changed_indices: set[int] = None
+        self._active_cells: set[int] = None
+        # object engine: back buffer of the states, its field view and indices where it differs from the front
+        self._back_states: bytearray = None
+        self._back_field: Field = None
+        self._back_outdated: set[int] = None
+        # True if a view of the front buffer was handed out, so it must not be written
+        self._is_front_shared: bool = False
+        self._seed: int = None
+        self._density: float = None
+        self._history: GenerationHistory = history
+        # True if cells were changed after the current generation was recorded
+        self._is_history_outdated: bool = False
+        self._cycle_detector: CycleDetector = CycleDetector(rows, columns) if detect_cycles else None
+        self._game_field: Field = game_field
+        if self._engine is not None:
+            if game_field:
+                self._engine.load_field(game_field)
+            self._game_field = self._engine.create_field(game_field)
+        elif isinstance(game_field, SparseField):
+            self._load_dense_field(game_field)
+        else:
+            if not game_field:
+                self._game_field = Field(rows, columns)
+            self._bind_cell_arrays()
+            if game_field:
+                # neighbours stored in the field may be counted for other topology
+                self._recount_neighbours()
+        self._record_history()
+
     @property
     def game_field(self) -> Field:
         """Return Game Field Property.
@@ -52,6 +164,9 @@ class GameFlowProcess:
         Returns:
             GameField: current GameField
         """
+        if self._is_field_outdated:
+            self._engine.export_to_field(self._game_field)
+            self._is_field_outdated = False
         return self._game_field
 
     @property
@@ -63,57 +178,772 @@ class GameFlowProcess:
         """
         return self._generation
 
+    @property
+    def rows(self) -> int:
+        """Return number of rows of the game field.
+
+        Returns:
+            int: Number of rows
+        """
+        return self._game_field.rows
+
+    @property
+    def columns(self) -> int:
+        """Return number of columns of the game field.
+
+        Returns:
+            int: Number of columns
+        """
+        return self._game_field.columns
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Return collector of the generation statistics.
+
+        Returns:
+            Instrumentation: instrumentation of the game
+        """
+        return self._instrumentation
+
+    @property
+    def rule(self) -> Rule:
+        """Return rule used to create generations.
+
+        Returns:
+            Rule: compiled rule, rule.rulestring is its canonical rulestring
+        """
+        return self._rule
+
+    @property
+    def topology(self) -> Topology:
+        """Return topology of the field.
+
+        Returns:
+            Topology: topology
+        """
+        return self._topology
+
+    @property
+    def seed(self) -> int:
+        """Return seed of the last randomization.
+
+        Returns:
+            int: seed, or None if cells were never randomized
+        """
+        return self._seed
+
+    @property
+    def density(self) -> float:
+        """Return density of the last randomization.
+
+        Returns:
+            float: probability of the cell to be ALIVE, or None if cells were never randomized
+        """
+        return self._density
+
+    @property
+    def history(self) -> GenerationHistory:
+        """Return history of the game.
+
+        Returns:
+            GenerationHistory: history, or None if the game keeps no history
+        """
+        return self._history
+
+    @property
+    def cycle(self) -> Cycle:
+        """Return cycle the game entered, detected by hashes of the generations.
+
+        Hash of the generation is updated from the changed cells and looked
+        up in the index of the recent generations: the board which repeats
+        the indexed generation repeats from then on. Changes of the cells
+        not by the rules reset the detection.
+
+        Returns:
+            Cycle: still life or oscillator, None if it is not detected or
+                   detection is disabled
+        """
+        if self._cycle_detector is None:
+            return None
+        return self._cycle_detector.cycle
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        """Return coordinates of the initial top left cell in the current field.
+
+        Infinite field grows to the top and to the left too, so coordinates of
+        its cells are moved by the growth.
+
+        Returns:
+            tuple[int, int]: (row, column), (0, 0) for the fields which don't grow
+        """
+        return self._origin
+
+    @property
+    def engine_type(self) -> EngineType:
+        """Return type of the engine used to create generations.
+
+        Returns:
+            EngineType: engine type
+        """
+        return self._engine_type
+
+    @property
+    def changed_cells(self) -> frozenset[tuple[int, int]]:
+        """Return coordinates of cells which changed state in the last generation.
+
+        Returns:
+            frozenset[tuple[int, int]]: coordinates, or None if changes are unknown
+                                        (game was just created, randomized or
+                                        advanced by several generations)
+        """
+        if self._is_engine_step:
+            self._changed_cells = frozenset(self._engine.changed_cells())
+            self._is_engine_step = False
+        elif self._changed_indices is not None:
+            columns: int = self._game_field.columns
+            self._changed_cells = frozenset(divmod(index, columns) for index in self._changed_indices)
+            self._changed_indices = None
+        return self._changed_cells
+
+    def state_buffer(self) -> bytes:
+        """Return states of the current generation without exporting them to the field.
+
+        Returns:
+            bytes: row-major cell states, 1 for alive cell and 0 for dead one
+        """
+        if self._engine is not None:
+            return self._engine.state_buffer()
+        return bytes(self._game_field.state_buffer())
+
+    def state_snapshot(self) -> memoryview:
+        """Return read-only states of the current generation.
+
+        Object engine returns view of its front buffer without copying, the
+        buffer is not written anymore: the next generation and edits of the
+        cells are written to other buffers. Other engines keep states in their
+        own representation and return their state buffer, which is not
+        changed by them at all.
+
+        Returns:
+            memoryview: row-major cell states, 1 for alive cell and 0 for dead one
+        """
+        if self._engine is not None:
+            return memoryview(self._engine.state_buffer())
+        self._is_front_shared = True
+        return memoryview(self._states)[:-1].toreadonly()
+
+    def close(self) -> None:
+        """Release resources of the engine."""
+        if self._engine is not None:
+            self._engine.close()
+
     def switch_cell_state(self, row: int, column: int) -> None:
         """Change Cell state to opposite.
 
         Args:
             row (int): ROW coordinate
             column (int): COLUMN coordinate
+
+        Raises:
+            KeyError: If coordinates are outside of the field
         """
-        all_cells: dict[tuple[int, int], Cell] = self._game_field.all_cells
-        current_cell: Cell = all_cells[(row, column)]
-        current_state: CellState = current_cell.state
-        if current_state is CellState.ALIVE:
-            current_cell.state = CellState.DEAD
-        else:
-            current_cell.state = CellState.ALIVE
-        # Recalculate neighbour number in cells around current
-        neighbours = self._get_neighbour_cells(row, column)
-        for cell in neighbours.values():
-            self._count_neighbours_for_cell(cell)
+        self._check_coordinates(((row, column),))
+        self._is_history_outdated = True
+        self._clear_cycle_detection()
+        if self._engine is not None:
+            self._engine.set_alive(row, column, not self._engine.is_alive(row, column))
+            self._is_field_outdated = True
+            return
+        self._toggle_cells((row * self._game_field.columns + column,))
+
+    def set_cells(self, coordinates: Iterable[tuple[int, int]], state: CellState) -> None:
+        """Set state of number of cells at once.
+
+        Engines apply all cells by one bulk operation, the object engine
+        updates neighbour numbers by one pass over the changed cells.
+
+        Args:
+            coordinates (Iterable[tuple[int, int]]): (row, column) of the cells
+            state (CellState): new state of the cells
+
+        Raises:
+            KeyError: If coordinates of any cell are outside of the field,
+                      no cell is changed then
+        """
+        coordinates = list(coordinates)
+        self._check_coordinates(coordinates)
+        self._is_history_outdated = True
+        self._clear_cycle_detection()
+        if self._engine is not None:
+            self._engine.set_cells(coordinates, state is CellState.ALIVE)
+            self._is_field_outdated = True
+            return
+        columns: int = self._game_field.columns
+        states: bytearray = self._states
+        value: int = state.value
+        changed: set[int] = {index for index in (row * columns + column for (row, column) in coordinates)
+                             if states[index] != value}
+        self._toggle_cells(changed)
+
+    def _check_coordinates(self, coordinates: list[tuple[int, int]]) -> None:
+        """Raise KeyError with the first coordinates outside of the field."""
+        rows, columns = self.rows, self.columns
+        for (row, column) in coordinates:
+            if not (0 <= row < rows and 0 <= column < columns):
+                raise KeyError((row, column))
+
+    def _toggle_cells(self, indices: Iterable[int]) -> None:
+        """Change state of the object engine cells to opposite.
+
+        Neighbour numbers around every toggled cell are changed by +1 or -1
+        instead of being recounted. Shared front buffer is not written, the
+        cells are toggled in its copy which replaces it.
+
+        Args:
+            indices (Iterable[int]): collection of row-major indices of distinct cells
+        """
+        if self._active_cells is not None:
+            self._active_cells.update(indices)
+        self._back_outdated.symmetric_difference_update(indices)
+        is_front_shared: bool = self._is_front_shared
+        states: bytearray = bytearray(self._states) if is_front_shared else self._states
+        neighbours: bytearray = self._neighbours
+        table: array = self._neighbour_table
+        sentinel: int = len(states) - 1
+        for index in indices:
+            states[index] ^= 1
+            delta: int = 1 if states[index] else -1
+            start: int = index * NEIGHBOURS_PER_CELL
+            for neighbour in table[start:start + NEIGHBOURS_PER_CELL]:
+                if neighbour != sentinel:
+                    neighbours[neighbour] += delta
+        if is_front_shared:
+            self._replace_front(states)
 
     def create_next_generation(self) -> None:
-        """Create next generation of the field."""
-        for ((_row, _col), cell) in self._game_field.all_cells.items():
-            apply_rules_and_change_state(cell)
+        """Create next generation of the field.
+
+        Object engine applies rules only to the active region: cells which
+        changed since the previous generation and their neighbours, other
+        cells have the same state and neighbours as in the previous generation,
+        so they can't change.
+        """
+        if self._is_history_outdated:
+            self._record_history()
+        if self._topology is Topology.INFINITE:
+            self._grow_field(1)
+        self._index_current_generation()
+        if self._instrumentation.enabled:
+            self._create_instrumented_generation()
+            return
+        if self._engine is not None:
+            self._step_engine()
+        else:
+            self._count_changed_neighbours(self._apply_rules())
+        self._record_history(is_step=True)
+        self._detect_cycle()
+        self._on_generation_created()
+
+    def _create_instrumented_generation(self) -> None:
+        """Create next generation recording time of every phase."""
+        phases: dict[str, float] = {}
+        started: float = time.perf_counter()
+        if self._engine is not None:
+            self._step_engine()
+            phases[PHASE_RULES] = time.perf_counter() - started
+        else:
+            changed: set[int] = self._apply_rules()
+            rules_finished: float = time.perf_counter()
+            self._count_changed_neighbours(changed)
+            phases[PHASE_RULES] = rules_finished - started
+            phases[PHASE_NEIGHBOURS] = time.perf_counter() - rules_finished
+        self._record_history(is_step=True)
+        self._detect_cycle()
+        started = time.perf_counter()
+        self._on_generation_created()
+        phases[PHASE_CALLBACK] = time.perf_counter() - started
+        self._instrumentation.record(GenerationStats(self._generation, phases,
+                                                     self.state_buffer().count(1),
+                                                     len(self.changed_cells)))
+
+    def _step_engine(self) -> None:
+        """Create next generation by the engine."""
+        self._engine.step()
         self._generation += 1
-        self._count_neighbours_for_field()
+        self._is_field_outdated = True
+        self._is_engine_step = True
+        log.debug('_step_engine: generation=%d, engine=%s', self._generation, self._engine_type.value)
+
+    def _apply_rules(self) -> set[int]:
+        """Apply rules to the active region of the object engine.
+
+        Rules are applied to the back buffer, which is made equal to the
+        front one first, then buffers are swapped.
+
+        Returns:
+            set[int]: row-major indices of cells which changed state
+        """
+        states: bytearray = self._back_states
+        for index in self._back_outdated:
+            states[index] ^= 1
+        if self._active_cells is None:
+            region = range(len(states) - 1)
+        else:
+            region = self._get_active_region(self._active_cells)
+        rule_table: RuleTable = self._rule.table
+        changed: set[int] = set()
+        # one flyweight Cell view is moved over the region of the back buffer
+        cell: FieldCell = FieldCell(self._back_field, 0)
+        for index in region:
+            state: int = states[index]
+            cell.index = index
+            apply_rules_and_change_state(cell, rule_table)
+            if states[index] != state:
+                changed.add(index)
+        self._swap_states(changed)
+        self._generation += 1
+        log.debug('_apply_rules: generation=%d, evaluated=%d, changed=%d',
+                  self._generation, len(region), len(changed))
+        return changed
+
+    def _swap_states(self, changed: set[int]) -> None:
+        """Make the back buffer of the object engine the front one.
+
+        The previous front becomes the back buffer unless it is shared, then
+        the new back buffer is allocated.
+
+        Args:
+            changed (set[int]): row-major indices of cells which differ in the buffers
+        """
+        front: bytearray = self._game_field.swap_states(self._back_states)
+        self._states = self._back_states
+        if self._is_front_shared:
+            front = bytearray(self._states)
+            changed = ()
+            self._is_front_shared = False
+        self._back_field.swap_states(front)
+        self._back_states = front
+        self._back_outdated = set(changed)
+
+    def _replace_front(self, states: bytearray) -> None:
+        """Make the states array the front buffer of the object engine instead of the shared one.
+
+        Args:
+            states (bytearray): array with rows * columns + 1 items, see Field.cell_arrays
+        """
+        self._game_field.swap_states(states)
+        self._states = states
+        self._is_front_shared = False
+
+    def _count_changed_neighbours(self, changed: set[int]) -> None:
+        """Recount neighbours around changed cells of the object engine.
+
+        Args:
+            changed (set[int]): row-major indices of cells which changed state
+        """
+        neighbours: bytearray = self._neighbours
+        for index in self._get_active_region(changed):
+            neighbours[index] = self._count_alive_neighbours(index)
+        self._changed_indices = changed
+        self._active_cells = changed
+
+    def advance(self, generations: int) -> None:
+        """Create generation which is number of generations ahead of the current one.
+
+        Jump is calculated by the fastest engine with the same semantic as
+        the engine of the game, on_generation_created is called once.
+        Infinite field jumps by GROWTH_STEP generations, growing before
+        each of them, so ALIVE cells can't reach the edges, or by HashLife
+        universe for long jumps, then it grows to fit the ALIVE cells.
+
+        Args:
+            generations (int): number of generations
+
+        Raises:
+            GenerationValueException: On negative number of generations
+        """
+        if generations < 0:
+            raise GenerationValueException("Number of generations can't be lower 0")
+        if generations == 0:
+            return
+        if self._is_history_outdated:
+            self._record_history()
+        jump_engine_type: EngineType = select_jump_engine_type(self._engine_type, generations, self._rule,
+                                                               self._topology)
+        if jump_engine_type is EngineType.OBJECT:
+            self.create_next_generation()
+            return
+        self._changed_cells = None
+        self._changed_indices = None
+        self._active_cells = None
+        self._is_engine_step = False
+        if jump_engine_type is EngineType.HASHLIFE and self._engine_type is not EngineType.HASHLIFE:
+            self._jump_by_hashlife(generations)
+        elif self._topology is Topology.INFINITE and self._engine_type is not EngineType.HASHLIFE:
+            remaining: int = generations
+            while remaining:
+                jump: int = min(remaining, GROWTH_STEP)
+                self._grow_field(jump)
+                self._jump(jump_engine_type, jump)
+                remaining -= jump
+        else:
+            self._jump(jump_engine_type, generations)
+        self._generation += generations
+        self._record_history()
+        if self._cycle_detector is not None and self._cycle_detector.cycle is None:
+            # periods can't be measured across the jump, index starts from the new generation
+            self._cycle_detector.reset(self.state_buffer(), self._generation)
+        self._on_generation_created()
+
+    def _jump(self, jump_engine_type: EngineType, generations: int) -> None:
+        """Advance the board by number of generations by the engine of the type.
+
+        Args:
+            jump_engine_type (EngineType): type of the engine which calculates the jump
+            generations (int): number of generations
+        """
+        if jump_engine_type is self._engine_type:
+            self._engine.advance(generations)
+            self._is_field_outdated = True
+            return
+        jump_engine: AbstractEngine = create_engine(jump_engine_type,
+                                                    self._game_field.rows,
+                                                    self._game_field.columns,
+                                                    rule=self._rule,
+                                                    topology=self._topology)
+        jump_engine.load_field(self._game_field)
+        jump_engine.advance(generations)
+        if self._is_front_shared:
+            # the shared front is not written by the export
+            self._replace_front(bytearray(self._states))
+        jump_engine.export_to_field(self._game_field)
+        jump_engine.close()
+        self._reset_back_buffer()
+
+    def _jump_by_hashlife(self, generations: int) -> None:
+        """Advance the infinite field by HashLife universe and grow it to fit the ALIVE cells.
+
+        Args:
+            generations (int): number of generations
+        """
+        rows, columns = self.rows, self.columns
+        jump_engine: AbstractEngine = create_engine(EngineType.HASHLIFE, rows, columns, rule=self._rule)
+        jump_engine.load_state_buffer(self.state_buffer())
+        jump_engine.advance(generations)
+        cells: set[tuple[int, int]] = jump_engine.live_cells()
+        jump_engine.close()
+        top = bottom = left = right = 0
+        if cells:
+            top = max(0, -min(row for (row, _col) in cells))
+            bottom = max(0, max(row for (row, _col) in cells) - rows + 1)
+            left = max(0, -min(col for (_row, col) in cells))
+            right = max(0, max(col for (_row, col) in cells) - columns + 1)
+        # sides which are grown get GROWTH_STEP more, as by _grow_field
+        top, bottom, left, right = (size + GROWTH_STEP if size else 0 for size in (top, bottom, left, right))
+        new_rows: int = rows + top + bottom
+        new_columns: int = columns + left + right
+        states: bytearray = bytearray(new_rows * new_columns)
+        for (row, col) in cells:
+            states[(row + top) * new_columns + col + left] = 1
+        if (new_rows, new_columns) == (rows, columns):
+            self._load_states(bytes(states))
+            return
+        self._origin = (self._origin[0] + top, self._origin[1] + left)
+        self._replace_field(new_rows, new_columns, bytes(states))
+        log.debug('_jump_by_hashlife: rows=%d, cols=%d, origin=%s', new_rows, new_columns, self._origin)
+
+    def _grow_field(self, margin: int) -> None:
+        """Grow the infinite field so that ALIVE cells are at least margin cells away from its edges.
+
+        Every side which is too close is extended by the missing cells and
+        GROWTH_STEP more, so the field grows rarely. HashLife universe is
+        unbounded itself, its window is not grown.
+
+        Args:
+            margin (int): minimal number of DEAD rows and columns between ALIVE cells and edges
+        """
+        if self._engine_type is EngineType.HASHLIFE:
+            return
+        states: bytes = self.state_buffer()
+        rows, columns = self.rows, self.columns
+        first: int = states.find(1)
+        if first < 0:
+            return
+        last: int = states.rfind(1)
+        first_row, last_row = first // columns, last // columns
+        left: int = columns
+        right: int = columns
+        for start in range(first_row * columns, (last_row + 1) * columns, columns):
+            found: int = states.find(1, start, start + columns)
+            if found >= 0:
+                left = min(left, found - start)
+                right = min(right, start + columns - 1 - states.rfind(1, start, start + columns))
+        distances: tuple[int, ...] = (first_row, rows - 1 - last_row, left, right)
+        if min(distances) >= margin:
+            return
+        top, bottom, left, right = (margin + GROWTH_STEP - distance if distance < margin else 0
+                                    for distance in distances)
+        new_rows: int = rows + top + bottom
+        new_columns: int = columns + left + right
+        grown: bytearray = bytearray(new_rows * new_columns)
+        for row in range(first_row, last_row + 1):
+            start: int = (row + top) * new_columns + left
+            grown[start:start + columns] = states[row * columns:(row + 1) * columns]
+        self._origin = (self._origin[0] + top, self._origin[1] + left)
+        self._replace_field(new_rows, new_columns, bytes(grown))
+        log.debug('_grow_field: rows=%d, cols=%d, origin=%s', new_rows, new_columns, self._origin)
+
+    def _replace_field(self, rows: int, columns: int, states: bytes) -> None:
+        """Replace the field by the field of other size.
+
+        Args:
+            rows (int): Number of rows
+            columns (int): Number of columns
+            states (bytes): row-major cell states of the new field
+        """
+        self._wraparound = Wraparound(self._topology, rows, columns)
+        self._changed_cells = None
+        self._changed_indices = None
+        self._active_cells = None
+        self._is_engine_step = False
+        if self._cycle_detector is not None:
+            self._cycle_detector = CycleDetector(rows, columns, self._cycle_detector.max_period)
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = create_engine(self._engine_type, rows, columns, self._workers,
+                                         self._rule, self._topology)
+            self._engine.load_state_buffer(states)
+            self._game_field = self._engine.create_field(None)
+            self._is_field_outdated = True
+        else:
+            self._load_dense_field(SparseField(rows, columns, live_cells_from_buffer(states, columns)))
+
+    def _load_states(self, states: bytes) -> None:
+        """Replace states of all cells of the field.
 
-    def randomize_next_generation(self) -> None:
-        """Change state of cells in random way."""
-        for ((row, col), _cell) in self._game_field.all_cells.items():
-            if bool(random.getrandbits(1)):
-                self.switch_cell_state(row, col)
-        self._count_neighbours_for_field()
+        Object engine toggles only the cells which differ, so neighbour
+        numbers are updated around them instead of being recounted.
+
+        Args:
+            states (bytes): row-major cell states
+        """
+        self._changed_cells = None
+        self._changed_indices = None
+        self._is_engine_step = False
+        self._clear_cycle_detection()
+        if self._engine is not None:
+            self._engine.load_state_buffer(states)
+            self._is_field_outdated = True
+            return
+        self._active_cells = None
+        size: int = len(states)
+        flipped: int = int.from_bytes(self._states[:size], 'big') ^ int.from_bytes(states, 'big')
+        flips: bytes = flipped.to_bytes(size, 'big')
+        indices: list[int] = []
+        index: int = flips.find(1)
+        while index >= 0:
+            indices.append(index)
+            index = flips.find(1, index + 1)
+        self._toggle_cells(indices)
+
+    def randomize_next_generation(self, seed: int = None, density: float = DEFAULT_DENSITY) -> None:
+        """Replace cells by random ones generated from the seed.
+
+        The same seed and density give the same cells with every engine,
+        they are kept in seed and density properties to reproduce the game.
+
+        Args:
+            seed (int, optional): seed of the random cells, None to create new one
+            density (float, optional): probability of the cell to be ALIVE.
+                                       Defaults to DEFAULT_DENSITY.
+
+        Raises:
+            DensityValueException: On density out of 0..1
+        """
+        if seed is None:
+            seed = create_seed()
+        size: int = self._game_field.rows * self._game_field.columns
+        states: bytes = random_states(size, seed, density)
+        self._seed = seed
+        self._density = density
+        self._is_history_outdated = True
+        self._load_states(states)
+        self._on_generation_created()
+
+    def goto(self, generation: int) -> None:
+        """Restore the generation recorded in the history.
+
+        Cells changed after the current generation was recorded are recorded
+        first, so the changes are not lost. The next created generation
+        replaces the recorded generations after the restored one.
+
+        Args:
+            generation (int): Number of generation
+
+        Raises:
+            GenerationValueException: On the game without history or
+                                      generation which is not in the history
+        """
+        if self._history is None:
+            raise GenerationValueException('Game keeps no history')
+        if self._is_history_outdated:
+            self._record_history()
+        frame: HistoryFrame = self._history.restore(generation)
+        if (frame.rows, frame.columns) != (self.rows, self.columns):
+            self._replace_field(frame.rows, frame.columns, frame.states)
+        else:
+            self._load_states(frame.states)
+        self._origin = frame.origin
+        self._generation = generation
+        log.debug('goto: generation=%d', generation)
+        self._on_generation_created()
+
+    def step_back(self) -> None:
+        """Restore the previous generation recorded in the history.
+
+        Raises:
+            GenerationValueException: On the game without history or
+                                      without older generations in the history
+        """
+        if self._history is None:
+            raise GenerationValueException('Game keeps no history')
+        if self._is_history_outdated:
+            self._record_history()
+        previous: int = self._history.previous(self._generation)
+        if previous is None:
+            raise GenerationValueException('No previous generation in the history')
+        self.goto(previous)
+
+    def _record_history(self, is_step: bool = False) -> None:
+        """Record the current generation in the history.
+
+        Args:
+            is_step (bool, optional): True if the generation is created by one step
+                                      of the rules, it is recorded by the changed cells
+                                      unless the history needs the keyframe. Defaults to False.
+        """
+        self._is_history_outdated = False
+        if self._history is None:
+            return
+        if is_step and self._history.record_changes(self._generation, self._step_changed_indices(),
+                                                    self.rows, self.columns, self._origin):
+            return
+        self._history.record(self._generation, self.state_buffer(), self.rows, self.columns, self._origin)
+
+    def _step_changed_indices(self) -> Iterable[int]:
+        """Return row-major indices of the cells changed by the last step of the rules."""
+        if self._engine is None:
+            return self._changed_indices
+        columns: int = self._game_field.columns
+        return (row * columns + column for (row, column) in self.changed_cells)
+
+    def _clear_cycle_detection(self) -> None:
+        """Forget hashes of the generations, cells were changed not by the rules."""
+        if self._cycle_detector is not None:
+            self._cycle_detector.clear()
+
+    def _index_current_generation(self) -> None:
+        """Hash all cells of the current generation if its hash is not known."""
+        if self._cycle_detector is not None and self._cycle_detector.hash is None:
+            self._cycle_detector.reset(self.state_buffer(), self._generation)
+
+    def _detect_cycle(self) -> None:
+        """Update hash of the new generation from its changed cells and look for the cycle."""
+        detector: CycleDetector = self._cycle_detector
+        if detector is None or detector.cycle is not None:
+            return
+        cycle: Cycle = detector.update(self._step_changed_indices(), self._generation, self.state_buffer)
+        if cycle is not None:
+            log.info('_detect_cycle: %s', cycle)
+
+    def _load_dense_field(self, game_field: Field) -> None:
+        """Copy passed field to the Field with cell arrays used by the object engine.
+
+        Args:
+            game_field (Field): field with other cells representation
+        """
+        self._game_field = Field(game_field.rows, game_field.columns)
+        self._game_field.apply_buffers(game_field.state_buffer(),
+                                       bytes(game_field.rows * game_field.columns))
+        self._bind_cell_arrays()
+        self._recount_neighbours()
+
+    def _bind_cell_arrays(self) -> None:
+        """Take cell arrays of the object engine field, create the back buffer and build the neighbour table.
+
+        The extra last cell of the arrays is the DEAD sentinel which neighbours
+        beyond the bounded edges point to.
+        """
+        self._states, self._neighbours = self._game_field.cell_arrays()
+        self._back_states = bytearray(self._states)
+        self._back_field = self._game_field.with_states(self._back_states)
+        self._back_outdated = set()
+        self._is_front_shared = False
+        self._neighbour_table = self._wraparound.neighbour_table()
+
+    def _reset_back_buffer(self) -> None:
+        """Copy the front buffer of the object engine to the back one after the front was written directly."""
+        self._back_states[:] = self._states
+        self._back_outdated = set()
 
     def _count_neighbours_for_field(self) -> None:
         """Count number of the alive neighbour cells for each cell."""
-        for ((_row, _col), cell) in self._game_field.all_cells.items():
-            self._count_neighbours_for_cell(cell)
+        if self._engine is not None:
+            self._is_field_outdated = True
+            self._on_generation_created()
+            return
+        self._reset_back_buffer()
+        self._recount_neighbours()
         self._on_generation_created()
 
+    def _recount_neighbours(self) -> None:
+        """Count number of the alive neighbours of every cell of the object engine field."""
+        neighbours: bytearray = self._neighbours
+        for index in range(len(neighbours) - 1):
+            neighbours[index] = self._count_alive_neighbours(index)
+
+    def _get_active_region(self, cells: set[int]) -> set[int]:
+        """Return passed cells with all their neighbours.
+
+        Args:
+            cells (set[int]): row-major indices of cells
+
+        Returns:
+            set[int]: indices of cells and neighbours
+        """
+        table: array = self._neighbour_table
+        region: set[int] = set(cells)
+        for index in cells:
+            start: int = index * NEIGHBOURS_PER_CELL
+            region.update(table[start:start + NEIGHBOURS_PER_CELL])
+        region.discard(len(self._states) - 1)
+        return region
+
+    def _count_alive_neighbours(self, index: int) -> int:
+        """Count the number of alive cells around the cell of the object engine.
+
+        Args:
+            index (int): row-major index of the cell
+
+        Returns:
+            int: number of ALIVE neighbours
+        """
+        states: bytearray = self._states
+        table: array = self._neighbour_table
+        start: int = index * NEIGHBOURS_PER_CELL
+        return (states[table[start]] + states[table[start + 1]] + states[table[start + 2]]
+                + states[table[start + 3]] + states[table[start + 4]] + states[table[start + 5]]
+                + states[table[start + 6]] + states[table[start + 7]])
+
     def _count_neighbours_for_cell(self, current_cell: Cell) -> None:
         """Count the number of alive cells around passed cell.
 
         Args:
             cell (FieldCell): _description_
         """
-        neighbours = self._get_neighbour_cells(current_cell.row, current_cell.column)
-        count: int = 0
-        for neighbour_cell in neighbours.values():
-            if neighbour_cell.state is CellState.ALIVE:
-                count += 1
-        current_cell.neighbours = count
+        index: int = current_cell.row * self._game_field.columns + current_cell.column
+        current_cell.neighbours = self._count_alive_neighbours(index)
 
     def _get_neighbour_cells(self, row: int, column: int) -> dict[tuple[int, int], Cell]:
         """Find and collect all neighbours for the cell by coordinates.
@@ -121,6 +951,8 @@ class GameFlowProcess:
         ( 0 0 ) ( 0 1 ) ( 0 2 )    ( -1 -1 ) ( -1 +0 ) ( -1 +1 )
         ( 1 0 ) ( 1 1 ) ( 1 2 ) -> ( +0 -1 ) (  1  1 ) ( +0 +1 )
         ( 2 0 ) ( 2 1 ) ( 2 2 )    ( +1 -1 ) ( +1 +0 ) ( +1 +1 )
+        Neighbours are read from the precomputed neighbour table, cells
+        beyond the bounded edges are skipped.
         Args:
             row (int): row number
             column (int): column number
@@ -128,26 +960,11 @@ class GameFlowProcess:
         Returns:
             dict[tuple[int, int], Cell]: dictionary of the cells
         """
-        coordinates_diff: set = {
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1), (0, 1),
-            (1, -1), (1, 0), (1, 1)
-        }
+        columns: int = self._game_field.columns
+        sentinel: int = len(self._states) - 1
+        start: int = (row * columns + column) * NEIGHBOURS_PER_CELL
         result_dictionary: dict[tuple[int, int], Cell] = {}
-        for row_diff, col_diff in coordinates_diff:
-            neighbour_row: int = row + row_diff
-            neighbour_col: int = column + col_diff
-            is_not_valid_row: bool = ((neighbour_row < 0)
-                                      or (neighbour_row >= self.game_field.rows))
-            is_not_valid_col: bool = ((neighbour_col < 0)
-                                      or (neighbour_col >= self.game_field.columns))
-            is_current_cell: bool = neighbour_row == row and neighbour_col == column
-            if is_not_valid_row or is_not_valid_col or is_current_cell:
-                continue  # Filter coordinates that are out of bounds
-            try:
-                cells: dict[tuple[int, int], Cell] = self._game_field.all_cells
-                neighbour_cell: Cell = cells[(neighbour_row, neighbour_col)]
-                result_dictionary[(neighbour_row, neighbour_col)] = neighbour_cell
-            except KeyError as err:
-                log.debug('Coordinate is not valid, %s', err)
+        for neighbour in self._neighbour_table[start:start + NEIGHBOURS_PER_CELL]:
+            if neighbour != sentinel:
+                result_dictionary[divmod(neighbour, columns)] = FieldCell(self._game_field, neighbour)
         return result_dictionary
@@ -0,0 +1,253 @@
+"""Defines bounded history of the recent generations of the game.
+
+Keyframes are zlib-compressed snapshots of the states of all cells packed
+into bits. Generation created by one step of the rules is recorded as the
+delta: indices of the cells changed since the previous generation, so its
+recording doesn't read the board. Every keyframe_interval-th generation is
+a keyframe again. Restoring of a generation starts from the nearest
+keyframe before it and flips the cells of at most keyframe_interval - 1
+deltas, so it takes the same time wherever the generation is in the history.
+
+When the history exceeds its memory budget, the oldest keyframe is evicted
+together with the deltas which depend on it.
+"""
+import logging
+import zlib
+from array import array
+from typing import Iterable
+
+from gameoflifeapi.logic.data.packed_states import pack_states, unpack_states
+from gameoflifeapi.logic.exceptions import GenerationValueException
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET: int = 32 * 1024 * 1024
+DEFAULT_KEYFRAME_INTERVAL: int = 32
+# approximate memory used by one snapshot besides its compressed payload
+_SNAPSHOT_OVERHEAD: int = 200
+_COMPRESSION_LEVEL: int = 1
+
+
+class HistoryFrame:
+    """Generation restored from the history."""
+
+    __slots__ = ('generation', 'states', 'rows', 'columns', 'origin')
+
+    def __init__(self, generation: int, states: bytes, rows: int, columns: int, origin: tuple[int, int]) -> None:
+        """Initialize History Frame.
+
+        Args:
+            generation (int): Number of generation
+            states (bytes): row-major cell states, 1 - ALIVE, 0 - DEAD
+            rows (int): Number of rows of the field
+            columns (int): Number of columns of the field
+            origin (tuple[int, int]): position of the initial field in the grown field
+        """
+        self.generation: int = generation
+        self.states: bytes = states
+        self.rows: int = rows
+        self.columns: int = columns
+        self.origin: tuple[int, int] = origin
+
+
+class _Snapshot:
+    """Compressed keyframe or changed cells of one generation."""
+
+    __slots__ = ('previous', 'rows', 'columns', 'origin', 'payload')
+
+    def __init__(self, previous: int, rows: int, columns: int, origin: tuple[int, int], payload: bytes) -> None:
+        # previous is the generation the delta is applied to, None for the keyframe
+        self.previous: int = previous
+        self.rows: int = rows
+        self.columns: int = columns
+        self.origin: tuple[int, int] = origin
+        self.payload: bytes = payload
+
+    @property
+    def size(self) -> int:
+        """Return approximate number of bytes used by the snapshot."""
+        return len(self.payload) + _SNAPSHOT_OVERHEAD
+
+
+class GenerationHistory:
+    """Ring buffer of the recent generations with memory budget.
+
+    Generations are recorded in increasing order, recording of the
+    generation which is not newer than the last recorded one drops the
+    recorded generations from it onwards (the game continued from the
+    restored or edited generation). The last keyframe with its deltas is
+    never evicted, so the history may exceed the budget by one keyframe
+    group.
+    """
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """Initialize Generation History.
+
+        Args:
+            memory_budget (int, optional): maximal number of bytes used by the snapshots.
+                                           Defaults to DEFAULT_MEMORY_BUDGET.
+            keyframe_interval (int, optional): number of generations between keyframes.
+                                               Defaults to DEFAULT_KEYFRAME_INTERVAL.
+        """
+        self._memory_budget: int = memory_budget
+        self._keyframe_interval: int = max(keyframe_interval, 1)
+        # insertion order of the dict is the order of the generations
+        self._snapshots: dict[int, _Snapshot] = {}
+        self._memory_used: int = 0
+        # number of deltas since the last keyframe
+        self._deltas: int = 0
+
+    @property
+    def memory_budget(self) -> int:
+        """Return maximal number of bytes used by the snapshots."""
+        return self._memory_budget
+
+    @property
+    def keyframe_interval(self) -> int:
+        """Return number of generations between keyframes."""
+        return self._keyframe_interval
+
+    @property
+    def memory_used(self) -> int:
+        """Return approximate number of bytes used by the snapshots."""
+        return self._memory_used
+
+    @property
+    def generations(self) -> list[int]:
+        """Return recorded generations in increasing order."""
+        return list(self._snapshots)
+
+    def __len__(self) -> int:
+        """Return number of recorded generations."""
+        return len(self._snapshots)
+
+    def __contains__(self, generation: int) -> bool:
+        """Return True if the generation can be restored."""
+        return generation in self._snapshots
+
+    def previous(self, generation: int) -> int:
+        """Return the newest recorded generation which is older than passed one.
+
+        Args:
+            generation (int): Number of generation
+
+        Returns:
+            int: Number of generation, None if there is no older generation
+        """
+        for recorded in reversed(self._snapshots):
+            if recorded < generation:
+                return recorded
+        return None
+
+    def clear(self) -> None:
+        """Drop all recorded generations."""
+        self._snapshots.clear()
+        self._memory_used = 0
+        self._deltas = 0
+
+    def record(self, generation: int, states: bytes, rows: int, columns: int,
+               origin: tuple[int, int] = (0, 0)) -> None:
+        """Record the generation as the keyframe.
+
+        Args:
+            generation (int): Number of generation
+            states (bytes): row-major cell states, 1 - ALIVE, 0 - DEAD
+            rows (int): Number of rows of the field
+            columns (int): Number of columns of the field
+            origin (tuple[int, int], optional): position of the initial field
+                                                in the grown field. Defaults to (0, 0).
+        """
+        self._truncate(generation)
+        self._deltas = 0
+        self._add(generation, _Snapshot(None, rows, columns, origin,
+                                        zlib.compress(pack_states(states), _COMPRESSION_LEVEL)))
+
+    def record_changes(self, generation: int, changed: Iterable[int], rows: int, columns: int,
+                       origin: tuple[int, int] = (0, 0)) -> bool:
+        """Record the generation by the cells changed since the previous generation.
+
+        Nothing is recorded when the generation must be the keyframe: the
+        previous generation is not the last recorded one, the field has
+        other size or origin, or keyframe_interval is reached.
+
+        Args:
+            generation (int): Number of generation
+            changed (Iterable[int]): row-major indices of the changed cells
+            rows (int): Number of rows of the field
+            columns (int): Number of columns of the field
+            origin (tuple[int, int], optional): position of the initial field
+                                                in the grown field. Defaults to (0, 0).
+
+        Returns:
+            bool: True if the generation is recorded, False if it must be recorded by record
+        """
+        self._truncate(generation)
+        last: int = next(reversed(self._snapshots), None)
+        if last != generation - 1 or self._deltas >= self._keyframe_interval - 1:
+            return False
+        last_snapshot: _Snapshot = self._snapshots[last]
+        if (last_snapshot.rows, last_snapshot.columns, last_snapshot.origin) != (rows, columns, origin):
+            return False
+        self._deltas += 1
+        self._add(generation, _Snapshot(last, rows, columns, origin, array('I', changed).tobytes()))
+        return True
+
+    def restore(self, generation: int) -> HistoryFrame:
+        """Restore recorded generation.
+
+        Args:
+            generation (int): Number of generation
+
+        Returns:
+            HistoryFrame: states and sizes of the field of the generation
+
+        Raises:
+            GenerationValueException: On generation which is not in the history
+        """
+        snapshot: _Snapshot = self._snapshots.get(generation)
+        if snapshot is None:
+            raise GenerationValueException(f'Generation {generation} is not in the history')
+        chain: list[_Snapshot] = [snapshot]
+        while chain[-1].previous is not None:
+            chain.append(self._snapshots[chain[-1].previous])
+        states: bytearray = bytearray(unpack_states(zlib.decompress(chain.pop().payload),
+                                                    snapshot.rows * snapshot.columns))
+        changed: array = array('I')
+        for delta in reversed(chain):
+            changed.frombytes(delta.payload)
+        for index in changed:
+            states[index] ^= 1
+        return HistoryFrame(generation, bytes(states), snapshot.rows, snapshot.columns, snapshot.origin)
+
+    def _add(self, generation: int, snapshot: _Snapshot) -> None:
+        """Add snapshot of the generation and evict the oldest ones over the budget."""
+        self._snapshots[generation] = snapshot
+        self._memory_used += snapshot.size
+        self._evict()
+
+    def _truncate(self, generation: int) -> None:
+        """Drop recorded generations starting from passed one."""
+        while self._snapshots and next(reversed(self._snapshots)) >= generation:
+            _, snapshot = self._snapshots.popitem()
+            self._memory_used -= snapshot.size
+            # the next generation starts new keyframe
+            self._deltas = self._keyframe_interval
+
+    def _evict(self) -> None:
+        """Drop the oldest keyframe groups while the budget is exceeded."""
+        while self._memory_used > self._memory_budget:
+            generations = iter(self._snapshots)
+            oldest: int = next(generations)
+            next_keyframe: int = next((recorded for recorded in generations
+                                       if self._snapshots[recorded].previous is None), None)
+            if next_keyframe is None:
+                return
+            evicted: list[int] = []
+            for recorded in self._snapshots:
+                if recorded == next_keyframe:
+                    break
+                evicted.append(recorded)
+            for recorded in evicted:
+                self._memory_used -= self._snapshots.pop(recorded).size
+            log.debug('_evict: generations=%d..%d', oldest, evicted[-1])
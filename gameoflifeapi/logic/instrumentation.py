@@ -0,0 +1,115 @@
+"""Defines per-phase instrumentation of the game."""
+import logging
+from typing import Callable
+
+log: logging.Logger = logging.getLogger(__name__)
+
+PHASE_RULES: str = 'rules'
+PHASE_NEIGHBOURS: str = 'neighbours'
+PHASE_CALLBACK: str = 'callback'
+PHASE_PERSISTENCE: str = 'persistence'
+
+
+class GenerationStats:
+    """Statistics recorded for one generation or one persistence operation.
+
+    Engines count neighbours inside their step, so their time is recorded
+    only as the rules phase.
+    """
+
+    __slots__ = ('generation', 'phases', 'population', 'changed_cells')
+
+    def __init__(self, generation: int, phases: dict[str, float],
+                 population: int = None, changed_cells: int = None) -> None:
+        """Initialize Generation Stats.
+
+        Args:
+            generation (int): Number of generation
+            phases (dict[str, float]): seconds spent in phases by phase name
+            population (int, optional): number of ALIVE cells
+            changed_cells (int, optional): number of cells changed in the generation
+        """
+        self.generation: int = generation
+        self.phases: dict[str, float] = phases
+        self.population: int = population
+        self.changed_cells: int = changed_cells
+
+    def as_dict(self) -> dict:
+        """Return statistics as dictionary ready for JSON serialization."""
+        return {'generation': self.generation, 'phases': dict(self.phases),
+                'population': self.population, 'changed_cells': self.changed_cells}
+
+    def __repr__(self) -> str:
+        """Return string representation of the statistics."""
+        return f'GenerationStats({self.as_dict()})'
+
+
+class Instrumentation:
+    """Collects GenerationStats of the game and passes them to listeners.
+
+    Instrumentation is disabled by default, the game checks only enabled
+    flag once per generation then, so no timers are started.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize Instrumentation.
+
+        Args:
+            enabled (bool, optional): True to record statistics. Defaults to False.
+        """
+        self.enabled: bool = enabled
+        self._listeners: list[Callable[[GenerationStats], None]] = []
+        self._last: GenerationStats = None
+        self._totals: dict[str, float] = {}
+        self._records: int = 0
+
+    @property
+    def last(self) -> GenerationStats:
+        """Return the last recorded statistics or None."""
+        return self._last
+
+    @property
+    def totals(self) -> dict[str, float]:
+        """Return seconds spent in phases since the last reset."""
+        return dict(self._totals)
+
+    @property
+    def records(self) -> int:
+        """Return number of recorded statistics since the last reset."""
+        return self._records
+
+    def add_listener(self, listener: Callable[[GenerationStats], None]) -> None:
+        """Register function called with every recorded statistics.
+
+        Args:
+            listener (Callable[[GenerationStats], None]): listener
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[GenerationStats], None]) -> None:
+        """Unregister listener.
+
+        Args:
+            listener (Callable[[GenerationStats], None]): listener
+        """
+        self._listeners.remove(listener)
+
+    def record(self, stats: GenerationStats) -> None:
+        """Store statistics and pass them to listeners.
+
+        Args:
+            stats (GenerationStats): recorded statistics
+        """
+        log.debug('record: %s', stats)
+        self._last = stats
+        self._records += 1
+        for phase, seconds in stats.phases.items():
+            self._totals[phase] = self._totals.get(phase, 0.0) + seconds
+        for listener in self._listeners:
+            listener(stats)
+
+    def reset(self) -> None:
+        """Forget recorded statistics, listeners are kept."""
+        self._last = None
+        self._totals.clear()
+        self._records = 0
@@ -0,0 +1,46 @@
+"""Seeded generation of the random cell states.
+
+Whole board is generated at once: random bytes of the seeded generator are
+translated into states by the lookup table, so generation is done by two C
+level operations and the same seed and density give the same board with
+every engine, with or without numpy.
+"""
+import random
+
+from gameoflifeapi.logic.exceptions import DensityValueException
+
+DEFAULT_DENSITY: float = 0.5
+# density is applied with 1/256 precision: every random byte is one cell
+_BYTE_VALUES: int = 256
+_SEED_BITS: int = 32
+
+
+def create_seed() -> int:
+    """Return new seed for the random states.
+
+    Returns:
+        int: non-negative 32-bit seed
+    """
+    return random.getrandbits(_SEED_BITS)
+
+
+def random_states(size: int, seed: int, density: float = DEFAULT_DENSITY) -> bytes:
+    """Return random row-major cell states, the same seed gives the same states.
+
+    Args:
+        size (int): number of cells
+        seed (int): seed of the random generator
+        density (float, optional): probability of the cell to be ALIVE.
+                                   Defaults to DEFAULT_DENSITY.
+
+    Returns:
+        bytes: states of the cells, 1 - ALIVE, 0 - DEAD
+
+    Raises:
+        DensityValueException: On density out of 0..1
+    """
+    if density is None or not 0 <= density <= 1:
+        raise DensityValueException('Density should be in range 0..1')
+    threshold: int = round(density * _BYTE_VALUES)
+    table: bytes = bytes(1 if value < threshold else 0 for value in range(_BYTE_VALUES))
+    return random.Random(seed).randbytes(size).translate(table)
@@ -1,102 +1,167 @@
-"""Defines rules used for state change in the game."""
-import logging
+"""Defines rules used for state change in the game.
+
+Life-like rules are written as rulestrings: 'B3/S23' means that DEAD cell
+with 3 ALIVE neighbours is born and ALIVE cell with 2 or 3 ALIVE
+neighbours survives. Rules are compiled once into the lookup table indexed
+by the current state value and number of ALIVE neighbours, so evaluation
+of the cell is a single table access without branching or logging.
+"""
+import re
+from typing import Iterable
 
 from gameoflifeapi.logic.data.cell import Cell
 from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.exceptions import RuleStringException
 
-log: logging.Logger = logging.getLogger(__name__)
+RuleTable = tuple[tuple[CellState, ...], tuple[CellState, ...]]
 
+_BIRTH_SURVIVAL: re.Pattern = re.compile(r'^B([0-8]*)/?S([0-8]*)$')
+_SURVIVAL_BIRTH: re.Pattern = re.compile(r'^([0-8]*)/([0-8]*)$')
 
-def _rule_alive_from_0_to_1(field_cell: Cell) -> None:
-    """Change Statte of the Cell.
 
-    Alive	->	0-1 Alive Neighbour	->	Dead
+def compile_rule_table(birth: frozenset[int], survival: frozenset[int]) -> RuleTable:
+    """Build lookup table of the next cell state.
 
     Args:
-        field_cell (FieldCell): Cell that should be processed
-    """
-    field_cell.state = CellState.DEAD
-    log.debug('0 or 1 Alive: Cell (%d, %d) make_dead',
-              field_cell.row, field_cell.column)
-
+        birth (frozenset[int]): numbers of ALIVE neighbours that make DEAD cell ALIVE
+        survival (frozenset[int]): numbers of ALIVE neighbours that keep ALIVE cell ALIVE
 
-def _rule_alive_from_2_to_3(field_cell: Cell) -> None:
-    """Change Statte of the Cell.
-
-    Alive	->	2-3 Alive Neighbour	->	Alive
-
-    Args:
-        field_cell (FieldCell): Cell that should be processed
-    """
-    field_cell.state = CellState.ALIVE
-    log.debug('2 or 3 Alive: Cell (%d, %d) make_alive',
-              field_cell.row, field_cell.column)
-
-
-def _rule_alive_from_4_to_8(field_cell: Cell) -> None:
-    """Change Statte of the Cell.
-
-    Alive	->	4-8 Alive Neighbour	->	Dead
-
-    Args:
-        field_cell (FieldCell): Cell that should be processed
+    Returns:
+        RuleTable: table[state.value][neighbours] -> next state
     """
-    field_cell.state = CellState.DEAD
-    log.debug('3 or more 4, 5, 6, 7, 8 Alive: Cell (%d, %d) make_dead',
-              field_cell.row, field_cell.column)
+    def row(alive_counts: frozenset[int]) -> tuple[CellState, ...]:
+        return tuple(CellState.ALIVE if neighbours in alive_counts else CellState.DEAD
+                     for neighbours in range(9))
 
+    # CellState.DEAD.value == 0, CellState.ALIVE.value == 1
+    return row(birth), row(survival)
 
-def _rule_dead_equal_to_3(field_cell: Cell) -> None:
-    """Change Statte of the Cell.
 
-    Dead	->	==3 Alive Neighbour	->	Alive
+class Rule:
+    """Life-like rule compiled from the birth and survival neighbour numbers.
 
-    Args:
-        field_cell (FieldCell): Cell that should be processed
+    Rule is immutable, equal rules have the same canonical rulestring.
     """
-    field_cell.state = CellState.ALIVE
-    log.debug('alive neighbours = 3: Cell (%d, %d) make_alive',
-              field_cell.row, field_cell.column)
-
 
-def _apply_rules_to_alive_cell(field_cell: Cell) -> None:
-    """Process rules related to the only Alive cell.
-
-    Alive	->	0-1 Alive Neighbour	->	Dead
-    Alive	->	2-3 Alive Neighbour	->	Alive
-    Alive	->	4-8 Alive Neighbour	->	Dead
+    __slots__ = ('_birth', '_survival', '_table', '_lookup')
+
+    def __init__(self, birth: Iterable[int], survival: Iterable[int]) -> None:
+        """Initialize Rule.
+
+        Args:
+            birth (Iterable[int]): numbers of ALIVE neighbours that make DEAD cell ALIVE
+            survival (Iterable[int]): numbers of ALIVE neighbours that keep ALIVE cell ALIVE
+
+        Raises:
+            RuleStringException: On number of neighbours out of 0..8
+        """
+        self._birth: frozenset[int] = frozenset(birth)
+        self._survival: frozenset[int] = frozenset(survival)
+        if any(not 0 <= number <= 8 for number in self._birth | self._survival):
+            raise RuleStringException('Number of neighbours should be in range 0..8')
+        self._table: RuleTable = compile_rule_table(self._birth, self._survival)
+        self._lookup: bytes = bytes(state.value for row in self._table for state in row)
+
+    @property
+    def birth(self) -> frozenset[int]:
+        """Return numbers of ALIVE neighbours that make DEAD cell ALIVE."""
+        return self._birth
+
+    @property
+    def survival(self) -> frozenset[int]:
+        """Return numbers of ALIVE neighbours that keep ALIVE cell ALIVE."""
+        return self._survival
+
+    @property
+    def table(self) -> RuleTable:
+        """Return lookup table: table[state.value][neighbours] -> next state."""
+        return self._table
+
+    @property
+    def lookup(self) -> bytes:
+        """Return flat lookup table of state values: lookup[state * 9 + neighbours]."""
+        return self._lookup
+
+    @property
+    def rulestring(self) -> str:
+        """Return canonical rulestring, for example 'B3/S23'."""
+        birth: str = ''.join(str(number) for number in sorted(self._birth))
+        survival: str = ''.join(str(number) for number in sorted(self._survival))
+        return f'B{birth}/S{survival}'
+
+    @property
+    def is_birth_on_empty(self) -> bool:
+        """Return True if DEAD cell without ALIVE neighbours is born (B0 rules)."""
+        return 0 in self._birth
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if rules have the same birth and survival numbers."""
+        if not isinstance(other, Rule):
+            return NotImplemented
+        return self._birth == other._birth and self._survival == other._survival
+
+    def __hash__(self) -> int:
+        """Return hash of the rule."""
+        return hash((self._birth, self._survival))
+
+    def __repr__(self) -> str:
+        """Return string representation of the rule."""
+        return f'Rule({self.rulestring!r})'
+
+    def __str__(self) -> str:
+        """Return rulestring of the rule."""
+        return self.rulestring
+
+
+def parse_rule(rulestring: str) -> Rule:
+    """Parse rulestring of the Life-like rule.
+
+    Both B/S notation ('B36/S23', 'b36s23') and S/B notation ('23/36')
+    are accepted.
 
     Args:
-        field_cell (FieldCell): Cell that should be processed
-    """
-    log.debug('In _apply_rules_to_alive_cell')
-    if field_cell.neighbours in [0, 1]:  # 0 or 1
-        _rule_alive_from_0_to_1(field_cell)
-    elif (field_cell.neighbours in [2, 3]
-          and field_cell.neighbours <= 3):  # 2 or 3
-        _rule_alive_from_2_to_3(field_cell)
-    elif field_cell.neighbours > 3:  # 3 or more 4, 5, 6, 7, 8
-        _rule_alive_from_4_to_8(field_cell)
-    log.debug('Out _apply_rules_to_alive_cell')
+        rulestring (str): rulestring
 
+    Returns:
+        Rule: compiled rule
 
-def _apply_rules_to_dead_cell(field_cell: Cell) -> None:
-    """Process rules related to the only Dead cell.
-
-    Dead	->	==3 Alive Neighbour	->	Alive
-    Args:
-        field_cell (FieldCell): Cell that should be processed
+    Raises:
+        RuleStringException: On incorrect rulestring
     """
-    log.debug('In _apply_rules_to_dead_cell')
-    if field_cell.neighbours == 3:
-        _rule_dead_equal_to_3(field_cell)
-    log.debug('Out _apply_rules_to_dead_cell')
-
-
-def apply_rules_and_change_state(field_cell: Cell) -> None:
+    text: str = rulestring.strip().upper()
+    match: re.Match = _BIRTH_SURVIVAL.match(text)
+    if match is not None:
+        birth, survival = match.group(1), match.group(2)
+    else:
+        match = _SURVIVAL_BIRTH.match(text)
+        if match is None:
+            raise RuleStringException(f'Incorrect rulestring: {rulestring}')
+        survival, birth = match.group(1), match.group(2)
+    return Rule((int(number) for number in birth), (int(number) for number in survival))
+
+
+CONWAY_RULE: Rule = parse_rule('B3/S23')
+HIGHLIFE_RULE: Rule = parse_rule('B36/S23')
+SEEDS_RULE: Rule = parse_rule('B2/S')
+DAY_AND_NIGHT_RULE: Rule = parse_rule('B3678/S34678')
+PRESET_RULES: dict[str, Rule] = {
+    'Conway': CONWAY_RULE,
+    'HighLife': HIGHLIFE_RULE,
+    'Seeds': SEEDS_RULE,
+    'Day & Night': DAY_AND_NIGHT_RULE,
+}
+
+# Alive	->	0-1 Alive Neighbour	->	Dead
+# Alive	->	2-3 Alive Neighbour	->	Alive
+# Alive	->	4-8 Alive Neighbour	->	Dead
+# Dead	->	==3 Alive Neighbour	->	Alive
+CONWAY_RULE_TABLE: RuleTable = CONWAY_RULE.table
+
+
+def apply_rules_and_change_state(field_cell: Cell, rule_table: RuleTable = CONWAY_RULE_TABLE) -> None:
     """Process cell state based on the rules of game.
 
-    Rules:
+    Rules (B3/S23 by default):
     Alive	->	0-1 Alive Neighbour	->	Dead
     Alive	->	2-3 Alive Neighbour	->	Alive
     Alive	->	4-8 Alive Neighbour	->	Dead
@@ -104,11 +169,6 @@ def apply_rules_and_change_state(field_cell: Cell) -> None:
 
     Args:
         field_cell (FieldCell): Cell that should be processed
+        rule_table (RuleTable, optional): compiled rule. Defaults to CONWAY_RULE_TABLE.
     """
-    log.debug('In apply_rules_and_change_state')
-    state_processors = {
-        CellState.ALIVE: _apply_rules_to_alive_cell,
-        CellState.DEAD: _apply_rules_to_dead_cell,
-    }
-    state_processors[field_cell.state](field_cell)
-    log.debug('Out apply_rules_and_change_state')
+    field_cell.state = rule_table[field_cell.state.value][field_cell.neighbours]
@@ -0,0 +1,168 @@
+"""Definition of the board topologies and their wraparound indices.
+
+Topology defines what is beyond the edges of the board. Neighbours of the
+edge cells are resolved by indices precomputed once per board size, so
+engines don't check bounds or wrap coordinates per lookup.
+"""
+import enum
+from array import array
+
+from gameoflifeapi.logic.data.sparse_field import NEIGHBOUR_OFFSETS
+
+OUTSIDE: int = -1
+NEIGHBOURS_PER_CELL: int = len(NEIGHBOUR_OFFSETS)
+
+
+class Topology(enum.Enum):
+    """Represent topology of the board.
+
+    BOUNDED - cells beyond the edges are always DEAD.
+    TORUS - left edge is glued to the right one and top edge to the bottom one.
+    KLEIN_BOTTLE - as TORUS, but top and bottom edges are glued with a twist:
+                   crossing them mirrors the column.
+    INFINITE - field grows when ALIVE cells come close to its edges, the
+               board itself is BOUNDED between growths.
+    """
+
+    BOUNDED: str = 'bounded'
+    TORUS: str = 'torus'
+    KLEIN_BOTTLE: str = 'klein'
+    INFINITE: str = 'infinite'
+
+    @property
+    def is_wrapped(self) -> bool:
+        """Return True if cells beyond the edges are cells of the board."""
+        return self in (Topology.TORUS, Topology.KLEIN_BOTTLE)
+
+
+class Wraparound:
+    """Precomputed mapping of coordinates just beyond the edges to the board cells.
+
+    Coordinates in ranges -1..rows and -1..columns are resolved by two table
+    lookups: row map and column map selected by the row (ghost rows of the
+    Klein bottle use mirrored column map).
+    """
+
+    __slots__ = ('_topology', '_rows', '_columns', '_rows_map', '_columns_maps')
+
+    def __init__(self, topology: Topology, rows: int, columns: int) -> None:
+        """Initialize Wraparound.
+
+        Args:
+            topology (Topology): topology of the board
+            rows (int): Number of rows
+            columns (int): Number of columns
+        """
+        self._topology: Topology = topology
+        self._rows: int = rows
+        self._columns: int = columns
+        wrapped: bool = topology.is_wrapped
+        self._rows_map: tuple[int, ...] = _axis_map(rows, wrapped)
+        columns_map: tuple[int, ...] = _axis_map(columns, wrapped)
+        ghost_columns_map: tuple[int, ...] = columns_map
+        if topology is Topology.KLEIN_BOTTLE:
+            ghost_columns_map = tuple(columns - 1 - column for column in columns_map)
+        self._columns_maps: tuple[tuple[int, ...], ...] = (
+            (ghost_columns_map,) + (columns_map,) * rows + (ghost_columns_map,)
+        )
+
+    @property
+    def topology(self) -> Topology:
+        """Return topology of the board."""
+        return self._topology
+
+    def resolve(self, row: int, column: int) -> tuple[int, int]:
+        """Return board cell at the coordinates.
+
+        Args:
+            row (int): ROW coordinate in range -1..rows
+            column (int): COLUMN coordinate in range -1..columns
+
+        Returns:
+            tuple[int, int]: coordinates on the board, or None for the cell
+                             beyond the bounded edge
+        """
+        wrapped_row: int = self._rows_map[row + 1]
+        wrapped_column: int = self._columns_maps[row + 1][column + 1]
+        if wrapped_row == OUTSIDE or wrapped_column == OUTSIDE:
+            return None
+        return wrapped_row, wrapped_column
+
+    def padded_ghost_indices(self) -> tuple[list[int], list[int]]:
+        """Return where ghost cells of the padded board are copied from.
+
+        Padded board has one ghost cell on every side and is stored row-major
+        with stride columns + 2.
+
+        Returns:
+            tuple[list[int], list[int]]: flat indices of the ghost cells and flat
+                                         indices of their source cells, empty for
+                                         the bounded topologies
+        """
+        stride: int = self._columns + 2
+        targets: list[int] = []
+        sources: list[int] = []
+        ghosts: list[tuple[int, int]] = (
+            [(row, column) for row in (-1, self._rows) for column in range(-1, self._columns + 1)]
+            + [(row, column) for row in range(self._rows) for column in (-1, self._columns)]
+        )
+        for (row, column) in ghosts:
+            source: tuple[int, int] = self.resolve(row, column)
+            if source is not None:
+                targets.append((row + 1) * stride + column + 1)
+                sources.append((source[0] + 1) * stride + source[1] + 1)
+        return targets, sources
+
+    def neighbour_table(self) -> array:
+        """Return flat table of the neighbour indices of every cell.
+
+        Cells are indexed row-major, the table keeps NEIGHBOURS_PER_CELL
+        indices per cell in NEIGHBOUR_OFFSETS order, so neighbours of the cell
+        with index i are table[i * 8:i * 8 + 8]. Neighbours beyond the bounded
+        edge are the sentinel index rows * columns, which is the index of the
+        cell that is always DEAD.
+
+        Returns:
+            array: 'i' array with rows * columns * 8 indices
+        """
+        rows: int = self._rows
+        columns: int = self._columns
+        sentinel: int = rows * columns
+        table: array = array('i', bytes(sentinel * NEIGHBOURS_PER_CELL * array('i').itemsize))
+        for (position, (row_diff, col_diff)) in enumerate(NEIGHBOUR_OFFSETS):
+            plane: array = array('i')
+            for row in range(rows):
+                neighbour_row: int = self._rows_map[row + row_diff + 1]
+                if neighbour_row == OUTSIDE:
+                    plane.extend([sentinel] * columns)
+                    continue
+                columns_map: tuple[int, ...] = self._columns_maps[row + row_diff + 1]
+                base: int = neighbour_row * columns
+                start: int = len(plane)
+                if 0 <= row + row_diff < rows:
+                    # inner row: neighbours are contiguous, only edge columns are resolved
+                    plane.extend(range(base + col_diff, base + columns + col_diff))
+                    edges: range = range(0, columns, columns - 1) if col_diff else range(0)
+                else:
+                    plane.extend(range(columns))
+                    edges = range(columns)
+                for column in edges:
+                    neighbour_column: int = columns_map[column + col_diff + 1]
+                    plane[start + column] = sentinel if neighbour_column == OUTSIDE else base + neighbour_column
+            table[position::NEIGHBOURS_PER_CELL] = plane
+        return table
+
+
+def _axis_map(size: int, wrapped: bool) -> tuple[int, ...]:
+    """Return map of the coordinate + 1 to the coordinate on the axis.
+
+    Args:
+        size (int): size of the axis
+        wrapped (bool): True if the axis is closed into the ring
+
+    Returns:
+        tuple[int, ...]: size + 2 indices, OUTSIDE beyond the bounded axis
+    """
+    before: int = size - 1 if wrapped else OUTSIDE
+    after: int = 0 if wrapped else OUTSIDE
+    return (before,) + tuple(range(size)) + (after,)
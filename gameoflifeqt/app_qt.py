@@ -3,7 +3,7 @@ import logging
 
 from gameoflifeqt.widgets.application_widget import GameOfLifeQtApplication
 
-logging.basicConfig(level=logging.DEBUG,
+logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s %(levelname)s [%(name)s %(funcName)s] %(message)s')
 
 log: logging.Logger = logging.getLogger(__name__)
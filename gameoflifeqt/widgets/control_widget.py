@@ -2,26 +2,42 @@
 import logging
 import sys
 
-from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (QFileDialog, QGridLayout, QGroupBox, QMainWindow,
-                             QMenu, QMenuBar, QPushButton, QSizePolicy,
+                             QMenu, QMenuBar, QMessageBox, QPushButton,
+                             QSizePolicy, QSpinBox, QStackedWidget,
                              QVBoxLayout, QWidget)
 
 from gameoflifeapi.api.game_controller import GameLifeController
 from gameoflifeapi.api.persistance import GamePicklePersistance
-from gameoflifeapi.logic.data.dtos import GameDataDto, NewGameDataDto
+from gameoflifeapi.logic.data.dtos import (GameDataDto, GameSnapshotDto,
+                                           NewGameDataDto)
+from gameoflifeapi.logic.exceptions import GenerationValueException
+from gameoflifeapi.logic.history import DEFAULT_MEMORY_BUDGET
+from gameoflifeapi.logic.topology import Topology
+from gameoflifeqt.widgets.field.canvas_widget import QtGameFieldCanvas
 from gameoflifeqt.widgets.field.field_widget import QtGameFieldWidget
+from gameoflifeqt.widgets.generation_worker import QtGenerationWorker
 from gameoflifeqt.widgets.new_game_popup_widget import QtNewGamePopUpWidget
 
 log: logging.Logger = logging.getLogger(__name__)
 
 TEXT_AUTO_UPDATE_UP: str = 'Activate Auto Genearation'
 TEXT_AUTO_UPDATE_DOWN: str = 'Disable Auto Genearation'
+MAX_BUTTON_FIELD_CELLS: int = 50 * 50
+# 0 is the maximal speed
+DEFAULT_GENERATIONS_PER_SECOND: int = 3
+MAX_GENERATIONS_PER_SECOND: int = 1000
 
 
 class QtGameControlWidget(QMainWindow):
-    """Class represents main app widget with all controls."""
+    """Class represents main app widget with all controls.
+
+    Generations are created by the worker thread at the selected speed, it
+    passes snapshots of them to the GUI thread at a capped frame rate. Only
+    the newest snapshot is shown, snapshots outdated by the time they are
+    delivered are dropped.
+    """
 
     def __init__(self, width: int, height: int) -> None:
         """Initialize Main Control widget."""
@@ -32,12 +48,23 @@ class QtGameControlWidget(QMainWindow):
         self._game_persistence: GamePicklePersistance = GamePicklePersistance()
         self._controller: GameLifeController = GameLifeController(
             self._game_persistence,
-            self._on_generation_created)
-        self._field_widget = QtGameFieldWidget(self, self._controller)
-
-        self._timer: QTimer = QTimer(self)
-        self._timer.setInterval(300)
-        self._timer.timeout.connect(self._on_timer_update)
+            self._on_generation_created,
+            history_budget=DEFAULT_MEMORY_BUDGET,
+            detect_cycles=True)
+        self._worker: QtGenerationWorker = QtGenerationWorker(self, self._controller)
+        self._worker.frame_created.connect(self._on_frame_created)
+        self._worker.generation_finished.connect(self._on_generation_finished)
+        self._is_auto_update: bool = False
+        # True while the loaded game replaces the shown one, it is shown after the field widget is switched
+        self._is_loading: bool = False
+        self._shown_snapshot: GameSnapshotDto = None
+        self._generations_per_second: float = 0
+        self._field_buttons_widget = QtGameFieldWidget(self, self._controller)
+        self._field_canvas_widget = QtGameFieldCanvas(self, self._controller)
+        self._field_stack: QStackedWidget = QStackedWidget(self)
+        self._field_stack.addWidget(self._field_buttons_widget)
+        self._field_stack.addWidget(self._field_canvas_widget)
+        self._field_widget = self._field_buttons_widget
 
         self._init_menu()
         self._init_controls()
@@ -87,26 +114,49 @@ class QtGameControlWidget(QMainWindow):
         self._control_widget_container = QWidget(self)
         self._control_widget_group: QGroupBox = QGroupBox(self._control_widget_container)
 
+        self._button_prev_gen: QPushButton = QPushButton(
+            'Previous Generation', self._control_widget_container)
         self._button_next_gen: QPushButton = QPushButton(
             'Generate new Generation', self._control_widget_container)
         self._button_toggle_autoupdate: QPushButton = QPushButton(
             TEXT_AUTO_UPDATE_UP, self._control_widget_container)
+        self._spin_box_speed: QSpinBox = QSpinBox(self._control_widget_container)
+        self._spin_box_goto: QSpinBox = QSpinBox(self._control_widget_container)
+        self._button_goto: QPushButton = QPushButton(
+            'Go to Generation', self._control_widget_container)
 
+        self._button_prev_gen.setEnabled(False)
         self._button_next_gen.setEnabled(False)
         self._button_toggle_autoupdate.setEnabled(False)
-
+        self._spin_box_goto.setEnabled(False)
+        self._button_goto.setEnabled(False)
+        self._spin_box_goto.setMaximum(2 ** 31 - 1)
+        self._spin_box_speed.setRange(0, MAX_GENERATIONS_PER_SECOND)
+        self._spin_box_speed.setSuffix(' gen/s')
+        self._spin_box_speed.setSpecialValueText('Max speed')
+        self._spin_box_speed.setValue(DEFAULT_GENERATIONS_PER_SECOND)
+        self._spin_box_speed.setToolTip('Generations per second of the auto generation')
+        self._worker.target_rate = DEFAULT_GENERATIONS_PER_SECOND
+
+        self._button_prev_gen.clicked.connect(self._on_button_prev_gen)
         self._button_next_gen.clicked.connect(self._on_button_next_gen)
         self._button_toggle_autoupdate.clicked.connect(
             self._on_button_toggle_autoupdate)
+        self._button_goto.clicked.connect(self._on_button_goto)
+        self._spin_box_speed.valueChanged.connect(self._on_speed_changed)
 
-        self._button_next_gen.setSizePolicy(QSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
-        self._button_toggle_autoupdate.setSizePolicy(QSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
+        for widget in (self._button_prev_gen, self._button_next_gen, self._button_toggle_autoupdate,
+                       self._spin_box_speed, self._spin_box_goto, self._button_goto):
+            widget.setSizePolicy(QSizePolicy(
+                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
 
         grid_layout_group: QGridLayout = QGridLayout(self._control_widget_container)
-        grid_layout_group.addWidget(self._button_next_gen, 0, 0)
-        grid_layout_group.addWidget(self._button_toggle_autoupdate, 0, 1)
+        grid_layout_group.addWidget(self._button_prev_gen, 0, 0)
+        grid_layout_group.addWidget(self._button_next_gen, 0, 1)
+        grid_layout_group.addWidget(self._button_toggle_autoupdate, 0, 2)
+        grid_layout_group.addWidget(self._spin_box_speed, 0, 3)
+        grid_layout_group.addWidget(self._spin_box_goto, 0, 4)
+        grid_layout_group.addWidget(self._button_goto, 0, 5)
 
         self._control_widget_group.setLayout(grid_layout_group)
         self._control_widget_group.setMinimumSize(150, 50)
@@ -121,32 +171,50 @@ class QtGameControlWidget(QMainWindow):
 
         main_layout.addWidget(self.menuBar())
         main_layout.addWidget(self._control_widget_group)
-        main_layout.addWidget(self._field_widget)
+        main_layout.addWidget(self._field_stack)
 
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
         log.debug('QtGameControlWidget._init_main_layout.exit')
 
-    def _stop_timer(self) -> None:
-        """Stop the timer and configure controls related to timer."""
-        if self._timer.isActive():
-            self._timer.stop()
+    def _stop_auto_update(self) -> None:
+        """Stop creation of generations, wait for the generation being created and configure controls."""
+        self._worker.stop_run()
+        self._finish_auto_update()
+
+    def _finish_auto_update(self) -> None:
+        """Configure controls related to auto update after the run is finished."""
+        if self._is_auto_update:
+            self._is_auto_update = False
+            self._generations_per_second = 0
             self._button_toggle_autoupdate.setDown(False)
             self._button_toggle_autoupdate.setText(TEXT_AUTO_UPDATE_UP)
             self._button_next_gen.setEnabled(True)
-
-    def _start_timer(self) -> None:
-        """Start the timer and configure controls related to timer."""
-        if not self._timer.isActive():
-            self._timer.start()
+            self._update_window_title()
+        self._update_history_controls()
+
+    def _start_auto_update(self) -> None:
+        """Start creation of generations at the selected speed and configure controls."""
+        if not self._is_auto_update:
+            self._worker.wait()
+            self._is_auto_update = self._worker.start_run()
             self._button_toggle_autoupdate.setDown(True)
             self._button_toggle_autoupdate.setText(TEXT_AUTO_UPDATE_DOWN)
             self._button_next_gen.setEnabled(False)
+            self._update_history_controls()
+
+    def _update_history_controls(self) -> None:
+        """Enable history controls of the started game while no generations are created."""
+        is_enabled: bool = (self._button_toggle_autoupdate.isEnabled() and not self._is_auto_update
+                            and not self._worker.is_busy)
+        self._button_prev_gen.setEnabled(is_enabled and self._controller.can_step_back)
+        self._spin_box_goto.setEnabled(is_enabled)
+        self._button_goto.setEnabled(is_enabled)
 
     def _on_action_new_game(self) -> None:
         """Process new game menu click."""
         log.debug('QtGameControlWidget._on_action_new_game')
-        self._stop_timer()
+        self._stop_auto_update()
         dial: QtNewGamePopUpWidget = QtNewGamePopUpWidget()
         dial_res: int = dial.exec()
 
@@ -154,13 +222,17 @@ class QtGameControlWidget(QMainWindow):
             new_game: NewGameDataDto = NewGameDataDto(
                 number_of_columns=dial.number_of_columns,
                 number_of_rows=dial.number_of_rows,
-                is_random_first_generation=dial.randomize_on_start
+                is_random_first_generation=dial.randomize_on_start,
+                engine_type=dial.engine_type,
+                rule=dial.rule,
+                topology=dial.topology,
+                seed=dial.seed,
+                density=dial.density
             )
             self._before_game_start(new_game)
             self._controller.start_new_game(new_game)
             if not dial.randomize_on_start:
-                self._field_widget.update_view_state()
-                self.setWindowTitle(f'Current Generation: {self._controller.game_state.generation}')
+                self._show_snapshot(self._controller.snapshot())
         log.debug('QtGameControlWidget._on_action_new_game.exit')
 
     def _before_game_start(self, game_data: GameDataDto) -> None:
@@ -172,6 +244,15 @@ class QtGameControlWidget(QMainWindow):
 
         rows: int = game_data.number_of_rows
         cols: int = game_data.number_of_columns
+        # buttons can't follow the growing field of the infinite topology
+        if rows * cols > MAX_BUTTON_FIELD_CELLS or game_data.topology is Topology.INFINITE:
+            self._field_widget = self._field_canvas_widget
+            self._field_stack.setCurrentWidget(self._field_widget)
+            self.resize(self._width, self._height)
+            self.move(0, 0)
+            return
+        self._field_widget = self._field_buttons_widget
+        self._field_stack.setCurrentWidget(self._field_widget)
         width: int = self._width // rows
         height: int = self._height // cols
         size_w = width * rows
@@ -185,7 +266,7 @@ class QtGameControlWidget(QMainWindow):
     def _on_action_save_game(self) -> None:
         """Process save game menu click."""
         log.debug('QtGameControlWidget._on_action_save_game')
-        self._stop_timer()
+        self._stop_auto_update()
 
         file_name, _ = QFileDialog.getSaveFileName(None, 'Save File', './', 'GameSave (*.gsave)')
         self._controller.save_game(file_name)
@@ -194,54 +275,122 @@ class QtGameControlWidget(QMainWindow):
     def _on_action_load_game(self) -> None:
         """Process load game menu click."""
         log.debug('QtGameControlWidget._on_action_load_game')
-        self._stop_timer()
+        self._stop_auto_update()
 
         file_name, _ = QFileDialog.getOpenFileName(None, 'Open Save File', './', 'GameSave (*.gsave)')
-        self._controller.load_game(file_name)
+        self._is_loading = True
+        try:
+            self._controller.load_game(file_name)
+        finally:
+            self._is_loading = False
         game_data = GameDataDto(
-            number_of_rows=self._controller.game_state.game_field.rows,
-            number_of_columns=self._controller.game_state.game_field.columns,
+            number_of_rows=self._controller.rows,
+            number_of_columns=self._controller.columns,
             is_random_first_generation=False,
-            generation=self._controller.game_state.generation,
-            game_field=self._controller.game_state.game_field
+            generation=self._controller.generation,
+            game_field=self._controller.game_state.game_field,
+            topology=self._controller.topology
         )
         self._before_game_start(game_data)
-        self._field_widget.update_view_state()
+        self._show_snapshot(self._controller.snapshot())
         self._button_next_gen.setEnabled(True)
         self._button_toggle_autoupdate.setEnabled(True)
+        self._update_history_controls()
         log.debug('QtGameControlWidget._on_action_load_game.exit')
 
     def _on_action_exit(self) -> None:
         """Process exit game menu click."""
         log.debug('QtGameControlWidget._on_action_exit')
-        self._stop_timer()
+        self._stop_auto_update()
         log.debug('QtGameControlWidget._on_action_exit.exit')
         sys.exit()
 
+    def _on_button_prev_gen(self) -> None:
+        """Process button previous generation click."""
+        log.debug('QtGameControlWidget._on_button_prev_gen')
+        self._worker.wait()
+        self._controller.step_back()
+        log.debug('QtGameControlWidget._on_button_prev_gen.exit')
+
+    def _on_button_goto(self) -> None:
+        """Process button go to generation click."""
+        log.debug('QtGameControlWidget._on_button_goto')
+        self._worker.wait()
+        try:
+            self._controller.goto(self._spin_box_goto.value())
+        except GenerationValueException as err:
+            QMessageBox.warning(self, 'Generation is not available', str(err))
+        log.debug('QtGameControlWidget._on_button_goto.exit')
+
     def _on_button_next_gen(self) -> None:
         """Process button next generation click."""
         log.debug('QtGameControlWidget._on_button_next_gen')
-        self._controller.increment_generation()
+        self._worker.request_generation()
         log.debug('QtGameControlWidget._on_button_next_gen.exit')
 
     def _on_button_toggle_autoupdate(self) -> None:
         """Process button autoupdate click."""
         log.debug('QtGameControlWidget._on_button_toggle_autoupdate')
-        if self._timer.isActive():
-            self._stop_timer()
+        if self._is_auto_update:
+            self._stop_auto_update()
         else:
-            self._start_timer()
+            self._start_auto_update()
         log.debug('QtGameControlWidget._on_button_toggle_autoupdate.exit')
 
-    def _on_timer_update(self) -> None:
-        """Process on time tick event."""
-        log.debug('QtGameControlWidget._on_auto_update')
-        self._on_button_next_gen()
-        log.debug('QtGameControlWidget._on_auto_update.exit')
+    def _on_speed_changed(self, value: int) -> None:
+        """Apply the selected speed, the running auto update changes speed at once."""
+        log.debug('QtGameControlWidget._on_speed_changed: %d', value)
+        self._worker.target_rate = value
 
     def _on_generation_created(self) -> None:
-        """Process game state change event."""
+        """Process game state change event, called on the thread which changed the game.
+
+        Generations created by the worker are shown by its frames, the loaded
+        game is shown when the field widget is switched to it, the other
+        changes are shown at once.
+        """
         log.debug('QtGameControlWidget._on_generation_created')
-        self._field_widget.update_view_state()
-        self.setWindowTitle(f'Current Generation: {self._controller.game_state.generation}')
+        if not self._is_loading and not self._worker.is_worker_thread():
+            self._show_snapshot(self._controller.snapshot())
         log.debug('QtGameControlWidget._on_generation_created.exit')
+
+    def _on_frame_created(self, snapshot: GameSnapshotDto, generations_per_second: float) -> None:
+        """Show the frame created by the worker.
+
+        Args:
+            snapshot (GameSnapshotDto): generation to show
+            generations_per_second (float): measured speed of the worker, 0 until measured
+        """
+        if generations_per_second:
+            self._generations_per_second = generations_per_second
+        self._show_snapshot(snapshot)
+
+    def _on_generation_finished(self) -> None:
+        """Configure controls when the worker finished, the run stops by itself on a cycle."""
+        self._finish_auto_update()
+
+    def _show_snapshot(self, snapshot: GameSnapshotDto) -> None:
+        """Show the snapshot unless newer snapshot was already created.
+
+        Args:
+            snapshot (GameSnapshotDto): generation to show
+        """
+        if snapshot.sequence < self._controller.snapshot_sequence:
+            log.debug('QtGameControlWidget._show_snapshot: dropped %d', snapshot.sequence)
+            return
+        self._field_widget.update_view_state(snapshot)
+        self._shown_snapshot = snapshot
+        self._update_window_title()
+        self._update_history_controls()
+
+    def _update_window_title(self) -> None:
+        """Show number of the shown generation, speed of auto update and detected cycle in the window title."""
+        snapshot: GameSnapshotDto = self._shown_snapshot
+        if snapshot is None:
+            return
+        title: str = f'Current Generation: {snapshot.generation}'
+        if self._is_auto_update and self._generations_per_second:
+            title += f' | {self._generations_per_second:.1f} gen/s'
+        if snapshot.cycle is not None:
+            title += f' ({snapshot.cycle})'
+        self.setWindowTitle(title)
@@ -32,6 +32,7 @@ class QFieldButtonCell(QPushButton):
         size_policy.setWidthForHeight(True)
         self.setSizePolicy(size_policy)
         self.setMinimumSize(10, 10)
+        self._is_alive: bool = None
         self.update_button_state()
 
     def _apply_style(self, color: str):
@@ -44,9 +45,20 @@ class QFieldButtonCell(QPushButton):
     def _apply_style_green(self):
         self._apply_style(_STYLE_GREEN)
 
-    def update_button_state(self):
-        """Calculate and update button color."""
-        if self._cell.state is CellState.ALIVE:
+    def update_button_state(self, is_alive: bool = None):
+        """Calculate and update button color.
+
+        Style is applied only when the cell state differs from the shown one.
+
+        Args:
+            is_alive (bool, optional): state to show, state of the cell by default
+        """
+        if is_alive is None:
+            is_alive = self._cell.state is CellState.ALIVE
+        if is_alive is self._is_alive:
+            return
+        self._is_alive = is_alive
+        if is_alive:
             self._apply_style_green()
         else:
             self._apply_style_gray()
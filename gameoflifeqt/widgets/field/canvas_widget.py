@@ -0,0 +1,253 @@
+"""Exports QtGameFieldCanvas."""
+import logging
+import math
+
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtGui import (QColor, QImage, QMouseEvent, QPainter, QPaintEvent,
+                         QWheelEvent)
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+from gameoflifeapi.api.game_controller import GameLifeController
+from gameoflifeapi.logic.data.dtos import GameSnapshotDto
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.exceptions import GameIsNotStartedException
+
+log: logging.Logger = logging.getLogger(__name__)
+
+_COLOR_BACKGROUND: QColor = QColor('#808080')
+_COLOR_GREEN: QColor = QColor('#7FFF00')
+_COLOR_GRAY: QColor = QColor('#F0FFFF')
+_COLOR_GRID: QColor = QColor('#000000')
+
+_MIN_ZOOM: float = 0.05
+_MAX_ZOOM: float = 64.0
+_ZOOM_STEP: float = 1.25
+_GRID_MIN_ZOOM: float = 8.0
+_DRAG_DISTANCE: int = 4
+
+
+class QtGameFieldCanvas(QWidget):
+    """Field widget which paints the whole board as a single image.
+
+    Every cell is one pixel of an indexed image built directly on top of
+    the cell buffer of the generation snapshot, which is scaled by zoom
+    and moved by pan.
+    Mouse wheel zooms around the cursor, dragging with the left or middle
+    mouse button pans the view and left click switches state of the cell
+    under the cursor. Dragging with the right mouse button paints ALIVE
+    cells, with Shift pressed it erases them.
+    """
+
+    def __init__(self, parent, controller: GameLifeController) -> None:
+        """Initialize Field Canvas."""
+        QWidget.__init__(self, parent)
+        log.debug('__init__')
+        self._controller: GameLifeController = controller
+        self._image: QImage = None
+        self._buffer: bytes = None
+        self._zoom: float = 1.0
+        self._offset: QPointF = QPointF(0, 0)
+        self._press_position: QPointF = None
+        self._last_position: QPointF = None
+        self._is_dragged: bool = False
+        self._paint_state: CellState = None
+        self._origin: tuple[int, int] = (0, 0)
+        self.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
+        self.setMinimumSize(100, 100)
+
+    @property
+    def zoom(self) -> float:
+        """Return number of pixels used for one cell."""
+        return self._zoom
+
+    def generate_field_view(self, snapshot: GameSnapshotDto = None) -> None:
+        """Build view for the current field and fit it into the widget.
+
+        Args:
+            snapshot (GameSnapshotDto, optional): generation to show, the current
+                                                  generation of the controller by default
+        """
+        if self._controller.rows == 0:
+            raise GameIsNotStartedException('Game Is Not Started')
+        if snapshot is None:
+            snapshot = self._controller.snapshot()
+        self._origin = snapshot.origin
+        self._render_image(snapshot)
+        rows: int = snapshot.rows
+        columns: int = snapshot.columns
+        self._zoom = max(_MIN_ZOOM, min(_MAX_ZOOM, self.width() / columns, self.height() / rows))
+        self._offset = QPointF((self.width() - columns * self._zoom) / 2,
+                               (self.height() - rows * self._zoom) / 2)
+        self.update()
+
+    def update_view_state(self, snapshot: GameSnapshotDto = None) -> None:
+        """Update current state of the field canvas.
+
+        Args:
+            snapshot (GameSnapshotDto, optional): generation to show, the current
+                                                  generation of the controller by default
+        """
+        log.debug('QtGameFieldCanvas.update_view_state')
+        if snapshot is None:
+            snapshot = self._controller.snapshot()
+        if self._image is None:
+            self.generate_field_view(snapshot)
+        else:
+            self._render_image(snapshot)
+            self.update()
+        log.debug('QtGameFieldCanvas.update_view_state.exit')
+
+    def clear_field(self) -> None:
+        """Remove the current image."""
+        self._image = None
+        self._buffer = None
+        self.update()
+
+    def cell_at(self, position: QPointF) -> tuple[int, int]:
+        """Map widget position to the cell coordinates.
+
+        Args:
+            position (QPointF): position in widget coordinates
+
+        Returns:
+            tuple[int, int]: (row, column), or None outside of the field
+        """
+        if self._image is None:
+            return None
+        row: int = math.floor((position.y() - self._offset.y()) / self._zoom)
+        column: int = math.floor((position.x() - self._offset.x()) / self._zoom)
+        if 0 <= row < self._image.height() and 0 <= column < self._image.width():
+            return row, column
+        return None
+
+    def zoom_at(self, position: QPointF, factor: float) -> None:
+        """Change zoom keeping the point under position in place.
+
+        Args:
+            position (QPointF): position in widget coordinates
+            factor (float): zoom multiplier
+        """
+        zoom: float = max(_MIN_ZOOM, min(_MAX_ZOOM, self._zoom * factor))
+        scale: float = zoom / self._zoom
+        self._offset = position - (position - self._offset) * scale
+        self._zoom = zoom
+        self.update()
+
+    def _render_image(self, snapshot: GameSnapshotDto) -> None:
+        """Wrap cell buffer of the snapshot into the image without copying.
+
+        When the field of the infinite topology grows, the view is moved by
+        the growth, so the cells stay in place on the screen.
+
+        Args:
+            snapshot (GameSnapshotDto): generation to show
+        """
+        origin: tuple[int, int] = snapshot.origin
+        if origin != self._origin:
+            self._offset -= QPointF((origin[1] - self._origin[1]) * self._zoom,
+                                    (origin[0] - self._origin[0]) * self._zoom)
+            self._origin = origin
+        rows: int = snapshot.rows
+        columns: int = snapshot.columns
+        self._buffer = snapshot.states
+        self._image = QImage(self._buffer, columns, rows, columns, QImage.Format.Format_Indexed8)
+        self._image.setColorTable([_COLOR_GRAY.rgb(), _COLOR_GREEN.rgb()])
+
+    def paintEvent(self, _event: QPaintEvent) -> None:  # noqa: N802
+        """Paint the field image scaled and moved by the current view."""
+        painter: QPainter = QPainter(self)
+        painter.fillRect(self.rect(), _COLOR_BACKGROUND)
+        if self._image is not None:
+            painter.translate(self._offset)
+            painter.scale(self._zoom, self._zoom)
+            painter.drawImage(0, 0, self._image)
+            if self._zoom >= _GRID_MIN_ZOOM:
+                self._paint_grid(painter)
+        painter.end()
+
+    def _paint_grid(self, painter: QPainter) -> None:
+        """Paint cell borders of the visible part of the field."""
+        rows: int = self._image.height()
+        columns: int = self._image.width()
+        first_row: int = max(0, math.floor(-self._offset.y() / self._zoom))
+        last_row: int = min(rows, math.ceil((self.height() - self._offset.y()) / self._zoom))
+        first_column: int = max(0, math.floor(-self._offset.x() / self._zoom))
+        last_column: int = min(columns, math.ceil((self.width() - self._offset.x()) / self._zoom))
+        painter.setPen(_COLOR_GRID)
+        for row in range(first_row, last_row + 1):
+            painter.drawLine(QPointF(first_column, row), QPointF(last_column, row))
+        for column in range(first_column, last_column + 1):
+            painter.drawLine(QPointF(column, first_row), QPointF(column, last_row))
+
+    def wheelEvent(self, event: QWheelEvent) -> None:  # noqa: N802
+        """Zoom the field around cursor position."""
+        steps: float = event.angleDelta().y() / 120
+        if steps:
+            self.zoom_at(event.position(), _ZOOM_STEP ** steps)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Remember position of the press to distinguish click from drag, or start painting."""
+        self._press_position = event.position()
+        self._last_position = event.position()
+        self._is_dragged = False
+        if event.button() is Qt.MouseButton.RightButton:
+            is_erase: bool = bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
+            self._paint_state = CellState.DEAD if is_erase else CellState.ALIVE
+            self._paint_stroke(event.position(), event.position())
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Pan the field or paint cells while mouse button is pressed."""
+        if self._press_position is None:
+            return
+        if self._paint_state is not None:
+            self._paint_stroke(self._last_position, event.position())
+            self._last_position = event.position()
+            return
+        distance: QPointF = event.position() - self._press_position
+        if not self._is_dragged and distance.manhattanLength() < _DRAG_DISTANCE:
+            return
+        self._is_dragged = True
+        self._offset += event.position() - self._last_position
+        self._last_position = event.position()
+        self.update()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Switch state of the clicked cell."""
+        is_click: bool = not self._is_dragged and event.button() is Qt.MouseButton.LeftButton
+        self._press_position = None
+        self._is_dragged = False
+        self._paint_state = None
+        if is_click:
+            self._on_field_click(event.position())
+
+    def _paint_stroke(self, start: QPointF, end: QPointF) -> None:
+        """Set the paint state to all cells under the segment by one bulk change.
+
+        Args:
+            start (QPointF): start of the segment in widget coordinates
+            end (QPointF): end of the segment in widget coordinates
+        """
+        steps: int = max(1, math.ceil((end - start).manhattanLength() / self._zoom))
+        cells: set[tuple[int, int]] = set()
+        for step in range(steps + 1):
+            cell: tuple[int, int] = self.cell_at(start + (end - start) * (step / steps))
+            if cell is not None:
+                cells.add(cell)
+        if cells:
+            self._controller.set_cells(cells, self._paint_state)
+            self._render_image(self._controller.snapshot())
+            self.update()
+
+    def _on_field_click(self, position: QPointF) -> None:
+        """Process on field cell click event.
+
+        Args:
+            position (QPointF): position of the click in widget coordinates
+        """
+        log.debug('QtGameFieldCanvas._on_field_click')
+        cell: tuple[int, int] = self.cell_at(position)
+        if cell is not None:
+            self._controller.trigger_cell(*cell)
+            self._render_image(self._controller.snapshot())
+            self.update()
+        log.debug('QtGameFieldCanvas._on_field_click.exit')
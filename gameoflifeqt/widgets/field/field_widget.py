@@ -4,6 +4,8 @@ import logging
 from PyQt6.QtWidgets import QGridLayout, QLayoutItem, QWidget
 
 from gameoflifeapi.api.game_controller import GameLifeController
+from gameoflifeapi.logic.data.dtos import GameSnapshotDto
+from gameoflifeapi.logic.data.field import Field
 from gameoflifeapi.logic.exceptions import GameIsNotStartedException
 from gameoflifeqt.widgets.field.button import QFieldButtonCell
 
@@ -29,6 +31,11 @@ class QtGameFieldWidget(QWidget):
 
     def _init_field_buttons(self) -> None:
         self._field_buttons: dict[tuple[int, int], QFieldButtonCell] = {}
+        self._game_field: Field = None
+        # states shown by the buttons, snapshots are compared with them
+        self._shown_states: bytes = None
+        # (rows, columns) of the buttons grid
+        self._grid_size: tuple[int, int] = None
 
     def generate_field_view(self) -> None:
         """Build view for passed field.
@@ -37,7 +44,8 @@ class QtGameFieldWidget(QWidget):
         """
         if self._controller.game_state is not None:
             self.clear_field()
-            field = self._controller.game_state.game_field.all_cells.values()
+            self._game_field = self._controller.game_state.game_field
+            field = self._game_field.all_cells.values()
             for cell in field:
                 btn: QFieldButtonCell = QFieldButtonCell(self, cell)
 
@@ -47,6 +55,7 @@ class QtGameFieldWidget(QWidget):
                 btn.clicked.connect(handler)
                 self._field_grid_layout.addWidget(btn, cell.row, cell.column)
                 self._field_buttons[(cell.row, cell.column)] = btn
+            self._grid_size = (self._game_field.rows, self._game_field.columns)
         else:
             raise GameIsNotStartedException('Game Is Not Started')
 
@@ -58,17 +67,41 @@ class QtGameFieldWidget(QWidget):
         """
         log.debug('QtGameFieldWidget._on_field_click')
         self._controller.trigger_cell(btn.cell.row, btn.cell.column)
-        btn.update_button_state()
+        self.update_view_state()
         log.debug('QtGameFieldWidget._on_field_click.exit')
 
-    def update_view_state(self) -> None:
-        """Update current state of the field widget."""
+    def update_view_state(self, snapshot: GameSnapshotDto = None) -> None:
+        """Update current state of the field widget.
+
+        Only buttons of cells which differ from the shown states are
+        repainted, so skipped snapshots don't leave outdated buttons. Grid
+        of buttons is rebuilt for the snapshot of other size, the snapshot
+        is not shown if the grid still doesn't match it.
+
+        Args:
+            snapshot (GameSnapshotDto, optional): generation to show, the current
+                                                  generation of the controller by default
+        """
         log.debug('QtGameFieldWidget.update_view_state')
-        if not self._field_buttons or len(self._field_buttons) == 0:
+        if snapshot is None:
+            snapshot = self._controller.snapshot()
+        size: tuple[int, int] = (snapshot.rows, snapshot.columns)
+        if not self._field_buttons or self._grid_size != size:
             self.generate_field_view()
+        if self._grid_size != size:
+            log.debug('QtGameFieldWidget.update_view_state: skipped snapshot of size %s', size)
+            return
+        states: bytes = snapshot.states
+        shown: bytes = self._shown_states
+        if shown is None or len(shown) != len(states):
+            indices = range(len(states))
         else:
-            for btn in self._field_buttons.values():
-                btn.update_button_state()
+            indices = (index for index, (state, shown_state) in enumerate(zip(states, shown))
+                       if state != shown_state)
+        columns: int = snapshot.columns
+        for index in indices:
+            self._field_buttons[divmod(index, columns)].update_button_state(states[index] == 1)
+        self._shown_states = states
         log.debug('QtGameFieldWidget.update_view_state.exit')
 
     def clear_field(self) -> None:
@@ -78,4 +111,7 @@ class QtGameFieldWidget(QWidget):
             if layout_item.widget():
                 layout_item.widget().deleteLater()
         self._field_buttons.clear()
+        self._game_field = None
+        self._shown_states = None
+        self._grid_size = None
         self.layout().update()
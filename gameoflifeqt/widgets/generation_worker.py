@@ -0,0 +1,150 @@
+"""Exports QtGenerationWorker."""
+import logging
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+from gameoflifeapi.api.game_controller import GameLifeController
+from gameoflifeapi.logic.data.dtos import GameSnapshotDto
+
+log: logging.Logger = logging.getLogger(__name__)
+
+MAX_FRAMES_PER_SECOND: int = 30
+# generations per second are measured over intervals of this number of seconds
+_RATE_INTERVAL: float = 0.5
+
+
+class QtGenerationWorker(QObject):
+    """Create generations of the controller off the GUI thread.
+
+    Generations are created by the single background thread, either one
+    generation or a run which lasts until it is stopped or the game enters
+    a cycle. Speed of the run is independent of rendering: generations are
+    created as fast as the engine can or at the target rate, while snapshots
+    for rendering are created at most MAX_FRAMES_PER_SECOND times per second
+    and for the last generation of the run. Generations between frames are
+    not rendered.
+    """
+
+    # snapshot to render and measured generations per second, 0 until measured
+    frame_created = pyqtSignal(GameSnapshotDto, float)
+    generation_finished = pyqtSignal()
+
+    def __init__(self, parent: QObject, controller: GameLifeController) -> None:
+        """Initialize Generation Worker."""
+        QObject.__init__(self, parent)
+        log.debug('__init__')
+        self._controller: GameLifeController = controller
+        self._pool: QThreadPool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._is_busy: bool = False
+        self._stop_requested: threading.Event = threading.Event()
+        self._thread_id: int = None
+        self._target_rate: float = 0
+        self.generation_finished.connect(self._on_generation_finished)
+
+    @property
+    def is_busy(self) -> bool:
+        """Return True while generations are being created."""
+        return self._is_busy
+
+    @property
+    def target_rate(self) -> float:
+        """Return target number of generations per second of the run, 0 for maximal speed."""
+        return self._target_rate
+
+    @target_rate.setter
+    def target_rate(self, value: float) -> None:
+        """Set target number of generations per second, it is applied to the current run too."""
+        self._target_rate = max(value, 0)
+
+    def is_worker_thread(self) -> bool:
+        """Return True if called on the thread which creates generations."""
+        return threading.get_ident() == self._thread_id
+
+    def request_generation(self) -> bool:
+        """Start creation of the next generation unless generations are being created.
+
+        Returns:
+            bool: True if creation was started
+        """
+        return self._start(1)
+
+    def start_run(self) -> bool:
+        """Start creation of generations at the target rate until stop_run.
+
+        Returns:
+            bool: True if the run was started
+        """
+        return self._start(None)
+
+    def stop_run(self) -> None:
+        """Stop the run and block until the generation being created is finished."""
+        self._stop_requested.set()
+        self.wait()
+
+    def wait(self) -> None:
+        """Block until generations being created are finished."""
+        self._pool.waitForDone()
+        self._is_busy = False
+
+    def _start(self, generations: int) -> bool:
+        """Start creation of number of generations, None for the run."""
+        if self._is_busy:
+            return False
+        self._is_busy = True
+        self._stop_requested.clear()
+        self._pool.start(lambda: self._create_generations(generations))
+        return True
+
+    def _create_generations(self, generations: int) -> None:
+        """Create generations and frames, runs on the worker thread.
+
+        Args:
+            generations (int): number of generations, None to run until stopped
+        """
+        self._thread_id = threading.get_ident()
+        frame_interval: float = 1 / MAX_FRAMES_PER_SECOND
+        now: float = time.perf_counter()
+        next_generation: float = now
+        last_frame: float = now
+        rate_started: float = now
+        rate_generations: int = 0
+        rate: float = 0
+        created: int = 0
+        try:
+            while generations is None or created < generations:
+                target_rate: float = self._target_rate
+                if target_rate and generations is None:
+                    if self._stop_requested.wait(max(next_generation - time.perf_counter(), 0)):
+                        break
+                    # lagging run doesn't catch up by a burst of generations
+                    next_generation = max(next_generation + 1 / target_rate, time.perf_counter())
+                elif self._stop_requested.is_set():
+                    break
+                self._controller.increment_generation()
+                created += 1
+                rate_generations += 1
+                now = time.perf_counter()
+                if now - rate_started >= _RATE_INTERVAL:
+                    rate = rate_generations / (now - rate_started)
+                    rate_started, rate_generations = now, 0
+                if self._controller.cycle is not None:
+                    # still life or oscillator: the run would only repeat the same generations
+                    break
+                if now - last_frame >= frame_interval:
+                    last_frame = now
+                    self.frame_created.emit(self._controller.snapshot(), rate)
+        except Exception:
+            # the worker thread has no caller to pass the error to
+            log.exception('QtGenerationWorker._create_generations')
+        finally:
+            self._thread_id = None
+            if created:
+                self.frame_created.emit(self._controller.snapshot(), rate)
+            self.generation_finished.emit()
+
+    def _on_generation_finished(self) -> None:
+        """Allow the next request, runs on the GUI thread."""
+        self._is_busy = False
@@ -1,11 +1,20 @@
 """Represent functionality of the new game popup."""
 import logging
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import (QCheckBox, QDialog, QDialogButtonBox, QGridLayout,
-                             QGroupBox, QLabel, QSizePolicy, QSpinBox,
+from PyQt6.QtCore import QRegularExpression, Qt
+from PyQt6.QtGui import QRegularExpressionValidator
+from PyQt6.QtWidgets import (QCheckBox, QComboBox, QDialog, QDialogButtonBox,
+                             QDoubleSpinBox, QGridLayout, QGroupBox, QLabel,
+                             QLineEdit, QMessageBox, QSizePolicy, QSpinBox,
                              QVBoxLayout)
 
+from gameoflifeapi.logic.engines.engine_factory import is_engine_available
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.exceptions import RuleStringException
+from gameoflifeapi.logic.random_states import DEFAULT_DENSITY
+from gameoflifeapi.logic.rules import CONWAY_RULE, PRESET_RULES, parse_rule
+from gameoflifeapi.logic.topology import Topology
+
 log: logging.Logger = logging.getLogger(__name__)
 
 
@@ -19,9 +28,14 @@ class QtNewGamePopUpWidget(QDialog):
         self._current_row_number: int = 10
         self._current_col_number: int = 10
         self._randomize_on_start: bool = False
+        self._engine_type: EngineType = EngineType.OBJECT
+        self._rule: str = CONWAY_RULE.rulestring
+        self._topology: Topology = Topology.BOUNDED
+        self._seed: int = None
+        self._density: float = DEFAULT_DENSITY
 
         width: int = 200
-        height: int = 150
+        height: int = 310
 
         form_widgets_group: QGroupBox = QGroupBox()
         lbl_row: QLabel = QLabel('Number of ROWS')
@@ -29,10 +43,37 @@ class QtNewGamePopUpWidget(QDialog):
         self._spin_box_rows: QSpinBox = QSpinBox()
         self._spin_box_columns: QSpinBox = QSpinBox()
         self._checkbox_random: QCheckBox = QCheckBox('Randomize on start')
+        lbl_engine: QLabel = QLabel('Engine')
+        self._combo_box_engine: QComboBox = QComboBox()
+        for engine_type in EngineType:
+            if is_engine_available(engine_type):
+                self._combo_box_engine.addItem(engine_type.value, engine_type)
+        lbl_rule: QLabel = QLabel('Rule')
+        self._combo_box_rule: QComboBox = QComboBox()
+        self._combo_box_rule.setEditable(True)
+        for (name, rule) in PRESET_RULES.items():
+            self._combo_box_rule.addItem(rule.rulestring)
+            self._combo_box_rule.setItemData(self._combo_box_rule.count() - 1, name,
+                                             Qt.ItemDataRole.ToolTipRole)
+        lbl_topology: QLabel = QLabel('Topology')
+        self._combo_box_topology: QComboBox = QComboBox()
+        for topology in Topology:
+            self._combo_box_topology.addItem(topology.value, topology)
+        lbl_density: QLabel = QLabel('Density')
+        self._spin_box_density: QDoubleSpinBox = QDoubleSpinBox()
+        lbl_seed: QLabel = QLabel('Seed')
+        self._line_edit_seed: QLineEdit = QLineEdit()
+        self._line_edit_seed.setPlaceholderText('new')
+        self._line_edit_seed.setValidator(QRegularExpressionValidator(QRegularExpression(r'\d{0,19}')))
 
         self._spin_box_rows.textChanged.connect(self._on_spin_box_rows)
         self._spin_box_columns.textChanged.connect(self._on_spin_box_columns)
         self._checkbox_random.stateChanged.connect(self._on_checkbox_random_state)
+        self._combo_box_engine.currentIndexChanged.connect(self._on_combo_box_engine)
+        self._combo_box_rule.currentTextChanged.connect(self._on_combo_box_rule)
+        self._combo_box_topology.currentIndexChanged.connect(self._on_combo_box_topology)
+        self._spin_box_density.valueChanged.connect(self._on_spin_box_density)
+        self._line_edit_seed.textChanged.connect(self._on_line_edit_seed)
 
         expanding_policy = QSizePolicy.Policy.Expanding
         common_policy = QSizePolicy(expanding_policy, expanding_policy)
@@ -42,18 +83,43 @@ class QtNewGamePopUpWidget(QDialog):
         self._spin_box_rows.setSizePolicy(common_policy)
         self._spin_box_columns.setSizePolicy(common_policy)
         self._checkbox_random.setSizePolicy(common_policy)
+        lbl_engine.setSizePolicy(common_policy)
+        self._combo_box_engine.setSizePolicy(common_policy)
+        lbl_rule.setSizePolicy(common_policy)
+        self._combo_box_rule.setSizePolicy(common_policy)
+        lbl_topology.setSizePolicy(common_policy)
+        self._combo_box_topology.setSizePolicy(common_policy)
+        lbl_density.setSizePolicy(common_policy)
+        self._spin_box_density.setSizePolicy(common_policy)
+        lbl_seed.setSizePolicy(common_policy)
+        self._line_edit_seed.setSizePolicy(common_policy)
 
         self._spin_box_rows.setMinimum(10)
-        self._spin_box_rows.setMaximum(50)
+        self._spin_box_rows.setMaximum(4096)
         self._spin_box_columns.setMinimum(10)
-        self._spin_box_columns.setMaximum(50)
+        self._spin_box_columns.setMaximum(4096)
+        self._spin_box_density.setRange(0, 1)
+        self._spin_box_density.setSingleStep(0.05)
+        self._spin_box_density.setValue(DEFAULT_DENSITY)
+        self._spin_box_density.setEnabled(False)
+        self._line_edit_seed.setEnabled(False)
 
         grid_layout_group: QGridLayout = QGridLayout()
         grid_layout_group.addWidget(lbl_row, 0, 0)
         grid_layout_group.addWidget(self._spin_box_rows, 0, 1)
         grid_layout_group.addWidget(lbl_columns, 1, 0)
         grid_layout_group.addWidget(self._spin_box_columns, 1, 1)
-        grid_layout_group.addWidget(self._checkbox_random, 2, 0)
+        grid_layout_group.addWidget(lbl_engine, 2, 0)
+        grid_layout_group.addWidget(self._combo_box_engine, 2, 1)
+        grid_layout_group.addWidget(lbl_rule, 3, 0)
+        grid_layout_group.addWidget(self._combo_box_rule, 3, 1)
+        grid_layout_group.addWidget(lbl_topology, 4, 0)
+        grid_layout_group.addWidget(self._combo_box_topology, 4, 1)
+        grid_layout_group.addWidget(self._checkbox_random, 5, 0)
+        grid_layout_group.addWidget(lbl_density, 6, 0)
+        grid_layout_group.addWidget(self._spin_box_density, 6, 1)
+        grid_layout_group.addWidget(lbl_seed, 7, 0)
+        grid_layout_group.addWidget(self._line_edit_seed, 7, 1)
 
         form_widgets_group.setLayout(grid_layout_group)
         form_widgets_group.setMinimumSize(width, height)
@@ -103,8 +169,51 @@ class QtNewGamePopUpWidget(QDialog):
             self._randomize_on_start = True
         else:
             self._randomize_on_start = False
+        self._spin_box_density.setEnabled(self._randomize_on_start)
+        self._line_edit_seed.setEnabled(self._randomize_on_start)
         log.debug('QtNewGamePopUpWidget._on_checkbox_random_state.exit')
 
+    def _on_combo_box_engine(self) -> None:
+        """Process on ENGINE value change event."""
+        log.debug('QtNewGamePopUpWidget._on_combo_box_engine')
+        self._engine_type = self._combo_box_engine.currentData()
+        log.debug('QtNewGamePopUpWidget._on_combo_box_engine.exit')
+
+    def _on_combo_box_rule(self) -> None:
+        """Process on RULE value change event."""
+        log.debug('QtNewGamePopUpWidget._on_combo_box_rule')
+        self._rule = self._combo_box_rule.currentText()
+        log.debug('QtNewGamePopUpWidget._on_combo_box_rule.exit')
+
+    def _on_combo_box_topology(self) -> None:
+        """Process on TOPOLOGY value change event."""
+        log.debug('QtNewGamePopUpWidget._on_combo_box_topology')
+        self._topology = self._combo_box_topology.currentData()
+        log.debug('QtNewGamePopUpWidget._on_combo_box_topology.exit')
+
+    def _on_spin_box_density(self) -> None:
+        """Process on DENSITY value change event."""
+        log.debug('QtNewGamePopUpWidget._on_spin_box_density')
+        self._density = self._spin_box_density.value()
+        log.debug('QtNewGamePopUpWidget._on_spin_box_density.exit')
+
+    def _on_line_edit_seed(self) -> None:
+        """Process on SEED value change event, empty seed means new one."""
+        log.debug('QtNewGamePopUpWidget._on_line_edit_seed')
+        text: str = self._line_edit_seed.text()
+        self._seed = int(text) if text else None
+        log.debug('QtNewGamePopUpWidget._on_line_edit_seed.exit')
+
+    def accept(self) -> None:
+        """Close the dialog if the rulestring is correct."""
+        log.debug('QtNewGamePopUpWidget.accept')
+        try:
+            self._rule = parse_rule(self._rule).rulestring
+        except RuleStringException as err:
+            QMessageBox.warning(self, 'Incorrect rule', str(err))
+            return
+        QDialog.accept(self)
+
     @property
     def number_of_rows(self) -> int:
         """Return value of the ROWS property."""
@@ -119,3 +228,28 @@ class QtNewGamePopUpWidget(QDialog):
     def randomize_on_start(self) -> bool:
         """Return value of the RANDOMIZE_ON_START property."""
         return self._randomize_on_start
+
+    @property
+    def engine_type(self) -> EngineType:
+        """Return value of the ENGINE_TYPE property."""
+        return self._engine_type
+
+    @property
+    def rule(self) -> str:
+        """Return value of the RULE property."""
+        return self._rule
+
+    @property
+    def topology(self) -> Topology:
+        """Return value of the TOPOLOGY property."""
+        return self._topology
+
+    @property
+    def seed(self) -> int:
+        """Return value of the SEED property, None for new seed."""
+        return self._seed
+
+    @property
+    def density(self) -> float:
+        """Return value of the DENSITY property."""
+        return self._density
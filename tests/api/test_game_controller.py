@@ -1,4 +1,5 @@
 """Tests related to the Game controller."""
+import threading
 import unittest
 import unittest.mock as mock
 
@@ -7,6 +8,11 @@ from gameoflifeapi.logic.data.dtos import (LoadGameDataDto, NewGameDataDto,
                                            SaveGameDataDto)
 from gameoflifeapi.logic.data.field import Field
 from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.engines.numpy_engine import np
+from gameoflifeapi.logic.instrumentation import PHASE_PERSISTENCE
+from gameoflifeapi.logic.history import DEFAULT_MEMORY_BUDGET
+from gameoflifeapi.logic.topology import Topology
 
 
 class TestGameLifeController(unittest.TestCase):
@@ -49,6 +55,25 @@ class TestGameLifeController(unittest.TestCase):
         self.assertEqual(0, controller.game_state.generation)
         mock_on_generation.assert_called_once()
 
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_start_new_game_with_engine(self) -> None:
+        """Test starting of the new game with selected engine."""
+        new_game = NewGameDataDto(10, 10, False, EngineType.NUMPY)
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock()
+        )
+        controller.start_new_game(new_game)
+        controller.trigger_cell(4, 3)
+        controller.trigger_cell(4, 4)
+        controller.trigger_cell(4, 5)
+        controller.increment_generation()
+
+        self.assertEqual(EngineType.NUMPY, controller._game_flow.engine_type)
+        self.assertEqual(CellState.ALIVE, controller.game_state.game_field.all_cells[(3, 4)].state)
+        self.assertEqual(CellState.DEAD, controller.game_state.game_field.all_cells[(4, 3)].state)
+        self.assertEqual(controller._game_flow.state_buffer(), bytes(controller.game_state.states))
+
     def test_load_game(self) -> None:
         """Test loading of the game."""
         save_file_name = 'test_path'
@@ -75,6 +100,145 @@ class TestGameLifeController(unittest.TestCase):
         mock_persistance.load_game.assert_called_with(save_file_name)
         mock_on_generation.assert_called()
 
+    def test_rule(self) -> None:
+        """Test rule of the new, loaded and saved games."""
+        mock_persistance = mock.Mock()
+        controller = GameLifeController(
+            persistance=mock_persistance,
+            on_generation_created=mock.Mock(),
+            rule='23/36'
+        )
+        self.assertEqual('B36/S23', controller.rule)
+
+        controller.start_new_game(NewGameDataDto(10, 10, False, rule='B2/S'))
+        self.assertEqual('B2/S', controller.rule)
+
+        mock_persistance.load_game.return_value = LoadGameDataDto(5, Field(), 'B3678/S34678')
+        controller.load_game('test_path')
+        self.assertEqual('B3678/S34678', controller.rule)
+
+        mock_persistance.load_game.return_value = LoadGameDataDto(5, Field())
+        controller.load_game('test_path')
+        self.assertEqual('B2/S', controller.rule)
+
+        controller.save_game('test_save_path')
+        save_game_data: SaveGameDataDto = mock_persistance.save_game.call_args[0][1]
+        self.assertEqual('B2/S', save_game_data.rule)
+
+    def test_topology(self) -> None:
+        """Test topology of the new, loaded and saved games."""
+        mock_persistance = mock.Mock()
+        controller = GameLifeController(
+            persistance=mock_persistance,
+            on_generation_created=mock.Mock(),
+            topology=Topology.TORUS
+        )
+        self.assertEqual(Topology.TORUS, controller.topology)
+
+        controller.start_new_game(NewGameDataDto(10, 10, False, topology=Topology.INFINITE))
+        self.assertEqual(Topology.INFINITE, controller.topology)
+        self.assertEqual((0, 0), controller.origin)
+
+        mock_persistance.load_game.return_value = LoadGameDataDto(5, Field(), topology=Topology.KLEIN_BOTTLE)
+        controller.load_game('test_path')
+        self.assertEqual(Topology.KLEIN_BOTTLE, controller.topology)
+
+        mock_persistance.load_game.return_value = LoadGameDataDto(5, Field())
+        controller.load_game('test_path')
+        self.assertEqual(Topology.INFINITE, controller.topology)
+
+        controller.save_game('test_save_path')
+        save_game_data: SaveGameDataDto = mock_persistance.save_game.call_args[0][1]
+        self.assertEqual(Topology.INFINITE, save_game_data.topology)
+
+    def test_load_bounded_game_into_torus(self) -> None:
+        """Test neighbours of the loaded field are counted for the topology of the game."""
+        bounded_field = Field(10, 10)
+        for coordinates in ((0, 0), (0, 1), (9, 0), (2, 9)):
+            bounded_field.all_cells[coordinates].state = CellState.ALIVE
+        # neighbours as counted by the bounded game which saved the field
+        bounded_field.all_cells[(0, 0)].neighbours = 1
+        bounded_field.all_cells[(0, 1)].neighbours = 1
+        bounded_field.all_cells[(1, 0)].neighbours = 2
+        bounded_field.all_cells[(1, 1)].neighbours = 2
+        expected = []
+        for engine_type in (EngineType.SPARSE, EngineType.OBJECT):
+            mock_persistance = mock.Mock()
+            mock_persistance.load_game.return_value = LoadGameDataDto(0, bounded_field)
+            controller = GameLifeController(
+                persistance=mock_persistance,
+                on_generation_created=mock.Mock(),
+                engine_type=engine_type,
+                topology=Topology.TORUS
+            )
+            controller.load_game('test_path')
+            states = []
+            for _ in range(3):
+                controller.increment_generation()
+                states.append(controller._game_flow.state_buffer())
+            if expected:
+                self.assertEqual(expected, states)
+            expected = states
+
+    def test_step_back(self) -> None:
+        """Test generations of the game are restored from the history."""
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock(),
+            history_budget=DEFAULT_MEMORY_BUDGET
+        )
+        controller.start_new_game(NewGameDataDto(20, 20, True, seed=4))
+        self.assertFalse(controller.can_step_back)
+        states = controller._game_flow.state_buffer()
+        controller.increment_generation()
+        controller.increment_generation()
+        self.assertTrue(controller.can_step_back)
+
+        controller.step_back()
+        self.assertEqual(1, controller.generation)
+        controller.goto(0)
+        self.assertEqual(states, controller._game_flow.state_buffer())
+        self.assertFalse(controller.can_step_back)
+
+        #   history is disabled by default
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock()
+        )
+        controller.start_new_game(NewGameDataDto(10, 10, False))
+        controller.increment_generation()
+        self.assertIsNone(controller._game_flow.history)
+        self.assertFalse(controller.can_step_back)
+
+    def test_seed(self) -> None:
+        """Test seed and density of the random new, loaded and saved games."""
+        mock_persistance = mock.Mock()
+        controller = GameLifeController(
+            persistance=mock_persistance,
+            on_generation_created=mock.Mock()
+        )
+        controller.start_new_game(NewGameDataDto(20, 20, True, seed=9, density=0.4))
+        self.assertEqual(9, controller.seed)
+        self.assertEqual(0.4, controller.density)
+        states = controller._game_flow.state_buffer()
+
+        controller.save_game('test_save_path')
+        save_game_data: SaveGameDataDto = mock_persistance.save_game.call_args[0][1]
+        self.assertEqual(9, save_game_data.seed)
+        self.assertEqual(0.4, save_game_data.density)
+
+        controller.start_new_game(NewGameDataDto(20, 20, True, seed=9, density=0.4))
+        self.assertEqual(states, controller._game_flow.state_buffer())
+
+        controller.start_new_game(NewGameDataDto(20, 20, False))
+        self.assertIsNone(controller.seed)
+        self.assertIsNone(controller.density)
+
+        mock_persistance.load_game.return_value = LoadGameDataDto(5, Field(), seed=3, density=0.5)
+        controller.load_game('test_path')
+        self.assertEqual(3, controller.seed)
+        self.assertEqual(0.5, controller.density)
+
     @mock.patch('gameoflifeapi.api.game_controller.SaveGameDataDto')
     def test_save_game(self, save_game_data_mock) -> None:
         """Test saving of the game."""
@@ -100,6 +264,26 @@ class TestGameLifeController(unittest.TestCase):
         mock_persistance.save_game.assert_called_with(save_file_name, save_game_data)
         mock_on_generation.assert_called()
 
+    def test_instrumentation(self) -> None:
+        """Test statistics are shared by games and include persistence."""
+        mock_persistance = mock.Mock()
+        mock_persistance.load_game.return_value = LoadGameDataDto(3, Field())
+        controller = GameLifeController(
+            persistance=mock_persistance,
+            on_generation_created=mock.Mock()
+        )
+        controller.instrumentation.enabled = True
+        controller.start_new_game(NewGameDataDto(10, 10, False))
+
+        controller.increment_generation()
+        controller.save_game('test_save_path')
+        controller.load_game('test_save_path')
+        controller.increment_generation()
+
+        self.assertEqual(4, controller.instrumentation.records)
+        self.assertEqual(4, controller.instrumentation.last.generation)
+        self.assertIn(PHASE_PERSISTENCE, controller.instrumentation.totals)
+
     def test_trigger_cell(self) -> None:
         """Test triggering cell."""
         new_game = NewGameDataDto(10, 10, False)
@@ -138,6 +322,117 @@ class TestGameLifeController(unittest.TestCase):
 
         mock_create_next_generation.assert_called_once()
 
+    def test_advance(self) -> None:
+        """Test jump of the game by number of generations."""
+        mock_on_generation = mock.Mock()
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock_on_generation
+        )
+        controller.start_new_game(NewGameDataDto(10, 10, False))
+        controller.trigger_cell(4, 3)
+        controller.trigger_cell(4, 4)
+        controller.trigger_cell(4, 5)
+
+        controller.advance(101)
+
+        self.assertEqual(101, controller.game_state.generation)
+        self.assertEqual(CellState.ALIVE, controller.game_state.game_field.all_cells[(3, 4)].state)
+        self.assertEqual(CellState.DEAD, controller.game_state.game_field.all_cells[(4, 3)].state)
+        mock_on_generation.assert_called_once()
+
+    def test_changed_cells(self) -> None:
+        """Test cells changed by the last generation."""
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock()
+        )
+        self.assertIsNone(controller.changed_cells)
+        controller.start_new_game(NewGameDataDto(10, 10, False))
+        controller.trigger_cell(4, 3)
+        controller.trigger_cell(4, 4)
+        controller.trigger_cell(4, 5)
+
+        controller.increment_generation()
+
+        self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, controller.changed_cells)
+
+    def test_cycle(self) -> None:
+        """Test cycle detected in the current game."""
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock(),
+            detect_cycles=True
+        )
+        self.assertIsNone(controller.cycle)
+        controller.start_new_game(NewGameDataDto(10, 10, False))
+        controller.set_cells(((4, 4), (4, 5), (5, 4), (5, 5)), CellState.ALIVE)
+
+        controller.increment_generation()
+        self.assertIsNone(controller.cycle)
+        controller.increment_generation()
+
+        self.assertEqual('still life at gen 0', str(controller.cycle))
+        self.assertIsNone(GameLifeController(mock.Mock(), mock.Mock()).cycle)
+
+    def test_snapshot(self) -> None:
+        """Test snapshots are immutable copies numbered in creation order."""
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock()
+        )
+        controller.start_new_game(NewGameDataDto(10, 12, False))
+        controller.trigger_cell(4, 4)
+        first = controller.snapshot()
+        controller.increment_generation()
+        second = controller.snapshot()
+
+        self.assertEqual((0, 10, 12), (first.generation, first.rows, first.columns))
+        self.assertEqual(1, first.states[4 * 12 + 4])
+        self.assertEqual(1, second.generation)
+        self.assertEqual(0, second.states.count(1))
+        self.assertLess(first.sequence, second.sequence)
+        self.assertEqual(second.sequence, controller.snapshot_sequence)
+
+    def test_game_state_states(self) -> None:
+        """Test states of the game state stay the states of its generation."""
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=mock.Mock()
+        )
+        controller.start_new_game(NewGameDataDto(10, 12, False))
+        controller.set_cells(((4, 3), (4, 4), (4, 5)), CellState.ALIVE)
+        state = controller.game_state
+        expected = bytes(state.states)
+        controller.increment_generation()
+        controller.increment_generation()
+        controller.trigger_cell(0, 0)
+
+        self.assertEqual(0, state.generation)
+        self.assertEqual(expected, bytes(state.states))
+        self.assertEqual(2, controller.game_state.generation)
+        self.assertNotEqual(expected, bytes(controller.game_state.states))
+
+    def test_increment_generation_on_other_thread(self) -> None:
+        """Test generations created by other thread are serialized with edits."""
+        controller = GameLifeController(
+            persistance=mock.Mock(),
+            on_generation_created=lambda: controller.snapshot()
+        )
+        controller.start_new_game(NewGameDataDto(30, 30, False))
+
+        def create_generations() -> None:
+            for _ in range(50):
+                controller.increment_generation()
+        worker = threading.Thread(target=create_generations)
+        worker.start()
+        for row in range(30):
+            controller.set_cells(((row, 0), (row, 1)), CellState.ALIVE)
+        worker.join()
+
+        self.assertEqual(50, controller.generation)
+        self.assertEqual(50, controller.snapshot().generation)
+
     def test_randomize_cells_state(self) -> None:
         """Test randomizing field cell states."""
         new_game = NewGameDataDto(10, 10, False)
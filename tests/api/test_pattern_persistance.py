@@ -0,0 +1,169 @@
+"""Tests related to the RLE and plaintext persistance functionality."""
+import os
+import tempfile
+import unittest
+
+from gameoflifeapi.api.pattern_persistance import (GamePlaintextPersistance,
+                                                   GameRlePersistance)
+from gameoflifeapi.logic.data.dtos import LoadGameDataDto, SaveGameDataDto
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.exceptions import SaveFileFormatException
+from gameoflifeapi.logic.topology import Topology
+
+GLIDER_RLE: str = """#N Glider
+#C comment line
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+GLIDER_CELLS: str = """!Name: Glider
+!
+.O
+..O
+OOO
+"""
+
+
+def _create_field() -> Field:
+    """Create field with cells in the first, middle and last rows."""
+    field: Field = Field(12, 80)
+    for coordinates in ((0, 0), (0, 1), (0, 79), (5, 3), (11, 40)):
+        field.all_cells[coordinates].state = CellState.ALIVE
+    return field
+
+
+class TestGameRlePersistance(unittest.TestCase):
+    """Tests related to the GameRlePersistance functionality."""
+
+    def setUp(self) -> None:
+        """Prepare test case to the tests."""
+        self._save_name: str = f'{tempfile.gettempdir()}/test_game_save_file.rle'
+
+    def tearDown(self) -> None:
+        """Cleanup after tests."""
+        if os.path.exists(self._save_name):
+            os.remove(self._save_name)
+
+    def _write(self, content: str) -> None:
+        with open(self._save_name, 'w', encoding='ascii') as file:
+            file.write(content)
+
+    def test_load_game(self) -> None:
+        """Test loading of the pattern created by other tool."""
+        self._write(GLIDER_RLE)
+
+        loaded: LoadGameDataDto = GameRlePersistance().load_game(self._save_name)
+
+        self.assertEqual(0, loaded.generation)
+        self.assertEqual(10, loaded.number_of_rows)
+        self.assertEqual(10, loaded.number_of_columns)
+        self.assertEqual({(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}, loaded.game_field.live_cells)
+        self.assertEqual('B3/S23', loaded.rule)
+
+    def test_load_game_with_rule(self) -> None:
+        """Test rule of the header in B/S and S/B notations."""
+        for (header_rule, rule) in (('B36/S23', 'B36/S23'), ('23/36', 'B36/S23'), ('b2s', 'B2/S')):
+            self._write(f'x = 3, y = 1, rule = {header_rule}\nooo!\n')
+
+            loaded: LoadGameDataDto = GameRlePersistance().load_game(self._save_name)
+
+            self.assertEqual(rule, loaded.rule)
+
+    def test_load_game_with_run_split_between_lines(self) -> None:
+        """Test run count continued on the next line."""
+        self._write('x = 12, y = 2\n1\n2o$o!\n')
+
+        loaded: LoadGameDataDto = GameRlePersistance().load_game(self._save_name)
+
+        self.assertEqual({(0, column) for column in range(12)} | {(1, 0)}, loaded.game_field.live_cells)
+
+    def test_save_and_load_game(self) -> None:
+        """Test saved game is loaded back."""
+        persistance = GameRlePersistance()
+        field: Field = _create_field()
+
+        persistance.save_game(self._save_name, SaveGameDataDto(7, field, topology=Topology.TORUS, seed=0,
+                                                               density=0.35))
+
+        with open(self._save_name, 'r', encoding='ascii') as file:
+            lines: list[str] = file.read().splitlines()
+        self.assertEqual(['#C generation 7', '#C topology torus', '#C seed 0 density 0.35',
+                          'x = 80, y = 12, rule = B3/S23', '2o77bo5$3bo6$40bo!'], lines)
+        loaded: LoadGameDataDto = persistance.load_game(self._save_name)
+        self.assertEqual(7, loaded.generation)
+        self.assertEqual(Topology.TORUS, loaded.topology)
+        self.assertEqual(0, loaded.seed)
+        self.assertEqual(0.35, loaded.density)
+        self.assertEqual(field.state_buffer(), loaded.game_field.state_buffer())
+
+    def test_load_game_validation(self) -> None:
+        """Test loading of the files with incorrect content."""
+        for content in ('#C only comment\n', 'x = 3\nooo!\n', 'x = 3, y = 1, rule = B9/S23\nooo!\n',
+                        'x = 2, y = 1\nooo!\n', '#C topology sphere\nx = 3, y = 1\nooo!\n'):
+            self._write(content)
+
+            self.assertRaises(SaveFileFormatException, GameRlePersistance().load_game, self._save_name)
+
+
+class TestGamePlaintextPersistance(unittest.TestCase):
+    """Tests related to the GamePlaintextPersistance functionality."""
+
+    def setUp(self) -> None:
+        """Prepare test case to the tests."""
+        self._save_name: str = f'{tempfile.gettempdir()}/test_game_save_file.cells'
+
+    def tearDown(self) -> None:
+        """Cleanup after tests."""
+        if os.path.exists(self._save_name):
+            os.remove(self._save_name)
+
+    def test_load_game(self) -> None:
+        """Test loading of the pattern created by other tool."""
+        with open(self._save_name, 'w', encoding='ascii') as file:
+            file.write(GLIDER_CELLS)
+
+        loaded: LoadGameDataDto = GamePlaintextPersistance().load_game(self._save_name)
+
+        self.assertEqual(0, loaded.generation)
+        self.assertEqual(10, loaded.number_of_rows)
+        self.assertEqual({(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}, loaded.game_field.live_cells)
+
+    def test_save_and_load_game(self) -> None:
+        """Test saved game is loaded back."""
+        persistance = GamePlaintextPersistance()
+        field: Field = _create_field()
+
+        persistance.save_game(self._save_name, SaveGameDataDto(3, field, 'B3678/S34678', Topology.KLEIN_BOTTLE,
+                                                               seed=12))
+
+        loaded: LoadGameDataDto = persistance.load_game(self._save_name)
+        self.assertEqual(3, loaded.generation)
+        self.assertEqual(12, loaded.seed)
+        self.assertIsNone(loaded.density)
+        self.assertEqual('B3678/S34678', loaded.rule)
+        self.assertEqual(Topology.KLEIN_BOTTLE, loaded.topology)
+        self.assertEqual(12, loaded.number_of_rows)
+        self.assertEqual(80, loaded.number_of_columns)
+        self.assertEqual(field.state_buffer(), loaded.game_field.state_buffer())
+
+    def test_save_and_load_game_with_dead_columns(self) -> None:
+        """Test trailing DEAD columns are kept, so the game is loaded with its size."""
+        persistance = GamePlaintextPersistance()
+        field: Field = Field(20, 20)
+        field.all_cells[(0, 1)].state = CellState.ALIVE
+        field.all_cells[(19, 3)].state = CellState.ALIVE
+
+        persistance.save_game(self._save_name, SaveGameDataDto(0, field, topology=Topology.TORUS))
+
+        loaded: LoadGameDataDto = persistance.load_game(self._save_name)
+        self.assertEqual(20, loaded.number_of_rows)
+        self.assertEqual(20, loaded.number_of_columns)
+        self.assertEqual(field.state_buffer(), loaded.game_field.state_buffer())
+
+    def test_load_game_validation(self) -> None:
+        """Test loading of the file with unknown symbol."""
+        with open(self._save_name, 'w', encoding='ascii') as file:
+            file.write('.O\n.X\n')
+
+        self.assertRaises(SaveFileFormatException, GamePlaintextPersistance().load_game, self._save_name)
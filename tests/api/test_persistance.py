@@ -3,11 +3,16 @@ import os
 import pathlib as pl
 import tempfile
 import unittest
+import unittest.mock as mock
 
-from gameoflifeapi.api.persistance import GamePicklePersistance
+from gameoflifeapi.api.persistance import (GameBinaryPersistance,
+                                           GamePicklePersistance, pack_states,
+                                           unpack_states)
 from gameoflifeapi.logic.data.dtos import LoadGameDataDto, SaveGameDataDto
 from gameoflifeapi.logic.data.field import Field
 from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.exceptions import SaveFileFormatException
+from gameoflifeapi.logic.topology import Topology
 
 SAVE_GAME_FILE_NAME: str = 'test_game_save_file.gsave'
 
@@ -56,16 +61,104 @@ class TestGamePicklePersistance(unittest.TestCase):
         game_field.all_cells[(3, 0)].state = CellState.ALIVE
 
         persistance = GamePicklePersistance()
-        persistance.save_game(save_name, SaveGameDataDto(5, game_field))
+        persistance.save_game(save_name, SaveGameDataDto(5, game_field, 'B2/S', Topology.TORUS))
         file_to_check = pl.Path(save_name).resolve()
 
         self.assertTrue(file_to_check.is_file())
 
         loaded: LoadGameDataDto = persistance.load_game(save_name)
         self.assertEqual(5, loaded.generation)
+        self.assertEqual('B2/S', loaded.rule)
+        self.assertEqual(Topology.TORUS, loaded.topology)
         self.assertEqual(10, loaded.number_of_rows)
         self.assertEqual(10, loaded.number_of_columns)
         self.assertEqual(CellState.ALIVE, loaded.game_field.all_cells[(0, 0)].state)
         self.assertEqual(CellState.ALIVE, loaded.game_field.all_cells[(1, 5)].state)
         self.assertEqual(CellState.ALIVE, loaded.game_field.all_cells[(2, 7)].state)
         self.assertEqual(CellState.ALIVE, loaded.game_field.all_cells[(3, 0)].state)
+
+
+class TestGameBinaryPersistance(unittest.TestCase):
+    """Tests related to the GameBinaryPersistance functionality."""
+
+    def setUp(self) -> None:
+        """Prepare test case to the tests."""
+        self._save_name: str = f'{tempfile.gettempdir()}/test_game_save_file.gbin'
+
+    def tearDown(self) -> None:
+        """Cleanup after tests."""
+        if os.path.exists(self._save_name):
+            os.remove(self._save_name)
+
+    def test_load_game(self) -> None:
+        """Test save and load game functionality."""
+        game_field: Field = Field(10, 13)
+        game_field.all_cells[(0, 0)].state = CellState.ALIVE
+        game_field.all_cells[(1, 5)].state = CellState.ALIVE
+        game_field.all_cells[(9, 12)].state = CellState.ALIVE
+
+        persistance = GameBinaryPersistance()
+        persistance.save_game(self._save_name, SaveGameDataDto(5, game_field, 'B36/S23', Topology.INFINITE))
+
+        self.assertEqual(24 + 4 + 17, os.path.getsize(self._save_name))
+        loaded: LoadGameDataDto = persistance.load_game(self._save_name)
+        self.assertEqual(5, loaded.generation)
+        self.assertEqual('B36/S23', loaded.rule)
+        self.assertEqual(Topology.INFINITE, loaded.topology)
+        self.assertIsNone(loaded.seed)
+        self.assertIsNone(loaded.density)
+        self.assertEqual(10, loaded.number_of_rows)
+        self.assertEqual(13, loaded.number_of_columns)
+        self.assertEqual(game_field.state_buffer(), loaded.game_field.state_buffer())
+
+    def test_load_game_with_seed(self) -> None:
+        """Test seed and density of the random first generation are saved and loaded."""
+        persistance = GameBinaryPersistance()
+        persistance.save_game(self._save_name, SaveGameDataDto(2, Field(10, 13), topology=Topology.TORUS,
+                                                               seed=2 ** 40, density=0.25))
+
+        self.assertEqual(24 + 4 + 16 + 17, os.path.getsize(self._save_name))
+        loaded: LoadGameDataDto = persistance.load_game(self._save_name)
+        self.assertEqual(Topology.TORUS, loaded.topology)
+        self.assertEqual(2 ** 40, loaded.seed)
+        self.assertEqual(0.25, loaded.density)
+
+        persistance.save_game(self._save_name, SaveGameDataDto(2, Field(10, 13), seed=3))
+        loaded = persistance.load_game(self._save_name)
+        self.assertEqual(3, loaded.seed)
+        self.assertIsNone(loaded.density)
+
+    def test_load_game_version_1(self) -> None:
+        """Test loading of the file saved before the rule was stored."""
+        header: bytes = b'GOLB' + bytes([1, 0, 0, 0, 10, 0, 0, 0, 10, 0, 0, 0, 3]) + bytes(7)
+        with open(self._save_name, 'wb') as file:
+            file.write(header + bytes([0b10000000]) + bytes(12))
+
+        loaded: LoadGameDataDto = GameBinaryPersistance().load_game(self._save_name)
+
+        self.assertEqual(3, loaded.generation)
+        self.assertIsNone(loaded.rule)
+        self.assertEqual(Topology.BOUNDED, loaded.topology)
+        self.assertEqual(bytes([1]) + bytes(99), loaded.game_field.state_buffer())
+
+    def test_load_game_validation(self) -> None:
+        """Test loading of the files with other content."""
+        persistance = GameBinaryPersistance()
+        for content in (b'', b'GOLB', b'XXXX' + bytes(20), b'GOLB' + bytes([4]) + bytes(19),
+                        b'GOLB' + bytes([2]) + bytes(19),
+                        b'GOLB' + bytes([1, 0, 0, 0, 10, 0, 0, 0, 10]) + bytes(11)):
+            with open(self._save_name, 'wb') as file:
+                file.write(content)
+
+            self.assertRaises(SaveFileFormatException, persistance.load_game, self._save_name)
+
+    def test_pack_states(self) -> None:
+        """Test packing of the states, the first cell is the highest bit."""
+        states: bytes = bytes([1, 0, 0, 0, 0, 0, 0, 1, 1, 1])
+        packed: bytes = bytes([0b10000001, 0b11000000])
+
+        self.assertEqual(packed, pack_states(states))
+        self.assertEqual(states, unpack_states(packed, 10))
+        with mock.patch('gameoflifeapi.logic.data.packed_states.np', None):
+            self.assertEqual(packed, pack_states(states))
+            self.assertEqual(states, unpack_states(packed, 10))
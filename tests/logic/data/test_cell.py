@@ -29,3 +29,13 @@ class TestCell(unittest.TestCase):
             cell.column = 5
         self.assertEqual(CellState.DEAD, cell.state)
         self.assertEqual(5, cell.neighbours)
+
+    def test_cell_pickled_before_slots(self) -> None:
+        """Test restoring of the Cell pickled with attributes dictionary."""
+        cell = Cell.__new__(Cell)
+        cell.__setstate__({'_row': 1, '_column': 2, '_state': CellState.ALIVE, '_neighbours': 3})
+
+        self.assertEqual((1, 2), (cell.row, cell.column))
+        self.assertEqual(CellState.ALIVE, cell.state)
+        self.assertEqual(3, cell.neighbours)
+        self.assertFalse(hasattr(cell, '__dict__'))
@@ -1,8 +1,10 @@
 """Tests related to functionality of the GameData DTOs."""
 import unittest
 
-from gameoflifeapi.logic.data.dtos import (GameDataDto, GameStateDto,
-                                           LoadGameDataDto, NewGameDataDto)
+from gameoflifeapi.logic.cycle_detection import Cycle
+from gameoflifeapi.logic.data.dtos import (GameDataDto, GameSnapshotDto,
+                                           GameStateDto, LoadGameDataDto,
+                                           NewGameDataDto)
 from gameoflifeapi.logic.data.field import Field
 
 
@@ -42,7 +44,9 @@ class TestDtos(unittest.TestCase):
         game_data = NewGameDataDto(
             number_of_rows=11,
             number_of_columns=12,
-            is_random_first_generation=True
+            is_random_first_generation=True,
+            seed=42,
+            density=0.3
         )
 
         self.assertEqual(11, game_data.number_of_rows)
@@ -50,6 +54,8 @@ class TestDtos(unittest.TestCase):
         self.assertEqual(0, game_data.generation)
         self.assertTrue(game_data.is_random_first_generation)
         self.assertIsNone(game_data.game_field)
+        self.assertEqual(42, game_data.seed)
+        self.assertEqual(0.3, game_data.density)
 
         with self.assertRaises(AttributeError):
             game_data.number_of_rows = 25
@@ -61,6 +67,8 @@ class TestDtos(unittest.TestCase):
             game_data.is_random_first_generation = False
         with self.assertRaises(AttributeError):
             game_data.game_field = None
+        with self.assertRaises(AttributeError):
+            game_data.seed = 1
 
     def test_load_game_data_dto(self) -> None:
         """Test LoadGameDataDto class."""
@@ -96,7 +104,26 @@ class TestDtos(unittest.TestCase):
         self.assertEqual(15, game_state.game_field.rows)
         self.assertEqual(16, game_state.game_field.columns)
         self.assertEqual(3, game_state.generation)
+        self.assertIsNone(game_state.states)
         with self.assertRaises(AttributeError):
             game_state.generation = 45
         with self.assertRaises(AttributeError):
             game_state.game_field = None
+        with self.assertRaises(AttributeError):
+            game_state.states = None
+
+        states = memoryview(bytes(15 * 16))
+        self.assertIs(states, GameStateDto(game_field, 3, states).states)
+
+    def test_game_snapshot_dto(self) -> None:
+        """Test GameSnapshotDto class keeps its own copy of the states."""
+        states = bytearray(100)
+        snapshot = GameSnapshotDto(3, 7, 10, 10, (1, 2), states, Cycle(5, 2))
+        states[0] = 1
+
+        self.assertEqual((3, 7, 10, 10, (1, 2)),
+                         (snapshot.sequence, snapshot.generation, snapshot.rows, snapshot.columns, snapshot.origin))
+        self.assertEqual(bytes(100), snapshot.states)
+        self.assertEqual(Cycle(5, 2), snapshot.cycle)
+        with self.assertRaises(AttributeError):
+            snapshot.generation = 8
@@ -1,9 +1,12 @@
 """Tests related to functionality of the Field object."""
+import pickle
 import unittest
 
+from gameoflifeapi.logic.data.cell import Cell
 from gameoflifeapi.logic.data.field import Field
 from gameoflifeapi.logic.data.state import CellState
-from gameoflifeapi.logic.exceptions import GameFieldSizeException
+from gameoflifeapi.logic.exceptions import (GameFieldSizeException,
+                                            NeighboursNumberException)
 
 
 class TestGameField(unittest.TestCase):
@@ -62,3 +65,84 @@ class TestGameField(unittest.TestCase):
         field = Field()
         with self.assertRaises(AttributeError):
             field.all_cells = {}
+
+    def test_game_field_state_buffer(self) -> None:
+        """Test conversion of the field to the row-major buffers and back."""
+        field = Field(10, 12)
+        field.all_cells[(0, 1)].state = CellState.ALIVE
+        field.all_cells[(9, 11)].state = CellState.ALIVE
+
+        buffer = field.state_buffer()
+
+        self.assertEqual(120, len(buffer))
+        self.assertEqual(1, buffer[1])
+        self.assertEqual(1, buffer[119])
+        self.assertEqual(2, sum(buffer))
+
+        neighbours = bytearray(120)
+        neighbours[1] = 3
+        buffer[1] = 0
+        field.apply_buffers(buffer, neighbours)
+
+        self.assertEqual(CellState.DEAD, field.all_cells[(0, 1)].state)
+        self.assertEqual(3, field.all_cells[(0, 1)].neighbours)
+        self.assertEqual(CellState.ALIVE, field.all_cells[(9, 11)].state)
+
+    def test_game_field_cell_view(self) -> None:
+        """Test that cells are views which read and write the cell arrays."""
+        field = Field(10, 12)
+        cell = field.all_cells[(2, 3)]
+
+        cell.state = CellState.ALIVE
+        cell.neighbours = 4
+        states, neighbours = field.cell_arrays()
+
+        self.assertEqual((2, 3), (cell.row, cell.column))
+        self.assertEqual(1, states[2 * 12 + 3])
+        self.assertEqual(4, neighbours[2 * 12 + 3])
+        self.assertEqual(CellState.ALIVE, field.all_cells[(2, 3)].state)
+        #   the extra last cell is the DEAD sentinel
+        self.assertEqual(121, len(states))
+        self.assertEqual(0, states[-1])
+        with self.assertRaises(AttributeError):
+            cell.state = None
+        with self.assertRaises(NeighboursNumberException):
+            cell.neighbours = 9
+        with self.assertRaises(KeyError):
+            field.all_cells[(10, 0)]
+
+    def test_game_field_swap_states(self) -> None:
+        """Test field view over other states array and replacement of the states array."""
+        field = Field(10, 12)
+        field.all_cells[(2, 3)].state = CellState.ALIVE
+        states, neighbours = field.cell_arrays()
+        back = bytearray(len(states))
+        back_field = field.with_states(back)
+
+        self.assertEqual(CellState.DEAD, back_field.all_cells[(2, 3)].state)
+        self.assertIs(neighbours, back_field.cell_arrays()[1])
+        back_field.all_cells[(4, 5)].state = CellState.ALIVE
+        self.assertEqual(CellState.DEAD, field.all_cells[(4, 5)].state)
+
+        self.assertIs(states, field.swap_states(back))
+        self.assertEqual(CellState.ALIVE, field.all_cells[(4, 5)].state)
+        self.assertEqual(CellState.DEAD, field.all_cells[(2, 3)].state)
+
+    def test_game_field_pickle(self) -> None:
+        """Test pickling of the field and loading of the field pickled with Cell objects."""
+        field = Field(10, 12)
+        field.all_cells[(9, 11)].state = CellState.ALIVE
+
+        loaded = pickle.loads(pickle.dumps(field))
+
+        self.assertEqual(field.state_buffer(), loaded.state_buffer())
+
+        cells = {(row, col): Cell(row, col) for row in range(10) for col in range(12)}
+        cells[(1, 2)].state = CellState.ALIVE
+        cells[(1, 3)].neighbours = 1
+        old_field = Field.__new__(Field)
+        old_field.__setstate__({'_rows': 10, '_columns': 12, '_cells': cells})
+
+        self.assertEqual(CellState.ALIVE, old_field.all_cells[(1, 2)].state)
+        self.assertEqual(1, old_field.all_cells[(1, 3)].neighbours)
+        self.assertEqual(1, sum(old_field.state_buffer()))
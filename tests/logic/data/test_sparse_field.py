@@ -0,0 +1,75 @@
+"""Tests related to functionality of the Sparse Field object."""
+import unittest
+
+from gameoflifeapi.logic.data.sparse_field import SparseField
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.exceptions import GameFieldSizeException
+from gameoflifeapi.logic.topology import Topology, Wraparound
+
+
+class TestSparseField(unittest.TestCase):
+    """Test Sparse Game Field functionality."""
+
+    def test_sparse_field_creation(self) -> None:
+        """Test creation of the field."""
+        field = SparseField(10, 12, {(1, 1)})
+
+        self.assertEqual(10, field.rows)
+        self.assertEqual(12, field.columns)
+        self.assertEqual(120, len(field.all_cells))
+        self.assertEqual({(1, 1)}, field.live_cells)
+        self.assertEqual(CellState.ALIVE, field.all_cells[(1, 1)].state)
+        self.assertEqual(CellState.DEAD, field.all_cells[(0, 0)].state)
+        with self.assertRaises(GameFieldSizeException):
+            SparseField(5, 5)
+        with self.assertRaises(KeyError):
+            field.all_cells[(10, 0)]
+
+    def test_sparse_cell_view(self) -> None:
+        """Test that cell view reads and writes the field."""
+        field = SparseField()
+        cell = field.all_cells[(0, 0)]
+
+        cell.state = CellState.ALIVE
+        field.all_cells[(0, 1)].state = CellState.ALIVE
+
+        self.assertEqual({(0, 0), (0, 1)}, field.live_cells)
+        self.assertEqual(1, cell.neighbours)
+        self.assertEqual(2, field.all_cells[(1, 1)].neighbours)
+
+        field.live_cells.discard((0, 0))
+
+        self.assertEqual(CellState.DEAD, cell.state)
+        with self.assertRaises(AttributeError):
+            cell.state = None
+
+    def test_sparse_field_buffers(self) -> None:
+        """Test conversion of the field to the row-major buffer and back."""
+        field = SparseField(10, 10, {(0, 1), (9, 9)})
+        buffer = field.state_buffer()
+
+        self.assertEqual(1, buffer[1])
+        self.assertEqual(1, buffer[99])
+        self.assertEqual(2, sum(buffer))
+
+        buffer[1] = 0
+        buffer[50] = 1
+        field.apply_buffers(buffer, bytes(100))
+
+        self.assertEqual({(5, 0), (9, 9)}, field.live_cells)
+
+    def test_sparse_field_cell_arrays(self) -> None:
+        """Test arrays of the cells are created from the ALIVE cells with neighbours by the topology."""
+        live_cells = {(0, 0), (0, 1), (9, 11), (4, 5)}
+        for topology in (Topology.BOUNDED, Topology.TORUS, Topology.KLEIN_BOTTLE):
+            field = SparseField(10, 12, live_cells, Wraparound(topology, 10, 12))
+            states, neighbours = field.cell_arrays()
+
+            self.assertEqual(10 * 12 + 1, len(states), topology)
+            self.assertEqual(field.state_buffer() + b'\x00', states, topology)
+            self.assertEqual([cell.neighbours for cell in field.all_cells.values()], list(neighbours[:-1]), topology)
+            self.assertEqual(0, neighbours[-1], topology)
+            states[0] = 0
+            self.assertIn((0, 0), field.live_cells, topology)
+        self.assertEqual(2, SparseField(10, 12, live_cells, Wraparound(Topology.TORUS, 10, 12)).count_neighbours(0, 0))
+        self.assertEqual(1, SparseField(10, 12, live_cells).count_neighbours(0, 0))
@@ -0,0 +1,105 @@
+"""Tests related to the Bit-Board engine."""
+import random
+import unittest
+
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.engines.bitboard_engine import BitBoardEngine
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+
+
+class TestBitBoardEngine(unittest.TestCase):
+    """Tests related to the Bit-Board engine functionality."""
+
+    def test_blinker(self) -> None:
+        """Test period 2 oscillator on the edge of the board."""
+        engine = BitBoardEngine(10, 11)
+        engine.set_alive(0, 9, True)
+        engine.set_alive(0, 10, True)
+        engine.set_alive(1, 10, True)
+        engine.set_alive(5, 0, True)
+        engine.set_alive(6, 0, True)
+        engine.set_alive(7, 0, True)
+
+        engine.step()
+
+        self.assertTrue(engine.is_alive(0, 9))
+        self.assertTrue(engine.is_alive(1, 9))
+        self.assertTrue(engine.is_alive(6, 0))
+        self.assertTrue(engine.is_alive(6, 1))
+        self.assertFalse(engine.is_alive(5, 0))
+        self.assertFalse(engine.is_alive(7, 0))
+        self.assertTrue(engine.is_alive(1, 10))
+        self.assertEqual(6, engine.population)
+
+    def test_buffers(self) -> None:
+        """Test conversion of the board to row-major buffers and back."""
+        engine = BitBoardEngine(10, 12)
+        states = bytearray(120)
+        states[0] = states[1] = states[13] = states[119] = 1
+
+        engine.load_state_buffer(states)
+        neighbours = engine.neighbours_buffer()
+
+        self.assertEqual(bytes(states), engine.state_buffer())
+        self.assertEqual(2, neighbours[0])
+        self.assertEqual(3, neighbours[12])
+        self.assertEqual(0, neighbours[119])
+        self.assertEqual(1, neighbours[118])
+
+    def test_all_neighbours_alive(self) -> None:
+        """Test count of 8 neighbours which needs the highest bit plane."""
+        engine = BitBoardEngine(10, 10)
+        engine.load_state_buffer(b'\x01' * 100)
+
+        neighbours = engine.neighbours_buffer()
+        engine.step()
+
+        self.assertEqual(8, neighbours[55])
+        self.assertEqual(3, neighbours[0])
+        self.assertEqual(5, neighbours[5])
+        self.assertEqual(4, engine.population)
+
+    def test_equivalence_with_object_engine(self) -> None:
+        """Test that generations are the same as in reference implementation."""
+        reference = GameFlowProcess(13, 19)
+        tested = GameFlowProcess(13, 19, engine_type=EngineType.BITBOARD)
+        rnd = random.Random(3)
+        for row in range(13):
+            for col in range(19):
+                if rnd.getrandbits(1):
+                    reference.switch_cell_state(row, col)
+                    tested.switch_cell_state(row, col)
+
+        for _ in range(30):
+            reference.create_next_generation()
+            tested.create_next_generation()
+            self.assertEqual(reference.game_field.state_buffer(), tested.game_field.state_buffer())
+
+        for ((row, col), cell) in tested.game_field.all_cells.items():
+            expected = reference.game_field.all_cells[(row, col)]
+            self.assertEqual(expected.state, cell.state)
+            self.assertEqual(expected.neighbours, cell.neighbours)
+
+    def test_field_view(self) -> None:
+        """Test that field of the game reflects the bit-board."""
+        game = GameFlowProcess(engine_type=EngineType.BITBOARD)
+        game.switch_cell_state(4, 3)
+        game.switch_cell_state(4, 4)
+        game.switch_cell_state(4, 5)
+        game.create_next_generation()
+
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(3, 4)].state)
+        self.assertEqual(CellState.DEAD, game.game_field.all_cells[(4, 3)].state)
+        self.assertEqual(3, game.game_field.all_cells[(4, 3)].neighbours)
+
+    def test_changed_cells(self) -> None:
+        """Test cells changed by the last step."""
+        engine = BitBoardEngine(10, 10)
+        engine.set_alive(4, 3, True)
+        engine.set_alive(4, 4, True)
+        engine.set_alive(4, 5, True)
+
+        engine.step()
+
+        self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, engine.changed_cells())
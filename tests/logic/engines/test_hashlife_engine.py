@@ -0,0 +1,118 @@
+"""Tests related to the HashLife engine."""
+import unittest
+
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.engines.hashlife_engine import HashLifeEngine
+from gameoflifeapi.logic.engines.sparse_engine import SparseEngine
+from gameoflifeapi.logic.exceptions import EngineNotAvailableException
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+from gameoflifeapi.logic.rules import HIGHLIFE_RULE, parse_rule
+from gameoflifeapi.logic.topology import Topology
+
+R_PENTOMINO: set[tuple[int, int]] = {(0, 1), (0, 2), (1, 0), (1, 1), (2, 1)}
+GLIDER: set[tuple[int, int]] = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+
+
+class TestHashLifeEngine(unittest.TestCase):
+    """Tests related to the HashLife engine functionality."""
+
+    def test_equivalence_with_sparse_engine(self) -> None:
+        """Test jumps of the pattern which doesn't reach edges of the sparse board."""
+        hashlife = HashLifeEngine(10, 10)
+        sparse = SparseEngine(1000, 1000)
+        for (row, col) in R_PENTOMINO:
+            hashlife.set_alive(row + 500, col + 500, True)
+            sparse.set_alive(row + 500, col + 500, True)
+
+        for generations in (1, 2, 3, 5, 8, 13, 50, 100):
+            hashlife.advance(generations)
+            sparse.advance(generations)
+            self.assertEqual(sparse.live_cells, hashlife.live_cells())
+
+    def test_equivalence_with_sparse_engine_for_highlife(self) -> None:
+        """Test jumps of the HighLife replicator."""
+        replicator: set[tuple[int, int]] = {(0, 2), (0, 3), (0, 4), (1, 1), (1, 4), (2, 0), (2, 4),
+                                            (3, 0), (3, 3), (4, 0), (4, 1), (4, 2)}
+        hashlife = HashLifeEngine(10, 10, rule=HIGHLIFE_RULE)
+        sparse = SparseEngine(1000, 1000, HIGHLIFE_RULE)
+        for (row, col) in replicator:
+            hashlife.set_alive(row + 500, col + 500, True)
+            sparse.set_alive(row + 500, col + 500, True)
+
+        for generations in (1, 3, 12, 48, 96):
+            hashlife.advance(generations)
+            sparse.advance(generations)
+            self.assertEqual(sparse.live_cells, hashlife.live_cells())
+        self.assertRaises(EngineNotAvailableException, HashLifeEngine, 10, 10, rule=parse_rule('B01/S'))
+
+    def test_long_jump_of_glider(self) -> None:
+        """Test that glider moves by one cell diagonally every 4 generations."""
+        engine = HashLifeEngine(10, 10)
+        for (row, col) in GLIDER:
+            engine.set_alive(row, col, True)
+
+        engine.advance(1_000_000)
+
+        shift = 1_000_000 // 4
+        self.assertEqual({(row + shift, col + shift) for (row, col) in GLIDER}, engine.live_cells())
+        self.assertEqual(5, engine.population)
+
+    def test_bounded_node_cache(self) -> None:
+        """Test that cache eviction doesn't change results."""
+        bounded = HashLifeEngine(10, 10, max_nodes=500)
+        unbounded = HashLifeEngine(10, 10)
+        bounded.load_live_cells(R_PENTOMINO)
+        unbounded.load_live_cells(R_PENTOMINO)
+
+        bounded.advance(300)
+        unbounded.advance(300)
+
+        self.assertEqual(unbounded.live_cells(), bounded.live_cells())
+        self.assertLessEqual(bounded.node_count, 500)
+
+    def test_window_buffers(self) -> None:
+        """Test that buffers contain only the window of the universe."""
+        engine = HashLifeEngine(10, 10)
+        engine.set_alive(-1, 0, True)
+        engine.set_alive(0, 0, True)
+        engine.set_alive(9, 9, True)
+        engine.set_alive(10, 10, True)
+
+        states = engine.state_buffer()
+        neighbours = engine.neighbours_buffer()
+
+        self.assertTrue(engine.is_alive(-1, 0))
+        self.assertFalse(engine.is_alive(-1, 1))
+        self.assertEqual(2, sum(states))
+        self.assertEqual(1, states[0])
+        self.assertEqual(1, states[99])
+        self.assertEqual(1, neighbours[0])
+        self.assertEqual(2, neighbours[1])
+        self.assertEqual(1, neighbours[99])
+
+    def test_game_flow_advance(self) -> None:
+        """Test jumps of the game with HashLife engine."""
+        game = GameFlowProcess(engine_type=EngineType.HASHLIFE)
+        for (row, col) in GLIDER:
+            game.switch_cell_state(row, col)
+
+        self.assertEqual(Topology.INFINITE, game.topology)
+        self.assertEqual(Topology.INFINITE, HashLifeEngine(10, 10, topology=Topology.BOUNDED).topology)
+        game.advance(8)
+
+        self.assertEqual(8, game.generation)
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(2, 3)].state)
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(4, 4)].state)
+        self.assertEqual(CellState.DEAD, game.game_field.all_cells[(0, 1)].state)
+
+    def test_changed_cells(self) -> None:
+        """Test cells changed by the last step."""
+        engine = HashLifeEngine(10, 10)
+        engine.set_alive(4, 3, True)
+        engine.set_alive(4, 4, True)
+        engine.set_alive(4, 5, True)
+
+        engine.step()
+
+        self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, engine.changed_cells())
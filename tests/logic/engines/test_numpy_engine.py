@@ -0,0 +1,96 @@
+"""Tests related to the NumPy engine."""
+import random
+import unittest
+
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.engines.numpy_engine import NumpyEngine, np
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+
+
+def _create_random_games(rows: int, columns: int, seed: int) -> tuple[GameFlowProcess, GameFlowProcess]:
+    """Create reference (object) game and numpy game with the same random cells."""
+    reference = GameFlowProcess(rows, columns)
+    tested = GameFlowProcess(rows, columns, engine_type=EngineType.NUMPY)
+    rnd = random.Random(seed)
+    for row in range(rows):
+        for col in range(columns):
+            if rnd.getrandbits(1):
+                reference.switch_cell_state(row, col)
+                tested.switch_cell_state(row, col)
+    return reference, tested
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestNumpyEngine(unittest.TestCase):
+    """Tests related to the NumPy engine functionality."""
+
+    def test_blinker(self) -> None:
+        """Test period 2 oscillator."""
+        engine = NumpyEngine(10, 10)
+        engine.set_alive(4, 3, True)
+        engine.set_alive(4, 4, True)
+        engine.set_alive(4, 5, True)
+
+        engine.step()
+
+        self.assertTrue(engine.is_alive(3, 4))
+        self.assertTrue(engine.is_alive(4, 4))
+        self.assertTrue(engine.is_alive(5, 4))
+        self.assertFalse(engine.is_alive(4, 3))
+        self.assertFalse(engine.is_alive(4, 5))
+
+    def test_neighbours_buffer(self) -> None:
+        """Test counting of neighbours on the edges of the field."""
+        engine = NumpyEngine(10, 10)
+        engine.set_alive(0, 0, True)
+        engine.set_alive(0, 1, True)
+        engine.set_alive(1, 1, True)
+
+        neighbours = engine.neighbours_buffer()
+
+        self.assertEqual(2, neighbours[0])
+        self.assertEqual(2, neighbours[1])
+        self.assertEqual(3, neighbours[10])
+        self.assertEqual(0, neighbours[99])
+
+    def test_equivalence_with_object_engine(self) -> None:
+        """Test that generations are the same as in reference implementation."""
+        reference, tested = _create_random_games(17, 23, 42)
+
+        for _ in range(30):
+            reference.create_next_generation()
+            tested.create_next_generation()
+            self.assertEqual(reference.game_field.state_buffer(), tested.game_field.state_buffer())
+
+        for ((row, col), cell) in tested.game_field.all_cells.items():
+            expected = reference.game_field.all_cells[(row, col)]
+            self.assertEqual(expected.state, cell.state)
+            self.assertEqual(expected.neighbours, cell.neighbours)
+        self.assertEqual(30, tested.generation)
+
+    def test_switch_cell_state(self) -> None:
+        """Test switching cells via game flow with numpy engine."""
+        game = GameFlowProcess(engine_type=EngineType.NUMPY)
+        game.switch_cell_state(0, 1)
+        game.switch_cell_state(1, 1)
+
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(0, 1)].state)
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(1, 1)].state)
+        self.assertEqual(2, game.game_field.all_cells[(0, 0)].neighbours)
+
+        game.switch_cell_state(0, 1)
+
+        self.assertEqual(CellState.DEAD, game.game_field.all_cells[(0, 1)].state)
+        self.assertEqual(1, game.game_field.all_cells[(0, 0)].neighbours)
+
+    def test_changed_cells(self) -> None:
+        """Test cells changed by the last step."""
+        engine = NumpyEngine(10, 10)
+        engine.set_alive(4, 3, True)
+        engine.set_alive(4, 4, True)
+        engine.set_alive(4, 5, True)
+
+        engine.step()
+
+        self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, engine.changed_cells())
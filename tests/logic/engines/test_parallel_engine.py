@@ -0,0 +1,77 @@
+"""Tests related to the multi-process engine."""
+import random
+import unittest
+
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.engines.numpy_engine import np
+from gameoflifeapi.logic.engines.parallel_engine import ParallelEngine
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestParallelEngine(unittest.TestCase):
+    """Tests related to the multi-process engine functionality."""
+
+    def test_blinker_on_stripe_border(self) -> None:
+        """Test oscillator which crosses border between stripes."""
+        engine = ParallelEngine(10, 10, workers=2)
+        try:
+            engine.set_alive(4, 3, True)
+            engine.set_alive(4, 4, True)
+            engine.set_alive(4, 5, True)
+
+            engine.step()
+
+            self.assertTrue(engine.is_alive(3, 4))
+            self.assertTrue(engine.is_alive(5, 4))
+            self.assertFalse(engine.is_alive(4, 3))
+            self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, engine.changed_cells())
+        finally:
+            engine.close()
+
+    def test_equivalence_with_object_engine(self) -> None:
+        """Test that generations are the same as in reference implementation."""
+        reference = GameFlowProcess(23, 17)
+        tested = GameFlowProcess(23, 17, engine_type=EngineType.PARALLEL, workers=3)
+        rnd = random.Random(11)
+        for row in range(23):
+            for col in range(17):
+                if rnd.getrandbits(1):
+                    reference.switch_cell_state(row, col)
+                    tested.switch_cell_state(row, col)
+        try:
+            for _ in range(20):
+                reference.create_next_generation()
+                tested.create_next_generation()
+                self.assertEqual(reference.game_field.state_buffer(), tested.game_field.state_buffer())
+
+            for ((row, col), cell) in tested.game_field.all_cells.items():
+                self.assertEqual(reference.game_field.all_cells[(row, col)].neighbours, cell.neighbours)
+        finally:
+            tested.close()
+
+    def test_rule(self) -> None:
+        """Test that rule lookup table is passed to worker processes."""
+        reference = GameFlowProcess(20, 20, rule='B3678/S34678')
+        tested = GameFlowProcess(20, 20, engine_type=EngineType.PARALLEL, workers=2, rule='B3678/S34678')
+        rnd = random.Random(12)
+        for row in range(20):
+            for col in range(20):
+                if rnd.getrandbits(1):
+                    reference.switch_cell_state(row, col)
+                    tested.switch_cell_state(row, col)
+        try:
+            for _ in range(10):
+                reference.create_next_generation()
+                tested.create_next_generation()
+            self.assertEqual(reference.state_buffer(), tested.state_buffer())
+        finally:
+            tested.close()
+
+    def test_workers_number(self) -> None:
+        """Test that there are no more workers than rows."""
+        engine = ParallelEngine(10, 10, workers=64)
+        try:
+            self.assertEqual(10, engine.workers)
+        finally:
+            engine.close()
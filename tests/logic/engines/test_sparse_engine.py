@@ -0,0 +1,102 @@
+"""Tests related to the Sparse engine."""
+import random
+import unittest
+
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.sparse_field import SparseField
+from gameoflifeapi.logic.data.state import CellState
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.engines.sparse_engine import SparseEngine
+from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+
+
+class TestSparseEngine(unittest.TestCase):
+    """Tests related to the Sparse engine functionality."""
+
+    def test_blinker(self) -> None:
+        """Test period 2 oscillator."""
+        engine = SparseEngine(10, 10)
+        engine.set_alive(4, 3, True)
+        engine.set_alive(4, 4, True)
+        engine.set_alive(4, 5, True)
+
+        engine.step()
+
+        self.assertEqual({(3, 4), (4, 4), (5, 4)}, engine.live_cells)
+
+    def test_edges_are_dead(self) -> None:
+        """Test that cells outside the field are never born."""
+        engine = SparseEngine(10, 10)
+        engine.set_alive(0, 3, True)
+        engine.set_alive(0, 4, True)
+        engine.set_alive(0, 5, True)
+
+        engine.step()
+
+        self.assertEqual({(0, 4), (1, 4)}, engine.live_cells)
+
+    def test_equivalence_with_object_engine(self) -> None:
+        """Test that generations are the same as in reference implementation."""
+        reference = GameFlowProcess(15, 21)
+        tested = GameFlowProcess(15, 21, engine_type=EngineType.SPARSE)
+        rnd = random.Random(7)
+        for row in range(15):
+            for col in range(21):
+                if rnd.getrandbits(1):
+                    reference.switch_cell_state(row, col)
+                    tested.switch_cell_state(row, col)
+
+        for _ in range(30):
+            reference.create_next_generation()
+            tested.create_next_generation()
+            self.assertEqual(reference.game_field.state_buffer(), tested.game_field.state_buffer())
+
+        for ((row, col), cell) in tested.game_field.all_cells.items():
+            self.assertEqual(reference.game_field.all_cells[(row, col)].neighbours, cell.neighbours)
+
+    def test_game_flow_uses_sparse_field(self) -> None:
+        """Test that huge field is not allocated cell by cell."""
+        game = GameFlowProcess(100_000, 100_000, engine_type=EngineType.SPARSE)
+        game.switch_cell_state(50_000, 49_999)
+        game.switch_cell_state(50_000, 50_000)
+        game.switch_cell_state(50_000, 50_001)
+        game.create_next_generation()
+
+        self.assertIsInstance(game.game_field, SparseField)
+        self.assertEqual({(49_999, 50_000), (50_000, 50_000), (50_001, 50_000)},
+                         game.game_field.live_cells)
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(49_999, 50_000)].state)
+        self.assertEqual(3, game.game_field.all_cells[(50_000, 49_999)].neighbours)
+
+    def test_loading_of_dense_field(self) -> None:
+        """Test creation of the game from the field with Cell objects."""
+        field = Field()
+        field.all_cells[(2, 2)].state = CellState.ALIVE
+        field.all_cells[(9, 9)].state = CellState.ALIVE
+
+        game = GameFlowProcess(game_field=field, generation=3, engine_type=EngineType.SPARSE)
+
+        self.assertEqual({(2, 2), (9, 9)}, game.game_field.live_cells)
+        self.assertEqual(3, game.generation)
+
+    def test_object_engine_loads_sparse_field(self) -> None:
+        """Test creation of the object engine game from the Sparse Field."""
+        field = SparseField(10, 10, {(4, 3), (4, 4), (4, 5)})
+
+        game = GameFlowProcess(game_field=field)
+        game.create_next_generation()
+
+        self.assertNotIsInstance(game.game_field, SparseField)
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(3, 4)].state)
+        self.assertEqual(CellState.DEAD, game.game_field.all_cells[(4, 3)].state)
+
+    def test_changed_cells(self) -> None:
+        """Test cells changed by the last step."""
+        engine = SparseEngine(10, 10)
+        engine.set_alive(4, 3, True)
+        engine.set_alive(4, 4, True)
+        engine.set_alive(4, 5, True)
+
+        engine.step()
+
+        self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, engine.changed_cells())
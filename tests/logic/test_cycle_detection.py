@@ -0,0 +1,86 @@
+"""Tests related to detection of the still lifes and oscillators."""
+import random
+import unittest
+import unittest.mock as mock
+
+from gameoflifeapi.logic.cycle_detection import Cycle, CycleDetector
+
+
+class TestCycleDetector(unittest.TestCase):
+    """Test hashing of the boards and indexing of the generations."""
+
+    def test_hash_states(self) -> None:
+        """Test hash updated by changed cells equals hash of all cells with and without numpy."""
+        rnd = random.Random(3)
+        states = bytearray(rnd.getrandbits(1) for _ in range(10 * 14))
+        detector = CycleDetector(10, 14)
+        detector.reset(bytes(states), 0)
+        changed = rnd.sample(range(len(states)), 30)
+        for index in changed:
+            states[index] ^= 1
+        detector.update(changed, 1, lambda: bytes(states))
+
+        self.assertEqual(detector.hash_states(bytes(states)), detector.hash)
+        with mock.patch('gameoflifeapi.logic.cycle_detection.np', None):
+            self.assertEqual(detector.hash, detector.hash_states(bytes(states)))
+        self.assertEqual(0, detector.hash_states(bytes(len(states))))
+        self.assertNotEqual(detector.hash_states(bytes([1]) + bytes(139)),
+                            detector.hash_states(bytes(14) + bytes([1]) + bytes(125)))
+
+    def test_update(self) -> None:
+        """Test the repeated board is reported after its states are repeated once more."""
+        detector = CycleDetector(10, 10)
+        states = bytearray(100)
+        detector.reset(bytes(states), 5)
+        self.assertIsNone(_update(detector, states, [1, 2], 6))
+        self.assertIsNone(_update(detector, states, [3], 7))
+        #   hash of generation 6 is repeated, states are compared at generation 10
+        self.assertIsNone(_update(detector, states, [3], 8))
+        self.assertIsNone(_update(detector, states, [3], 9))
+        self.assertEqual(Cycle(6, 2), _update(detector, states, [3], 10))
+        #   cycle is kept until the detector is cleared
+        self.assertEqual(Cycle(6, 2), _update(detector, states, [1], 11))
+        detector.clear()
+        self.assertIsNone(detector.cycle)
+        self.assertIsNone(detector.hash)
+
+    def test_hash_collision(self) -> None:
+        """Test boards with the same hash are not reported as the cycle if their states differ."""
+        detector = CycleDetector(10, 10)
+        states = bytearray(100)
+        detector.reset(bytes(states), 0)
+        self.assertIsNone(_update(detector, states, [1], 1))
+        #   board of generation 2 has the hash of generation 0, states of generation 4 differ
+        read_states = mock.Mock(side_effect=[bytes(100), bytes(99) + b'\x01', bytes(100)])
+        self.assertIsNone(detector.update([1], 2, read_states))
+        self.assertIsNone(detector.update([], 3, read_states))
+        self.assertIsNone(detector.update([], 4, read_states))
+        self.assertEqual(3, read_states.call_count)
+        self.assertIsNone(detector.cycle)
+
+    def test_max_period(self) -> None:
+        """Test generations older than max_period are not indexed."""
+        detector = CycleDetector(10, 10, max_period=2)
+        states = bytearray(100)
+        detector.reset(bytes(states), 0)
+        _update(detector, states, [1], 1)
+        _update(detector, states, [2], 2)
+        #   board of generation 0 is repeated, but it is evicted
+        self.assertIsNone(_update(detector, states, [1, 2], 3))
+        self.assertIsNone(_update(detector, states, [1, 2], 4))
+        self.assertIsNone(_update(detector, states, [1, 2], 5))
+        self.assertEqual(Cycle(2, 2), _update(detector, states, [1, 2], 6))
+
+    def test_cycle(self) -> None:
+        """Test description of the cycles."""
+        self.assertEqual('still life at gen 4', str(Cycle(4, 1)))
+        self.assertTrue(Cycle(4, 1).is_still_life)
+        self.assertEqual('period 2 since gen 15', str(Cycle(15, 2)))
+        self.assertEqual({'start': 15, 'period': 2}, Cycle(15, 2).as_dict())
+
+
+def _update(detector: CycleDetector, states: bytearray, changed: list[int], generation: int) -> Cycle:
+    """Change the cells of the board and update the detector by them."""
+    for index in changed:
+        states[index] ^= 1
+    return detector.update(changed, generation, lambda: bytes(states))
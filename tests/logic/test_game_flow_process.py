@@ -1,10 +1,26 @@
 """Tests for covering game flow process class."""
 import unittest
+import unittest.mock as mock
 
+import random
+
+from gameoflifeapi.logic.cycle_detection import Cycle
 from gameoflifeapi.logic.data.field import Field
 from gameoflifeapi.logic.data.state import CellState
-from gameoflifeapi.logic.exceptions import GenerationValueException
+from gameoflifeapi.logic.engines.engine_factory import (HASHLIFE_JUMP_GENERATIONS,
+                                                        is_engine_available,
+                                                        select_jump_engine_type)
+from gameoflifeapi.logic.engines.engine_type import EngineType
+from gameoflifeapi.logic.exceptions import (EngineNotAvailableException,
+                                            GenerationValueException,
+                                            RuleStringException)
 from gameoflifeapi.logic.game_flow_process import GameFlowProcess
+from gameoflifeapi.logic.history import GenerationHistory
+from gameoflifeapi.logic.instrumentation import (PHASE_CALLBACK,
+                                                 PHASE_NEIGHBOURS, PHASE_RULES,
+                                                 Instrumentation)
+from gameoflifeapi.logic.rules import apply_rules_and_change_state
+from gameoflifeapi.logic.topology import Topology
 
 
 def _on_generation_created_stub() -> None:
@@ -81,6 +97,59 @@ class TestGameFlowProcess(unittest.TestCase):
         self.assertEqual(CellState.DEAD, game.game_field.all_cells[(1, 1)].state)
         self.assertEqual(CellState.DEAD, game.game_field.all_cells[(1, 1)].state)
 
+    def test_set_cells(self) -> None:
+        """Test bulk change of cells keeps neighbour numbers of every engine equal to recounted ones."""
+        rnd = random.Random(19)
+        alive = [(rnd.randrange(15), rnd.randrange(17)) for _ in range(120)]
+        dead = [(rnd.randrange(15), rnd.randrange(17)) for _ in range(60)]
+        reference = GameFlowProcess(15, 17)
+        reference.set_cells(alive, CellState.ALIVE)
+        reference.set_cells(dead + dead, CellState.DEAD)
+        reference.switch_cell_state(0, 0)
+        reference.switch_cell_state(14, 16)
+        expected_states = reference.state_buffer()
+
+        expected_alive = (set(alive) - set(dead)) ^ {(0, 0), (14, 16)}
+        self.assertEqual(expected_alive, {divmod(index, 17) for (index, state) in enumerate(expected_states) if state})
+        neighbours = [cell.neighbours for cell in reference.game_field.all_cells.values()]
+        reference._count_neighbours_for_field()
+        self.assertEqual([cell.neighbours for cell in reference.game_field.all_cells.values()], neighbours)
+        for engine_type in (EngineType.NUMPY, EngineType.SPARSE, EngineType.BITBOARD, EngineType.HASHLIFE):
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(15, 17, engine_type=engine_type)
+            game.set_cells(alive, CellState.ALIVE)
+            game.set_cells(dead + dead, CellState.DEAD)
+            game.switch_cell_state(0, 0)
+            game.switch_cell_state(14, 16)
+
+            self.assertEqual(expected_states, game.state_buffer(), engine_type)
+
+    def test_change_cells_outside_of_field(self) -> None:
+        """Test cells outside of the field are rejected by every engine without changing the field."""
+        for engine_type in EngineType:
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(10, 12, engine_type=engine_type)
+            for (row, column) in ((-1, 0), (0, -1), (10, 0), (0, 12)):
+                self.assertRaises(KeyError, game.switch_cell_state, row, column)
+            self.assertRaises(KeyError, game.set_cells, ((1, 1), (9, 12)), CellState.ALIVE)
+            self.assertEqual(0, game.state_buffer().count(1), engine_type)
+            game.close()
+
+    def test_switch_cell_state_of_field_without_neighbours(self) -> None:
+        """Test neighbours of the passed field are recounted before they are updated by switched cells."""
+        states = bytearray(10 * 10)
+        states[0:3] = b'\x01\x01\x01'
+        game_field = Field()
+        game_field.apply_buffers(bytes(states), bytes(10 * 10))
+        game = GameFlowProcess(game_field=game_field)
+
+        game.switch_cell_state(0, 1)
+        game.switch_cell_state(1, 1)
+        self.assertEqual(3, game.game_field.all_cells[(0, 1)].neighbours)
+        self.assertEqual(2, game.game_field.all_cells[(1, 0)].neighbours)
+
     def test_create_next_generation(self) -> None:
         """Test creation of the new generation."""
         game = GameFlowProcess()
@@ -140,16 +209,388 @@ class TestGameFlowProcess(unittest.TestCase):
         self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(2, 0)].state)
         self.assertEqual(1, game.generation)
 
+    def test_changed_cells(self) -> None:
+        """Test set of cells changed in the last generation."""
+        game = GameFlowProcess()
+        game.switch_cell_state(4, 3)
+        game.switch_cell_state(4, 4)
+        game.switch_cell_state(4, 5)
+
+        self.assertIsNone(game.changed_cells)
+
+        game.create_next_generation()
+
+        self.assertEqual({(4, 3), (4, 5), (3, 4), (5, 4)}, game.changed_cells)
+
+        game.advance(2)
+
+        self.assertIsNone(game.changed_cells)
+
+    def test_state_buffer(self) -> None:
+        """Test cell states of the current generation."""
+        for engine_type in (EngineType.OBJECT, EngineType.SPARSE):
+            game = GameFlowProcess(rows=10, columns=12, engine_type=engine_type)
+            game.switch_cell_state(1, 2)
+
+            expected = bytearray(10 * 12)
+            expected[1 * 12 + 2] = 1
+            self.assertEqual(10, game.rows)
+            self.assertEqual(12, game.columns)
+            self.assertEqual(bytes(expected), game.state_buffer())
+
+    def test_state_snapshot(self) -> None:
+        """Test read-only states of the generation are not changed by next generations and edits."""
+        for engine_type in (EngineType.OBJECT, EngineType.SPARSE):
+            game = GameFlowProcess(rows=10, columns=10, engine_type=engine_type)
+            reference = GameFlowProcess(rows=10, columns=10)
+            for flow in (game, reference):
+                flow.set_cells(((5, 4), (5, 5), (5, 6), (1, 1), (1, 2), (2, 1)), CellState.ALIVE)
+            snapshot = game.state_snapshot()
+            expected = game.state_buffer()
+
+            self.assertTrue(snapshot.readonly, engine_type)
+            self.assertEqual(expected, bytes(snapshot), engine_type)
+            with self.assertRaises(TypeError):
+                snapshot[0] = 1
+            snapshots = [(snapshot, expected)]
+            for _ in range(3):
+                game.create_next_generation()
+                reference.create_next_generation()
+                snapshots.append((game.state_snapshot(), game.state_buffer()))
+            game.switch_cell_state(0, 0)
+            reference.switch_cell_state(0, 0)
+            game.set_cells(((5, 5), (8, 8)), CellState.ALIVE)
+            reference.set_cells(((5, 5), (8, 8)), CellState.ALIVE)
+            for _ in range(2):
+                game.create_next_generation()
+                reference.create_next_generation()
+
+            for snapshot, states in snapshots:
+                self.assertEqual(states, bytes(snapshot), engine_type)
+            self.assertNotEqual(snapshots[0][1], snapshots[1][1], engine_type)
+            self.assertEqual(reference.state_buffer(), game.state_buffer(), engine_type)
+            self.assertEqual(game.state_buffer(), bytes(game.state_snapshot()), engine_type)
+
+    def test_instrumentation(self) -> None:
+        """Test statistics of the generation phases."""
+        expected_phases = {
+            EngineType.OBJECT: {PHASE_RULES, PHASE_NEIGHBOURS, PHASE_CALLBACK},
+            EngineType.SPARSE: {PHASE_RULES, PHASE_CALLBACK},
+        }
+        for engine_type, phases in expected_phases.items():
+            listener = mock.Mock()
+            instrumentation = Instrumentation()
+            instrumentation.add_listener(listener)
+            game = GameFlowProcess(engine_type=engine_type, instrumentation=instrumentation)
+            game.switch_cell_state(4, 3)
+            game.switch_cell_state(4, 4)
+            game.switch_cell_state(4, 5)
+
+            game.create_next_generation()
+
+            listener.assert_not_called()
+
+            instrumentation.enabled = True
+            game.create_next_generation()
+
+            stats = instrumentation.last
+            listener.assert_called_once_with(stats)
+            self.assertEqual(2, stats.generation)
+            self.assertEqual(phases, set(stats.phases))
+            self.assertEqual(3, stats.population)
+            self.assertEqual(4, stats.changed_cells)
+
+    def test_active_region(self) -> None:
+        """Test that rules are applied only around changed cells."""
+        game = GameFlowProcess(20, 20)
+        reference = GameFlowProcess(20, 20)
+        #   Block (still life) and Blinker (period 2)
+        for (row, col) in ((1, 1), (1, 2), (2, 1), (2, 2), (10, 9), (10, 10), (10, 11)):
+            game.switch_cell_state(row, col)
+            reference.switch_cell_state(row, col)
+
+        game.create_next_generation()
+        with mock.patch('gameoflifeapi.logic.game_flow_process.apply_rules_and_change_state',
+                        wraps=apply_rules_and_change_state) as rules_mock:
+            game.create_next_generation()
+        reference.create_next_generation()
+        reference._active_cells = None
+        reference.create_next_generation()
+
+        self.assertEqual(21, rules_mock.call_count)
+        self.assertEqual(reference.game_field.state_buffer(), game.game_field.state_buffer())
+        for ((row, col), cell) in game.game_field.all_cells.items():
+            self.assertEqual(reference.game_field.all_cells[(row, col)].neighbours, cell.neighbours)
+
+    def test_advance(self) -> None:
+        """Test jump by number of generations."""
+        reference = GameFlowProcess(12, 14)
+        game = GameFlowProcess(12, 14)
+        for (row, col) in ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2), (7, 7), (7, 8), (7, 9)):
+            reference.switch_cell_state(row, col)
+            game.switch_cell_state(row, col)
+        for _ in range(25):
+            reference.create_next_generation()
+
+        game.advance(25)
+
+        self.assertEqual(25, game.generation)
+        for ((row, col), cell) in game.game_field.all_cells.items():
+            expected = reference.game_field.all_cells[(row, col)]
+            self.assertEqual(expected.state, cell.state)
+            self.assertEqual(expected.neighbours, cell.neighbours)
+        with self.assertRaises(GenerationValueException):
+            game.advance(-1)
+
+    def test_rule(self) -> None:
+        """Test that every engine creates the same generations for the rule."""
+        rnd = random.Random(15)
+        cells = {(rnd.randrange(16), rnd.randrange(16)) for _ in range(90)}
+        for rulestring in ('B36/S23', 'B2/S', 'B3678/S34678', 'B1/S012'):
+            reference = GameFlowProcess(16, 16, rule=rulestring)
+            for (row, col) in cells:
+                reference.switch_cell_state(row, col)
+            for _ in range(6):
+                reference.create_next_generation()
+            for engine_type in (EngineType.NUMPY, EngineType.SPARSE, EngineType.BITBOARD):
+                if not is_engine_available(engine_type):
+                    continue
+                game = GameFlowProcess(16, 16, engine_type=engine_type, rule=rulestring)
+                for (row, col) in cells:
+                    game.switch_cell_state(row, col)
+                for _ in range(6):
+                    game.create_next_generation()
+
+                self.assertEqual(rulestring, game.rule.rulestring)
+                self.assertEqual(reference.state_buffer(), game.state_buffer(), (rulestring, engine_type))
+
+    def test_rule_validation(self) -> None:
+        """Test incorrect rulestring and B0 rule on the sparse engine."""
+        self.assertEqual('B3/S23', GameFlowProcess().rule.rulestring)
+        self.assertRaises(RuleStringException, GameFlowProcess, rule='B3/S9')
+        self.assertRaises(EngineNotAvailableException, GameFlowProcess,
+                          engine_type=EngineType.SPARSE, rule='B0/S8')
+        game = GameFlowProcess(rule='B0/S8')
+        game.advance(3)
+        #   empty field is born, then every generation the border ring dies
+        self.assertEqual(6 * 6, game.state_buffer().count(1))
+
+    def test_topology(self) -> None:
+        """Test that every engine creates the same generations on the wrapped topologies."""
+        rnd = random.Random(16)
+        cells = {(rnd.randrange(12), rnd.randrange(15)) for _ in range(70)}
+        for topology in (Topology.TORUS, Topology.KLEIN_BOTTLE):
+            reference = GameFlowProcess(12, 15, topology=topology)
+            for (row, col) in cells:
+                reference.switch_cell_state(row, col)
+            for _ in range(9):
+                reference.create_next_generation()
+            for engine_type in (EngineType.NUMPY, EngineType.SPARSE, EngineType.BITBOARD):
+                if not is_engine_available(engine_type):
+                    continue
+                game = GameFlowProcess(12, 15, engine_type=engine_type, topology=topology)
+                for (row, col) in cells:
+                    game.switch_cell_state(row, col)
+                game.advance(4)
+                for _ in range(5):
+                    game.create_next_generation()
+
+                self.assertEqual(topology, game.topology)
+                self.assertEqual(reference.state_buffer(), game.state_buffer(), (topology, engine_type))
+                self.assertEqual([cell.neighbours for cell in reference.game_field.all_cells.values()],
+                                 [cell.neighbours for cell in game.game_field.all_cells.values()],
+                                 (topology, engine_type))
+        self.assertRaises(EngineNotAvailableException, GameFlowProcess,
+                          engine_type=EngineType.HASHLIFE, topology=Topology.TORUS)
+
+    def test_torus_glider(self) -> None:
+        """Test that glider crosses the edges of the torus and returns to its start."""
+        game = GameFlowProcess(10, 10, topology=Topology.TORUS)
+        for (row, col) in ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2)):
+            game.switch_cell_state(row, col)
+        start = game.state_buffer()
+
+        for _ in range(40):
+            game.create_next_generation()
+
+        self.assertEqual(start, game.state_buffer())
+
+    def test_infinite_topology(self) -> None:
+        """Test that the infinite field grows in front of the glider."""
+        glider = ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2))
+        results = []
+        for engine_type in (EngineType.OBJECT, EngineType.NUMPY, EngineType.SPARSE, EngineType.BITBOARD):
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(10, 10, engine_type=engine_type, topology=Topology.INFINITE)
+            for (row, col) in glider:
+                game.switch_cell_state(row, col)
+            for _ in range(20):
+                game.create_next_generation()
+            game.advance(20)
+
+            self.assertEqual(5, game.state_buffer().count(1), engine_type)
+            #   glider moved by 10 cells down and right from its start
+            row, col = game.origin
+            self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(row + 10, col + 11)].state)
+            results.append((game.rows, game.columns, game.origin, game.state_buffer()))
+        self.assertEqual(1, len(set(results)))
+        self.assertRaises(RuleStringException, GameFlowProcess, rule='B0/S8', topology=Topology.INFINITE)
+
+    def test_infinite_topology_hashlife_jump(self) -> None:
+        """Test that long jumps of the infinite field by HashLife match generations created one by one."""
+        glider = ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2))
+        blinker = ((6, 6), (6, 7), (6, 8))
+        reference = GameFlowProcess(10, 10, engine_type=EngineType.SPARSE, topology=Topology.INFINITE)
+        for (row, col) in glider + blinker:
+            reference.switch_cell_state(row, col)
+        for _ in range(HASHLIFE_JUMP_GENERATIONS):
+            reference.create_next_generation()
+        expected = {(row - reference.origin[0], col - reference.origin[1])
+                    for (row, col), cell in reference.game_field.all_cells.items() if cell.state is CellState.ALIVE}
+        for engine_type in (EngineType.OBJECT, EngineType.NUMPY, EngineType.SPARSE):
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(10, 10, engine_type=engine_type, topology=Topology.INFINITE)
+            for (row, col) in glider + blinker:
+                game.switch_cell_state(row, col)
+            game.advance(HASHLIFE_JUMP_GENERATIONS)
+
+            alive = {(row - game.origin[0], col - game.origin[1])
+                     for (row, col), cell in game.game_field.all_cells.items() if cell.state is CellState.ALIVE}
+            self.assertEqual(HASHLIFE_JUMP_GENERATIONS, game.generation, engine_type)
+            self.assertEqual(expected, alive, engine_type)
+        self.assertEqual(EngineType.HASHLIFE, select_jump_engine_type(EngineType.NUMPY, HASHLIFE_JUMP_GENERATIONS,
+                                                                      topology=Topology.INFINITE))
+        self.assertEqual(EngineType.NUMPY, select_jump_engine_type(EngineType.NUMPY, HASHLIFE_JUMP_GENERATIONS))
+
+    def test_goto(self) -> None:
+        """Test generations are restored from the history with every engine."""
+        for engine_type in (EngineType.OBJECT, EngineType.NUMPY, EngineType.SPARSE, EngineType.BITBOARD,
+                            EngineType.PARALLEL):
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(20, 20, engine_type=engine_type, history=GenerationHistory(keyframe_interval=4))
+            game.randomize_next_generation(seed=5)
+            recorded = {0: game.state_buffer()}
+            for generation in range(1, 11):
+                game.create_next_generation()
+                recorded[generation] = game.state_buffer()
+            game.advance(5)
+            recorded[15] = game.state_buffer()
+
+            game.step_back()
+            self.assertEqual(10, game.generation, engine_type)
+            for generation in (3, 15, 0, 7):
+                game.goto(generation)
+                self.assertEqual(generation, game.generation)
+                self.assertEqual(recorded[generation], game.state_buffer(), (engine_type, generation))
+            #   cells restored in the object engine have correct neighbours
+            game.create_next_generation()
+            self.assertEqual(recorded[8], game.state_buffer(), engine_type)
+            self.assertRaises(GenerationValueException, game.goto, 9)
+            game.close()
+
+    def test_goto_edited_generation(self) -> None:
+        """Test cells changed after the generation was created are recorded before going back."""
+        game = GameFlowProcess(history=GenerationHistory())
+        game.create_next_generation()
+        game.switch_cell_state(1, 1)
+        game.goto(0)
+        self.assertEqual(0, game.state_buffer().count(1))
+        game.goto(1)
+        self.assertEqual(CellState.ALIVE, game.game_field.all_cells[(1, 1)].state)
+        game.step_back()
+        self.assertRaises(GenerationValueException, game.step_back)
+        self.assertRaises(GenerationValueException, GameFlowProcess().goto, 0)
+
+    def test_goto_infinite_topology(self) -> None:
+        """Test the infinite field is restored with its size and origin."""
+        for engine_type in (EngineType.OBJECT, EngineType.SPARSE):
+            game = GameFlowProcess(10, 10, engine_type=engine_type, topology=Topology.INFINITE,
+                                   history=GenerationHistory())
+            game.set_cells(((0, 1), (1, 2), (2, 0), (2, 1), (2, 2)), CellState.ALIVE)
+            game.create_next_generation()
+            grown = (game.rows, game.columns, game.origin, game.state_buffer())
+
+            game.goto(0)
+            self.assertEqual((10, 10, (0, 0)), (game.rows, game.columns, game.origin), engine_type)
+            self.assertEqual(5, game.state_buffer().count(1))
+            game.goto(1)
+            self.assertEqual(grown, (game.rows, game.columns, game.origin, game.state_buffer()), engine_type)
+
+    def test_cycle(self) -> None:
+        """Test still lifes and oscillators are detected with every engine."""
+        for engine_type in EngineType:
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(20, 20, engine_type=engine_type, detect_cycles=True)
+            game.set_cells(((5, 4), (5, 5), (5, 6)), CellState.ALIVE)
+            for _ in range(3):
+                game.create_next_generation()
+            #   repeated hash is confirmed by the states one period later
+            self.assertIsNone(game.cycle, engine_type)
+            game.create_next_generation()
+            self.assertEqual(Cycle(0, 2), game.cycle, engine_type)
+
+            #   edits reset the detection
+            game.set_cells(((5, 4), (5, 5), (5, 6)), CellState.DEAD)
+            game.set_cells(((10, 10), (10, 11), (11, 10), (11, 11)), CellState.ALIVE)
+            self.assertIsNone(game.cycle, engine_type)
+            game.create_next_generation()
+            game.create_next_generation()
+            self.assertEqual(Cycle(4, 1), game.cycle, engine_type)
+            self.assertTrue(game.cycle.is_still_life)
+
+            #   generation after the jump starts new detection
+            game.randomize_next_generation(seed=4)
+            game.advance(50)
+            self.assertIsNone(game.cycle, engine_type)
+            game.close()
+        self.assertIsNone(GameFlowProcess().cycle)
+        self.assertIsNone(GameFlowProcess(detect_cycles=False).cycle)
+
     def test_randomize_next_generation(self) -> None:
         """Test Game Flow randomize functionality."""
         game_1 = GameFlowProcess()
         game_1.randomize_next_generation()
+        neighbours = [cell.neighbours for cell in game_1.game_field.all_cells.values()]
+        game_1._count_neighbours_for_field()
+        self.assertEqual([cell.neighbours for cell in game_1.game_field.all_cells.values()], neighbours)
         count_1 = 0
         for (_coordinates, cell) in game_1.game_field.all_cells.items():
             if cell.state is CellState.ALIVE:
                 count_1 += 1
         self.assertGreater(count_1, 0)
 
+    def test_randomize_next_generation_with_seed(self) -> None:
+        """Test the same seed and density give the same cells with every engine."""
+        reference = GameFlowProcess(rows=20, columns=30)
+        reference.randomize_next_generation(seed=11, density=0.3)
+        self.assertEqual(11, reference.seed)
+        self.assertEqual(0.3, reference.density)
+        states = reference.state_buffer()
+        self.assertTrue(100 < states.count(1) < 260)
+        reference.create_next_generation()
+        next_states = reference.state_buffer()
+
+        for engine_type in (EngineType.OBJECT, EngineType.NUMPY, EngineType.SPARSE, EngineType.BITBOARD):
+            if not is_engine_available(engine_type):
+                continue
+            game = GameFlowProcess(rows=20, columns=30, engine_type=engine_type)
+            game.switch_cell_state(0, 0)
+            game.randomize_next_generation(seed=11, density=0.3)
+            self.assertEqual(states, game.state_buffer(), engine_type)
+            game.create_next_generation()
+            self.assertEqual(next_states, game.state_buffer(), engine_type)
+            game.close()
+
+        #   seed is created when it is not passed
+        game = GameFlowProcess()
+        self.assertIsNone(game.seed)
+        game.randomize_next_generation()
+        self.assertIsNotNone(game.seed)
+
     def test__count_neighbours_for_field(self) -> None:
         """Test counting of neighbours for whole field.
 
@@ -0,0 +1,106 @@
+"""Tests related to the history of the generations."""
+import random
+import unittest
+
+from gameoflifeapi.logic.exceptions import GenerationValueException
+from gameoflifeapi.logic.history import GenerationHistory
+
+
+def _random_states(rnd: random.Random, size: int) -> bytes:
+    return bytes(rnd.getrandbits(1) for _ in range(size))
+
+
+class TestGenerationHistory(unittest.TestCase):
+    """Test recording and restoring of the generations."""
+
+    def test_record_and_restore(self) -> None:
+        """Test every recorded generation is restored from keyframes and deltas."""
+        rnd = random.Random(21)
+        history = GenerationHistory(keyframe_interval=4)
+        recorded: dict[int, bytes] = {}
+        for generation in range(10):
+            recorded[generation] = _random_states(rnd, 150)
+            history.record(generation, recorded[generation], 10, 15, (0, generation))
+
+        self.assertEqual(list(range(10)), history.generations)
+        self.assertEqual(10, len(history))
+        for generation in (9, 0, 5, 3, 4):
+            frame = history.restore(generation)
+            self.assertEqual(recorded[generation], frame.states, generation)
+            self.assertEqual((generation, 10, 15, (0, generation)),
+                             (frame.generation, frame.rows, frame.columns, frame.origin))
+        self.assertRaises(GenerationValueException, history.restore, 10)
+
+    def test_record_changes(self) -> None:
+        """Test generations are recorded by the changed cells between keyframes."""
+        rnd = random.Random(23)
+        history = GenerationHistory(keyframe_interval=3)
+        states = bytearray(_random_states(rnd, 150))
+        recorded: dict[int, bytes] = {0: bytes(states)}
+        self.assertFalse(history.record_changes(0, [], 10, 15))
+        history.record(0, bytes(states), 10, 15)
+        for generation in range(1, 7):
+            changed = rnd.sample(range(150), 20)
+            for index in changed:
+                states[index] ^= 1
+            recorded[generation] = bytes(states)
+            if not history.record_changes(generation, changed, 10, 15):
+                #   every third generation is the keyframe
+                self.assertEqual(0, generation % 3, generation)
+                history.record(generation, bytes(states), 10, 15)
+
+        for generation in (6, 1, 5, 2, 0):
+            self.assertEqual(recorded[generation], history.restore(generation).states, generation)
+        #   delta needs the previous generation with the same field
+        self.assertFalse(history.record_changes(8, [1], 10, 15))
+        self.assertFalse(history.record_changes(7, [1], 10, 15, (0, 1)))
+        self.assertTrue(history.record_changes(7, [1], 10, 15))
+        #   generation recorded again starts new keyframe
+        self.assertFalse(history.record_changes(7, [1], 10, 15))
+
+    def test_record_resized_field(self) -> None:
+        """Test field of other size starts new keyframe."""
+        history = GenerationHistory()
+        history.record(0, bytes([1]) * 100, 10, 10)
+        history.record(1, bytes([1]) * 120, 10, 12)
+        history.record(2, bytes([0]) * 120, 10, 12)
+
+        self.assertEqual(bytes([1]) * 100, history.restore(0).states)
+        self.assertEqual(12, history.restore(1).columns)
+        self.assertEqual(bytes(120), history.restore(2).states)
+
+    def test_record_older_generation(self) -> None:
+        """Test recording of the older generation drops newer ones."""
+        history = GenerationHistory()
+        for generation in range(5):
+            history.record(generation, bytes([generation % 2]) * 100, 10, 10)
+        history.record(2, bytes([1]) * 100, 10, 10)
+        history.record(3, bytes(100), 10, 10)
+
+        self.assertEqual([0, 1, 2, 3], history.generations)
+        self.assertEqual(bytes([1]) * 100, history.restore(2).states)
+        self.assertEqual(bytes(100), history.restore(3).states)
+        self.assertEqual(2, history.previous(3))
+        self.assertEqual(3, history.previous(10))
+        self.assertIsNone(history.previous(0))
+
+    def test_memory_budget(self) -> None:
+        """Test the oldest keyframe groups are evicted over the budget."""
+        rnd = random.Random(22)
+        history = GenerationHistory(memory_budget=4000, keyframe_interval=3)
+        recorded: dict[int, bytes] = {}
+        for generation in range(30):
+            recorded[generation] = _random_states(rnd, 400)
+            history.record(generation, recorded[generation], 20, 20)
+
+        generations = history.generations
+        self.assertLessEqual(history.memory_used, 4000)
+        self.assertEqual(29, generations[-1])
+        self.assertEqual(list(range(generations[0], 30)), generations)
+        self.assertEqual(0, generations[0] % 3)
+        for generation in generations:
+            self.assertEqual(recorded[generation], history.restore(generation).states)
+
+        history.clear()
+        self.assertEqual(0, len(history))
+        self.assertEqual(0, history.memory_used)
@@ -0,0 +1,48 @@
+"""Tests related to the Instrumentation functionality."""
+import unittest
+import unittest.mock as mock
+
+from gameoflifeapi.logic.instrumentation import (PHASE_CALLBACK, PHASE_RULES,
+                                                 GenerationStats,
+                                                 Instrumentation)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests related to the Instrumentation functionality."""
+
+    def test_creation_of_instrumentation(self) -> None:
+        """Test default state of the instrumentation."""
+        instrumentation = Instrumentation()
+
+        self.assertFalse(instrumentation.enabled)
+        self.assertIsNone(instrumentation.last)
+        self.assertEqual({}, instrumentation.totals)
+        self.assertEqual(0, instrumentation.records)
+
+    def test_record(self) -> None:
+        """Test statistics are summed and passed to listeners."""
+        instrumentation = Instrumentation(enabled=True)
+        listener = mock.Mock()
+        removed_listener = mock.Mock()
+        instrumentation.add_listener(listener)
+        instrumentation.add_listener(removed_listener)
+        instrumentation.remove_listener(removed_listener)
+        first = GenerationStats(1, {PHASE_RULES: 0.5, PHASE_CALLBACK: 0.25}, 10, 3)
+        second = GenerationStats(2, {PHASE_RULES: 0.5}, 8, 2)
+
+        instrumentation.record(first)
+        instrumentation.record(second)
+
+        self.assertIs(second, instrumentation.last)
+        self.assertEqual({PHASE_RULES: 1.0, PHASE_CALLBACK: 0.25}, instrumentation.totals)
+        self.assertEqual(2, instrumentation.records)
+        listener.assert_has_calls([mock.call(first), mock.call(second)])
+        removed_listener.assert_not_called()
+        self.assertEqual({'generation': 2, 'phases': {PHASE_RULES: 0.5}, 'population': 8, 'changed_cells': 2},
+                         second.as_dict())
+
+        instrumentation.reset()
+
+        self.assertIsNone(instrumentation.last)
+        self.assertEqual({}, instrumentation.totals)
+        self.assertEqual(0, instrumentation.records)
@@ -0,0 +1,31 @@
+"""Tests related to the generation of the random cell states."""
+import unittest
+
+from gameoflifeapi.logic.exceptions import DensityValueException
+from gameoflifeapi.logic.random_states import create_seed, random_states
+
+
+class TestRandomStates(unittest.TestCase):
+    """Test seeded generation of the random cell states."""
+
+    def test_random_states(self) -> None:
+        """Test states are reproducible by seed and density."""
+        states = random_states(1000, 5)
+
+        self.assertEqual(1000, len(states))
+        self.assertEqual(len(states), states.count(0) + states.count(1))
+        self.assertTrue(400 < states.count(1) < 600)
+        self.assertEqual(states, random_states(1000, 5))
+        self.assertNotEqual(states, random_states(1000, 6))
+
+    def test_random_states_density(self) -> None:
+        """Test density is the share of the ALIVE cells."""
+        self.assertEqual(bytes(500), random_states(500, 1, 0))
+        self.assertEqual(bytes([1]) * 500, random_states(500, 1, 1))
+        self.assertTrue(1500 < random_states(10000, 1, 0.2).count(1) < 2500)
+        for density in (-0.1, 1.5, None):
+            self.assertRaises(DensityValueException, random_states, 10, 1, density)
+
+    def test_create_seed(self) -> None:
+        """Test new seeds are non-negative 32-bit numbers."""
+        self.assertTrue(all(0 <= create_seed() < 1 << 32 for _ in range(10)))
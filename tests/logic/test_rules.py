@@ -3,7 +3,11 @@ import unittest
 
 from gameoflifeapi.logic.data.cell import Cell
 from gameoflifeapi.logic.data.state import CellState
-from gameoflifeapi.logic.rules import apply_rules_and_change_state
+from gameoflifeapi.logic.exceptions import RuleStringException
+from gameoflifeapi.logic.rules import (CONWAY_RULE, CONWAY_RULE_TABLE,
+                                       HIGHLIFE_RULE, Rule,
+                                       apply_rules_and_change_state,
+                                       compile_rule_table, parse_rule)
 
 
 class TestGameRules(unittest.TestCase):
@@ -116,3 +120,37 @@ class TestGameRules(unittest.TestCase):
         apply_rules_and_change_state(field_cell)
 
         self.assertEqual(CellState.DEAD, field_cell.state)
+
+    def test_compile_rule_table(self) -> None:
+        """Test lookup table indexed by state value and neighbours."""
+        table = compile_rule_table(frozenset({3, 6}), frozenset({2, 3}))
+
+        alive_after_dead = [neighbours for neighbours in range(9) if table[0][neighbours] is CellState.ALIVE]
+        alive_after_alive = [neighbours for neighbours in range(9) if table[1][neighbours] is CellState.ALIVE]
+        self.assertEqual([3, 6], alive_after_dead)
+        self.assertEqual([2, 3], alive_after_alive)
+        self.assertEqual(CellState.DEAD, CONWAY_RULE_TABLE[CellState.DEAD.value][6])
+
+    def test_apply_rules_with_rule_table(self) -> None:
+        """Test HighLife birth with 6 neighbours."""
+        field_cell = Cell(1, 1, CellState.DEAD)
+        field_cell.neighbours = 6
+
+        apply_rules_and_change_state(field_cell, HIGHLIFE_RULE.table)
+
+        self.assertEqual(CellState.ALIVE, field_cell.state)
+
+    def test_parse_rule(self) -> None:
+        """Test rulestrings in B/S and S/B notations."""
+        for rulestring in ('B36/S23', 'b36/s23', 'B63S32', ' 23/36 '):
+            rule: Rule = parse_rule(rulestring)
+
+            self.assertEqual(HIGHLIFE_RULE, rule)
+            self.assertEqual('B36/S23', rule.rulestring)
+        seeds: Rule = parse_rule('B2/S')
+        self.assertEqual(frozenset({2}), seeds.birth)
+        self.assertEqual(frozenset(), seeds.survival)
+        self.assertEqual(bytes([0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0]), CONWAY_RULE.lookup)
+        self.assertTrue(parse_rule('B0/S8').is_birth_on_empty)
+        for rulestring in ('', 'B9/S23', 'B3/X23', 'Conway', '3-23'):
+            self.assertRaises(RuleStringException, parse_rule, rulestring)
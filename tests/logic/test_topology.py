@@ -0,0 +1,83 @@
+"""Tests related to testing topologies of the board."""
+import unittest
+
+from gameoflifeapi.logic.data.sparse_field import NEIGHBOUR_OFFSETS
+from gameoflifeapi.logic.topology import (NEIGHBOURS_PER_CELL, Topology,
+                                          Wraparound)
+
+
+class TestTopology(unittest.TestCase):
+    """Test wraparound of the coordinates beyond the edges."""
+
+    def test_is_wrapped(self) -> None:
+        """Test topologies which glue edges of the board."""
+        self.assertFalse(Topology.BOUNDED.is_wrapped)
+        self.assertTrue(Topology.TORUS.is_wrapped)
+        self.assertTrue(Topology.KLEIN_BOTTLE.is_wrapped)
+        self.assertFalse(Topology.INFINITE.is_wrapped)
+
+    def test_resolve_bounded(self) -> None:
+        """Test that cells beyond the bounded edges are not resolved."""
+        wraparound = Wraparound(Topology.BOUNDED, 10, 12)
+
+        self.assertEqual((0, 0), wraparound.resolve(0, 0))
+        self.assertEqual((9, 11), wraparound.resolve(9, 11))
+        self.assertIsNone(wraparound.resolve(-1, 5))
+        self.assertIsNone(wraparound.resolve(5, 12))
+        self.assertIsNone(wraparound.resolve(10, -1))
+
+    def test_resolve_torus(self) -> None:
+        """Test that torus glues opposite edges."""
+        wraparound = Wraparound(Topology.TORUS, 10, 12)
+
+        self.assertEqual((9, 5), wraparound.resolve(-1, 5))
+        self.assertEqual((0, 5), wraparound.resolve(10, 5))
+        self.assertEqual((5, 11), wraparound.resolve(5, -1))
+        self.assertEqual((5, 0), wraparound.resolve(5, 12))
+        self.assertEqual((9, 11), wraparound.resolve(-1, -1))
+        self.assertEqual((0, 0), wraparound.resolve(10, 12))
+
+    def test_resolve_klein_bottle(self) -> None:
+        """Test that crossing top or bottom edge of the Klein bottle mirrors the column."""
+        wraparound = Wraparound(Topology.KLEIN_BOTTLE, 10, 12)
+
+        self.assertEqual((9, 6), wraparound.resolve(-1, 5))
+        self.assertEqual((0, 11), wraparound.resolve(10, 0))
+        self.assertEqual((5, 11), wraparound.resolve(5, -1))
+        self.assertEqual((5, 0), wraparound.resolve(5, 12))
+        self.assertEqual((9, 0), wraparound.resolve(-1, -1))
+        self.assertEqual((0, 11), wraparound.resolve(10, 12))
+
+    def test_padded_ghost_indices(self) -> None:
+        """Test sources of the ghost cells of the padded board."""
+        self.assertEqual(([], []), Wraparound(Topology.BOUNDED, 10, 10).padded_ghost_indices())
+        self.assertEqual(([], []), Wraparound(Topology.INFINITE, 10, 10).padded_ghost_indices())
+
+        rows, columns = 10, 12
+        stride = columns + 2
+        targets, sources = Wraparound(Topology.TORUS, rows, columns).padded_ghost_indices()
+
+        self.assertEqual(2 * stride + 2 * rows, len(targets))
+        ghosts = dict(zip(targets, sources))
+        #   top left ghost is the bottom right cell
+        self.assertEqual(rows * stride + columns, ghosts[0])
+        #   left ghost of the first row is the last cell of the row
+        self.assertEqual(stride + columns, ghosts[stride])
+
+    def test_neighbour_table(self) -> None:
+        """Test that neighbour table has resolved neighbours of every cell."""
+        rows, columns = 10, 12
+        for topology in Topology:
+            wraparound = Wraparound(topology, rows, columns)
+            table = wraparound.neighbour_table()
+
+            self.assertEqual(rows * columns * NEIGHBOURS_PER_CELL, len(table))
+            for row in range(rows):
+                for column in range(columns):
+                    expected = []
+                    for (row_diff, col_diff) in NEIGHBOUR_OFFSETS:
+                        neighbour = wraparound.resolve(row + row_diff, column + col_diff)
+                        #   sentinel index of the DEAD cell beyond the bounded edge
+                        expected.append(rows * columns if neighbour is None else neighbour[0] * columns + neighbour[1])
+                    start = (row * columns + column) * NEIGHBOURS_PER_CELL
+                    self.assertEqual(expected, list(table[start:start + NEIGHBOURS_PER_CELL]), (topology, row, column))
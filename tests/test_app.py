@@ -0,0 +1,22 @@
+"""Tests related to the console version functionality."""
+import unittest
+
+from gameoflifeapi.app import render_game_state
+from gameoflifeapi.logic.data.field import Field
+from gameoflifeapi.logic.data.state import CellState
+
+
+class TestApp(unittest.TestCase):
+    """Tests related to the console rendering."""
+
+    def test_render_game_state(self) -> None:
+        """Test text view of the field."""
+        field: Field = Field(10, 11)
+        field.all_cells[(1, 2)].state = CellState.ALIVE
+
+        lines: list[str] = render_game_state(field).splitlines()
+
+        self.assertEqual(12, len(lines))
+        self.assertEqual(' | | | | | | | | | | |', lines[1])
+        self.assertEqual(' | |*| | | | | | | | |', lines[2])
+        self.assertEqual(lines[0], lines[-1])
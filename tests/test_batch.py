@@ -0,0 +1,122 @@
+"""Tests related to the batch runner functionality."""
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+from gameoflifeapi.api.pattern_persistance import GameRlePersistance
+from gameoflifeapi.api.persistance import GamePicklePersistance
+from gameoflifeapi.batch import create_random_field, main, persistance_for_file
+from gameoflifeapi.logic.topology import Topology
+
+
+class TestBatch(unittest.TestCase):
+    """Tests related to the batch runner functionality."""
+
+    def setUp(self) -> None:
+        """Prepare test case to the tests."""
+        self._load_name: str = f'{tempfile.gettempdir()}/test_batch_blinker.rle'
+        self._save_name: str = f'{tempfile.gettempdir()}/test_batch_result.rle'
+        with open(self._load_name, 'w', encoding='ascii') as file:
+            file.write('x = 12, y = 10\n$3o!\n')
+
+    def tearDown(self) -> None:
+        """Cleanup after tests."""
+        for file_name in (self._load_name, self._save_name):
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def _run(self, argv: list[str]) -> dict:
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            main(argv)
+        return json.loads(stdout.getvalue())
+
+    def test_persistance_for_file(self) -> None:
+        """Test selection of persistance by file extension."""
+        self.assertIsInstance(persistance_for_file('glider.RLE'), GameRlePersistance)
+        self.assertIsInstance(persistance_for_file('game.gsave'), GamePicklePersistance)
+
+    def test_create_random_field(self) -> None:
+        """Test random field is reproducible by seed."""
+        field = create_random_field(20, 30, seed=1)
+
+        self.assertEqual(20, field.rows)
+        self.assertEqual(30, field.columns)
+        self.assertEqual(field.live_cells, create_random_field(20, 30, seed=1).live_cells)
+        self.assertTrue(100 < len(field.live_cells) < 500)
+        self.assertTrue(len(create_random_field(20, 30, seed=1, density=0.1).live_cells) < 120)
+
+    def test_main_with_loaded_game(self) -> None:
+        """Test statistics of the loaded pattern run and saving the last generation."""
+        statistics: dict = self._run(['--load', self._load_name, '--generations', '3',
+                                      '--engine', 'sparse', '--save', self._save_name])
+
+        self.assertEqual('sparse', statistics['engine'])
+        self.assertEqual(10, statistics['rows'])
+        self.assertEqual(12, statistics['columns'])
+        self.assertEqual(3, statistics['final_generation'])
+        self.assertEqual(3, statistics['initial_population'])
+        self.assertEqual(3, statistics['final_population'])
+        self.assertIn('generations_per_second', statistics)
+        saved = GameRlePersistance().load_game(self._save_name)
+        self.assertEqual(3, saved.generation)
+        self.assertEqual({(0, 1), (1, 1), (2, 1)}, saved.game_field.live_cells)
+
+    def test_main_with_random_game(self) -> None:
+        """Test the same seed gives the same run on different engines."""
+        first: dict = self._run(['--rows', '30', '--seed', '7', '--generations', '5', '--engine', 'object'])
+        second: dict = self._run(['--rows', '30', '--seed', '7', '--generations', '5', '--engine', 'bitboard'])
+
+        self.assertEqual(30, first['columns'])
+        self.assertEqual(7, first['seed'])
+        self.assertEqual(0.5, first['density'])
+        self.assertEqual(first['initial_population'], second['initial_population'])
+        self.assertEqual(first['final_population'], second['final_population'])
+
+    def test_main_with_density(self) -> None:
+        """Test created seed is reported and reproduces the run, seed is saved with the last generation."""
+        first: dict = self._run(['--rows', '30', '--density', '0.2', '--generations', '2', '--save', self._save_name])
+        second: dict = self._run(['--rows', '30', '--density', '0.2', '--generations', '2',
+                                  '--seed', str(first['seed'])])
+
+        self.assertEqual(0.2, first['density'])
+        self.assertEqual(first['final_population'], second['final_population'])
+        saved = GameRlePersistance().load_game(self._save_name)
+        self.assertEqual(first['seed'], saved.seed)
+        self.assertEqual(0.2, saved.density)
+
+    def test_main_with_rule(self) -> None:
+        """Test rule passed by argument is used and saved with the last generation."""
+        statistics: dict = self._run(['--load', self._load_name, '--generations', '1', '--rule', 'B2/S',
+                                      '--save', self._save_name])
+
+        self.assertEqual('B2/S', statistics['rule'])
+        self.assertEqual(4, statistics['final_population'])
+        saved = GameRlePersistance().load_game(self._save_name)
+        self.assertEqual('B2/S', saved.rule)
+
+    def test_main_with_topology(self) -> None:
+        """Test topology passed by argument is used and saved with the last generation."""
+        statistics: dict = self._run(['--rows', '10', '--seed', '3', '--generations', '4', '--topology', 'klein',
+                                      '--save', self._save_name])
+
+        self.assertEqual('klein', statistics['topology'])
+        saved = GameRlePersistance().load_game(self._save_name)
+        self.assertEqual(Topology.KLEIN_BOTTLE, saved.topology)
+
+    def test_main_with_stop_on_cycle(self) -> None:
+        """Test run stops when the loaded blinker repeats."""
+        statistics: dict = self._run(['--load', self._load_name, '--generations', '100', '--stop-on-cycle'])
+
+        self.assertEqual(4, statistics['generations'])
+        self.assertEqual({'start': 0, 'period': 2}, statistics['cycle'])
+        self.assertIsNone(self._run(['--load', self._load_name, '--generations', '3'])['cycle'])
+
+    def test_main_default_engine(self) -> None:
+        """Test numpy engine is used by default only if numpy is installed."""
+        with mock.patch('gameoflifeapi.logic.engines.engine_factory.np', None):
+            statistics: dict = self._run(['--rows', '10', '--seed', '3', '--generations', '2'])
+
+        self.assertEqual('object', statistics['engine'])